@@ -0,0 +1,86 @@
+"""
+call site resolution for a failure 200 frames deep, previous implementation
+(walk every frame from `inspect.currentframe()`) vs. `show_line_no`
+
+    python -m benchmarks.bench_call_site
+"""
+import inspect
+import logging
+import os
+import timeit
+
+from simple_assertions import show_line_no
+
+DEPTH = 200
+NUMBER = 20000
+
+
+def show_line_no_before(msg, keywords=("check", "check_that")):
+    frame = inspect.currentframe()
+    err_frame = None
+
+    while frame:
+        names = frame.f_code.co_names
+        if any([k in names for k in keywords]):
+            err_frame = frame
+            break
+        frame = frame.f_back
+
+    if not err_frame:
+        err_frame = inspect.currentframe()
+
+    return "[{}:{}]: {}".format(
+        os.path.basename(err_frame.f_code.co_filename), err_frame.f_lineno, msg
+    )
+
+
+def raise_err(resolve, msg):
+    return resolve(msg)
+
+
+def is_equal_to(resolve, keywords):
+    # stands in for assertion method -> raise_err -> log_as_warning
+    return raise_err(lambda msg: resolve(msg, keywords), "err")
+
+
+def after(msg, keywords):
+    return str(show_line_no(msg, keywords, depth=3))
+
+
+check = is_equal_to
+
+
+def call_site(resolve, keywords):
+    return check(resolve, keywords)
+
+
+def deep(depth, func):
+    if depth:
+        return deep(depth - 1, func)
+    return func()
+
+
+def measure(resolve, keywords):
+    def run():
+        for _ in range(NUMBER):
+            call_site(resolve, keywords)
+
+    return deep(DEPTH, lambda: min(timeit.repeat(run, number=1, repeat=3)))
+
+
+def main():
+    # "failed to get line no." errors of the not found case
+    logging.getLogger("simple_assertions.helper").setLevel(logging.CRITICAL)
+    for label, keywords in (
+        ("call site near the top", ("check",)),
+        ("call site not found", ("no_such_name",)),
+    ):
+        before = measure(show_line_no_before, keywords) / NUMBER * 1e6
+        now = measure(after, keywords) / NUMBER * 1e6
+        print("{:<24} before: {:8.2f} us  after: {:8.2f} us".format(
+            label, before, now
+        ))
+
+
+if __name__ == "__main__":
+    main()
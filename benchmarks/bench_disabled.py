@@ -0,0 +1,31 @@
+"""
+overhead of `check(...)` when assertions are disabled vs. enabled
+
+    python -m benchmarks.bench_disabled
+"""
+import timeit
+
+from simple_assertions import check, assertion_mode
+
+NUMBER = 200000
+
+
+def run(stmt):
+    best = min(timeit.repeat(stmt, number=NUMBER, repeat=5, globals=globals()))
+    return best / NUMBER * 1e9
+
+
+def main():
+    stmt = "check(10, 'seq_num').is_instance_of(int).is_equal_to(10)"
+    enabled = run(stmt)
+    with assertion_mode(disabled=True):
+        disabled = run(stmt)
+    baseline = run("pass")
+
+    print("enabled : {:8.1f} ns/call".format(enabled))
+    print("disabled: {:8.1f} ns/call".format(disabled))
+    print("empty   : {:8.1f} ns/call".format(baseline))
+
+
+if __name__ == "__main__":
+    main()
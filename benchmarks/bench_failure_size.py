@@ -0,0 +1,60 @@
+"""
+cost of rendering a failure message vs. size of the operands, the time to
+render `is_in` failures should stay flat while `str(operand)` grows with the
+size. `is_equal_to` failures also locate the first difference (here the last
+item), which is a C speed slice compare of the same order as the `!=` itself.
+
+    python -m benchmarks.bench_failure_size
+"""
+import time
+
+from simple_assertions import check
+
+SIZES = (1000, 100000, 2000000)
+
+
+def failure_message(func):
+    try:
+        func()
+    except AssertionError as err:
+        return err
+    raise RuntimeError("expected a failure")
+
+
+def timed(func, number=5):
+    best = float("inf")
+    for _ in range(number):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def main():
+    print("{:>9} {:>18} {:>18} {:>12}".format(
+        "size", "render is_in (us)", "render equal (us)", "str(val) (us)"
+    ))
+    for size in SIZES:
+        ids = list(range(size))
+        other = list(ids)
+        other[-1] = -1
+
+        in_err = failure_message(lambda: check(-1).is_in(ids))
+        eq_err = failure_message(lambda: check(ids).is_equal_to(other))
+
+        # messages are lazy and cache the text, render a fresh one every time
+        render_in = timed(lambda: str(in_err.args[0].__class__(
+            in_err.args[0].fmt, *in_err.args[0].args
+        )))
+        render_eq = timed(lambda: str(eq_err.args[0].__class__(
+            eq_err.args[0].fmt, *eq_err.args[0].args
+        )))
+        eager = timed(lambda: str(ids))
+
+        print("{:>9} {:>18.1f} {:>18.1f} {:>12.1f}".format(
+            size, render_in, render_eq, eager
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+cost of assertion metrics: never enabled, enabled and enabled then disabled
+
+    python -m benchmarks.bench_metrics
+"""
+import timeit
+
+from simple_assertions import check, assertion_metrics
+
+NUMBER = 200000
+STMT = "check(10, 'seq_num').is_instance_of(int).is_equal_to(10)"
+
+
+def run():
+    best = min(timeit.repeat(STMT, number=NUMBER, repeat=5, globals=globals()))
+    return best / NUMBER * 1e9
+
+
+def main():
+    baseline = run()
+    assertion_metrics.enable()
+    enabled = run()
+    assertion_metrics.disable()
+    disabled = run()
+
+    print("never enabled: {:8.1f} ns/call".format(baseline))
+    print("enabled      : {:8.1f} ns/call".format(enabled))
+    print("disabled     : {:8.1f} ns/call".format(disabled))
+
+
+if __name__ == "__main__":
+    main()
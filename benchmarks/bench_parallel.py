@@ -0,0 +1,52 @@
+"""
+`validate_parallel` with 1, 2, 4... workers (up to no. of CPUs) on a CPU bound
+synthetic check, a user assertion hashing the payload of every record
+
+    python -m benchmarks.bench_parallel
+"""
+import hashlib
+import os
+import time
+
+from simple_assertions import SimpleAssertions, compile_check, validate_parallel
+
+COUNT = 20000
+ROUNDS = 200
+
+
+class DigestAssertions(SimpleAssertions):
+    def has_digest(self, digest):
+        payload = self.val_to_chk.val
+        for _ in range(ROUNDS):
+            payload = hashlib.sha256(payload).digest()
+        if payload != digest:
+            self.raise_err(self.compare_err_msg(digest, "to have digest"))
+        return self
+
+
+def digest(payload):
+    for _ in range(ROUNDS):
+        payload = hashlib.sha256(payload).digest()
+    return payload
+
+
+def main():
+    expected = digest(b"payload")
+    records = [{"payload": b"payload"}] * COUNT
+    rules = {"payload": compile_check(DigestAssertions).has_digest(expected)}
+
+    workers, baseline = 1, None
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        result = validate_parallel(records, rules, workers=workers, chunksize=500)
+        elapsed = time.perf_counter() - start
+        assert result.records == COUNT and not result.failures
+        baseline = baseline or elapsed
+        print("workers: {:3}  {:6.3f} s  speedup: {:4.1f}x".format(
+            workers, elapsed, baseline / elapsed
+        ))
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+compiled plan vs. fluent API, same chain as `tests/test_extend.py` over 1M
+values
+
+    python -m benchmarks.bench_plan
+"""
+import time
+
+from simple_assertions import check, compile_check
+
+COUNT = 1000000
+
+
+def fluent(values):
+    for val in values:
+        check(val, "msg_type").is_instance_of(str).is_in(("fix4.1", "fix4.2"))
+
+
+def planned(values):
+    plan = compile_check(desc="msg_type").is_instance_of(str).is_in(
+        ("fix4.1", "fix4.2")
+    )
+    for val in values:
+        plan(val)
+
+
+def timed(func, values):
+    start = time.perf_counter()
+    func(values)
+    return time.perf_counter() - start
+
+
+def main():
+    values = ["fix4.1", "fix4.2"] * (COUNT // 2)
+    fluent_time = timed(fluent, values)
+    plan_time = timed(planned, values)
+    print("fluent: {:6.3f} s  ({:5.0f} ns/value)".format(
+        fluent_time, fluent_time / COUNT * 1e9
+    ))
+    print("plan  : {:6.3f} s  ({:5.0f} ns/value)".format(
+        plan_time, plan_time / COUNT * 1e9
+    ))
+    print("speedup: {:.1f}x".format(fluent_time / plan_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+validating a nested payload with one `check(...)` per field vs. `matches_schema`
+
+    python -m benchmarks.bench_schema
+"""
+import timeit
+
+from simple_assertions import check, compile_check
+
+NUMBER = 20000
+
+ORDER = {
+    "id": 42,
+    "side": "buy",
+    "header": {"version": "FIX.4.4", "seq_num": 1001},
+    "legs": [{"symbol": "ABC", "qty": 100}, {"symbol": "XYZ", "qty": 50}],
+}
+
+SCHEMA = {
+    "id": int,
+    "side": compile_check().is_in(("buy", "sell")),
+    "header": {"version": str, "seq_num": int},
+    "legs": [{"symbol": str, "qty": compile_check().is_numeric()}],
+}
+
+
+def per_field(order):
+    check(order["id"], "id").is_instance_of(int)
+    check(order["side"], "side").is_in(("buy", "sell"))
+    header = order["header"]
+    check(header["version"], "header.version").is_instance_of(str)
+    check(header["seq_num"], "header.seq_num").is_instance_of(int)
+    for idx, leg in enumerate(order["legs"]):
+        check(leg["symbol"], "legs[{}].symbol".format(idx)).is_instance_of(str)
+        check(leg["qty"], "legs[{}].qty".format(idx)).is_numeric()
+
+
+def with_schema(order):
+    check(order, "order").matches_schema(SCHEMA)
+
+
+def run(func):
+    best = min(
+        timeit.repeat(lambda: func(ORDER), number=NUMBER, repeat=5)
+    )
+    return best / NUMBER * 1e6
+
+
+def main():
+    print("per field check: {:8.2f} us/payload".format(run(per_field)))
+    print("matches_schema : {:8.2f} us/payload".format(run(with_schema)))
+
+
+if __name__ == "__main__":
+    main()
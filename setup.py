@@ -37,13 +37,12 @@ setup(
         "Natural Language :: English",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
     ],
     long_description=open('README.md').read(),
     long_description_content_type='text/markdown',
-    python_requires='>=3.5',
+    python_requires='>=3.7',
+    extras_require={"numpy": ["numpy"]},
 )
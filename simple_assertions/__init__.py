@@ -1,52 +1,224 @@
-import logging
-import os
-from typing import Any, Union, Iterable, AnyStr
-import traceback
+import sys
+from collections.abc import Iterable
+
+from simple_assertions.helper import (
+    WarnVals,
+    show_line_no,
+    ErrorFormatter,
+    ValToChk,
+    NoOpAssertions,
+    NO_OP,
+    noop_for,
+    LazyMessage,
+    BoundedRepr,
+    BoundedValue,
+    bounded_repr,
+    set_repr_limits,
+    find_call_site,
+    format_call_site,
+    message_template,
+    CapturedStack,
+    capture_stack,
+    StackReference,
+    register_entry_point,
+    register_hook,
+    assertion_name,
+)
+from simple_assertions.config import (
+    PYASSERT_ERRORS_AS_WARNINGS,
+    PYASSERT_DISABLED,
+    PYASSERT_MEMBERSHIP_INDEX,
+    PYASSERT_SAMPLING,
+    PYASSERT_SAMPLING_SEED,
+    PYASSERT_SNAPSHOT_UPDATE,
+    AssertionMode,
+    RuntimeConfig,
+    runtime,
+    assertion_mode,
+    _scoped_mode,
+)
+from simple_assertions.collector import (
+    FailureCollector,
+    FailureGroup,
+    _active_collector,
+)
+from simple_assertions import arrays
+from simple_assertions.arrays import ArrayMismatch
+from simple_assertions import multiset
+from simple_assertions.multiset import ItemCounts, ItemSummary
+
+# optional features, their modules are imported on first access (PEP 562) so
+# importing the package stays cheap
+_LAZY = {
+    "MembershipIndex": "membership",
+    "membership_index": "membership",
+    "WarningThrottle": "throttle",
+    "AssertionMetrics": "metrics",
+    "Histogram": "metrics",
+    "assertion_metrics": "metrics",
+    "FailureSink": "sink",
+    "FailureRecord": "sink",
+    "JsonlQueueSink": "sink",
+    "CheckPlan": "plan",
+    "compile_check": "plan",
+    "EventualCheck": "eventually",
+    "check_eventually": "eventually",
+    "check_eventually_async": "eventually",
+    "TimingStats": "perf",
+    "AllocationStats": "perf",
+    "time_calls": "perf",
+    "trace_allocations": "perf",
+    "StreamCheck": "stream",
+    "CheckedRecord": "stream",
+    "FieldFailure": "stream",
+    "FieldStats": "stream",
+    "check_stream": "stream",
+    "field_getter": "stream",
+    "ValidationResult": "parallel",
+    "validate_parallel": "parallel",
+    "Sampler": "sampling",
+    "ProbabilitySampler": "sampling",
+    "EveryNthSampler": "sampling",
+    "AdaptiveSampler": "sampling",
+    "parse_sampler": "sampling",
+    "SchemaValidator": "schema",
+    "SchemaFailures": "schema",
+    "compile_schema": "schema",
+    "optional": "schema",
+    "FileAssertions": "files",
+    "LineFailures": "files",
+    "check_file": "files",
+    "SnapshotStore": "snapshot",
+    "SnapshotDiff": "snapshot",
+    "snapshot_store": "snapshot",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    from importlib import import_module
 
-from simple_assertions.helper import WarnVals, show_line_no, ErrorFormatter, ValToChk
+    value = getattr(import_module("simple_assertions." + module), name)
+    globals()[name] = value
+    return value
 
-logging.basicConfig(
-    format="%(asctime)s [%(levelname)s] - %(message)s", level=logging.INFO
-)
-_logger = logging.getLogger(__name__)
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-PYASSERT_ERRORS_AS_WARNINGS = "ASSERT_ERROR_AS_WARNING"
 
-__version__ = "0.3.1"
+def _compile_schema(schema, asserter):
+    """
+    `schema.compile_schema`, the module is imported by the first call which
+    then replaces this function, later calls don't pay for the import
+    """
+    global _compile_schema
+    from simple_assertions.schema import compile_schema
+
+    _compile_schema = compile_schema
+    return compile_schema(schema, asserter)
 
 
-def _read_err_to_warn_envvar() -> str:
-    return os.getenv(PYASSERT_ERRORS_AS_WARNINGS, "").lower()
+class _DefaultLogger:
+    """ "simple_assertions" logger, `logging` is imported on first use"""
 
+    __slots__ = ()
 
-def _is_warn_mode_set_using_envvar() -> bool:
+    def __getattr__(self, name):
+        import logging
+
+        return getattr(logging.getLogger(__name__), name)
+
+    def __repr__(self):
+        return "<default logger simple_assertions>"
+
+
+def configure_logging(
+    level="INFO", fmt="%(asctime)s [%(levelname)s] - %(message)s"
+):
     """
-    check if warn mode is set using env variable
-    :return: bool
+    opt-in `logging.basicConfig` with the format warnings used to be shown
+    with, importing the package does not configure logging
+    :param level: root logger level
+    :param fmt: log format
     """
-    return _read_err_to_warn_envvar() in WarnVals.__dict__.values()
+    import logging
+
+    logging.basicConfig(format=fmt, level=level)
+
+
+# logging.WARNING, without importing logging
+_WARNING = 30
+_logger = _DefaultLogger()
+# bound once, `check` is on the hot path and `runtime.mode` is a property
+_get_scoped_mode = _scoped_mode.get
+_new_asserter = object.__new__
+_get_active_collector = _active_collector.get
+
+__version__ = "0.3.1"
 
 
-def log_as_warning(msg):
-    if _read_err_to_warn_envvar() == WarnVals.TraceBack:
-        traceback.print_stack()
-        return msg
-    elif _read_err_to_warn_envvar() == WarnVals.OnlyLineNum:
-        return show_line_no(msg)
+def log_as_warning(msg, stack=None):
+    """
+    warning message for the failure, with call site or with the stack when
+    running with `WarnVals.TraceBack`
+    :param msg: failure message
+    :param stack: `CapturedStack` for TraceBack mode, captured if not given
+    """
+    # called from `raise_err`, which is called by the assertion method, so the
+    # call site is usually 3 frames above
+    level = runtime.mode.level
+    if level == WarnVals.TraceBack:
+        stack = stack or capture_stack(depth=1)
+        return LazyMessage("{}\n{}", msg, StackReference(stack))
+    elif level == WarnVals.OnlyLineNum:
+        return show_line_no(msg, depth=3)
     else:
-        return show_line_no(msg, keywords=("check",))
+        return show_line_no(msg, keywords=("check", "check_file"), depth=3)
+
+
+def _failure_site() -> str:
+    """ call site of the failing check, to be called only from `raise_err`"""
+    # _failure_site <- raise_err <- assertion method <- call site
+    frame = find_call_site(depth=3)
+    return format_call_site(frame) if frame else "[unknown]"
 
 
 class Base:
-    def __init__(self, as_warn: bool, logger=None):
+    # subclasses without `__slots__` still get a `__dict__` as usual
+    __slots__ = (
+        "logger",
+        "_as_warn_flag",
+        "is_warn_mode",
+        "val_to_chk",
+        "collector",
+    )
+
+    format_err_msg = ErrorFormatter()
+
+    def __init__(self, as_warn: bool, logger=None, collect=False):
         self.logger = logger or _logger
         self._as_warn_flag = as_warn
         self.is_warn_mode = False
         self.val_to_chk = None
-        self.format_err_msg = ErrorFormatter()
+        self.collector = (
+            FailureCollector(raise_on_exit=True) if collect else None
+        )
         self._is_running_in_warn_mode()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """ raise aggregated error for failures collected with `collect=True`"""
+        if exc_type is None and self.collector is not None:
+            self.collector.raise_if_failed()
+        return False
+
     def _is_running_in_warn_mode(self, override=False):
         """
         determine whether to run in fast fail (fail on first) or convert assertion
@@ -55,7 +227,7 @@ class Base:
         :return: bool
         """
         self.is_warn_mode = (
-            override or self._as_warn_flag or _is_warn_mode_set_using_envvar()
+            override or self._as_warn_flag or runtime.mode.warn
         )
 
     def set_fields(self, val, desc, as_warn=False):
@@ -69,33 +241,187 @@ class Base:
     def compare_err_msg(self, rhs, help_text):
         return self.format_err_msg.compare(self.val_to_chk, rhs, help_text)
 
+    def diff_err_msg(self, rhs, help_text):
+        return self.format_err_msg.difference(self.val_to_chk, rhs, help_text)
+
     def value_err_msg(self, help_text):
         return self.format_err_msg.value(self.val_to_chk, help_text)
 
+    def mismatch_err_msg(self, mask, help_text, values=None, offset=0):
+        """
+        message for failed array assertions
+        :param mask: bool array, True for mismatching elements, None if shapes
+            did not match
+        :param help_text: expectation, i.e. "to be equal to [...]"
+        :param values: reported values, default the checked array
+        :param offset: added to reported indices
+        """
+        val = self.val_to_chk.val
+        if mask is None:
+            detail = LazyMessage("shape {} does not match", arrays.shape(val))
+        else:
+            if values is None:
+                values = arrays.as_array(val)
+            detail = ArrayMismatch(mask, values, offset)
+        return self.format_err_msg.mismatch(self.val_to_chk, help_text, detail)
+
+    def summary_err_msg(self, help_text, rhs, summary):
+        """
+        message for failed collection assertions
+        :param help_text: expectation, i.e. "to contain all of"
+        :param rhs: collection compared with
+        :param summary: `ItemSummary` of offending elements
+        """
+        help_text = LazyMessage("{} [{}]", help_text, BoundedValue(rhs))
+        return self.format_err_msg.mismatch(self.val_to_chk, help_text, summary)
+
+    def contains_val(self, container) -> bool:
+        """
+        `val in container`, uses `membership_index` if enabled
+        :param container: collection to look for the val in
+        :return: bool
+        """
+        if (_get_scoped_mode() or runtime.default).index_membership:
+            from simple_assertions.membership import membership_index
+
+            return membership_index.contains(container, self.val_to_chk.val)
+        return self.val_to_chk.val in container
+
     def raise_err(self, msg):
         """Helper to raise an ``AssertionError`` with the given message."""
+        collector = self.collector
+        if collector is None:
+            collector = _get_active_collector()
+        if collector is not None:
+            collector.record(
+                _failure_site(), assertion_name(sys._getframe(1)), msg
+            )
+            return
+
         if self.is_warn_mode:
-            self.logger.warning(log_as_warning(msg))
+            mode = _get_scoped_mode() or runtime.default
+            sink = mode.sink
+            # skip resolving call site if the warning would be dropped anyway,
+            # custom loggers may only have `warning`
+            if sink is None:
+                is_enabled = getattr(self.logger, "isEnabledFor", None)
+                if is_enabled is not None and not is_enabled(_WARNING):
+                    return
+
+            site = None
+            throttle = mode.throttle
+            if throttle is not None:
+                site = _failure_site()
+                allowed = throttle.allow((site, message_template(msg)))
+                throttle.log_summaries()
+                if not allowed:
+                    return
+
+            stack = None
+            if mode.level == WarnVals.TraceBack:
+                # stack from the assertion method out
+                stack = capture_stack(depth=1)
+
+            if sink is not None:
+                from simple_assertions.sink import FailureRecord
+
+                sink.emit(
+                    FailureRecord(
+                        site or _failure_site(),
+                        assertion_name(sys._getframe(1)),
+                        self.val_to_chk,
+                        msg,
+                        stack,
+                    )
+                )
+            elif stack is not None:
+                self.logger.warning(
+                    log_as_warning(msg, stack), extra={"assert_stack": stack}
+                )
+            else:
+                self.logger.warning(log_as_warning(msg))
         else:
             raise AssertionError(msg)
 
 
+_CLASS_STATE = {}
+
+
+def _class_state(cls):
+    """
+    instance state of an asserter class which has to be carried over to the
+    asserters returned by `check`
+    :return: (has `__dict__`, names of slots added by subclasses)
+    """
+    extra_slots = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in Base.__slots__ or name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = "_{}{}".format(klass.__name__.lstrip("_"), name)
+            extra_slots.append(name)
+
+    state = _CLASS_STATE[cls] = (cls.__dictoffset__ != 0, tuple(extra_slots))
+    return state
+
+
 class SimpleAssertions(Base):
-    def __init__(self, as_warn=False, logger=None):
-        super().__init__(as_warn, logger)
+    __slots__ = ()
+
+    def __init__(self, as_warn=False, logger=None, collect=False):
+        """
+        :param as_warn: if set, convert assertion errors to warning messages
+        :param logger: logger for warnings
+        :param collect: if set, failures are collected in `self.collector`
+            and raised together when used as context manager
+        """
+        super().__init__(as_warn, logger, collect)
 
     def check(self, val, desc=None, as_warn=False):
-        self.clear_fields()
-        self.set_fields(val, desc, as_warn)
+        """
+        bind `val` to a new asserter of the same class, `self` is left untouched
+        so a single instance can be shared between threads and asyncio tasks
+        :param val: val to check
+        :param desc: optional, description of val
+        :param as_warn: if set, convert assertion error to warning message
+        :return: assertionClass
+        """
+        mode = _get_scoped_mode() or runtime.default
+        cls = type(self)
+        if mode.disabled or (
+            mode.sampler is not None and not mode.sampler.sample(sys._getframe(1))
+        ):
+            return noop_for(cls)
+
+        asserter = _new_asserter(cls)
+        asserter.logger = self.logger
+        asserter.collector = self.collector
+        asserter._as_warn_flag = self._as_warn_flag
+        asserter.is_warn_mode = as_warn or self._as_warn_flag or mode.warn
+        asserter.val_to_chk = ValToChk(val, desc)
+
+        has_dict, extra_slots = _CLASS_STATE.get(cls) or _class_state(cls)
+        if has_dict:
+            # shared, not copied, attributes set later are seen by both
+            asserter.__dict__ = self.__dict__
+        for name in extra_slots:
+            try:
+                setattr(asserter, name, getattr(self, name))
+            except AttributeError:
+                pass
 
-        return self
+        return asserter
 
-    def is_equal_to(self, other: Union[AnyStr, int, float]):
+    def is_equal_to(self, other):
         if self.val_to_chk.val != other:
-            self.raise_err(self.compare_err_msg(other, "to be equal to"))
+            self.raise_err(self.diff_err_msg(other, "to be equal to"))
         return self
 
-    def is_not_equal_to(self, other: Union[AnyStr, int, float]):
+    def is_not_equal_to(self, other):
         if self.val_to_chk.val == other:
             self.raise_err(self.compare_err_msg(other, "to be not equal to"))
         return self
@@ -111,20 +437,20 @@ class SimpleAssertions(Base):
         return self
 
     def is_in(self, other: Iterable):
-        if self.val_to_chk.val not in other:
+        if not self.contains_val(other):
             self.raise_err(self.compare_err_msg(other, "to be in"))
         return self
 
     def is_not_in(self, other: Iterable):
-        if self.val_to_chk.val in other:
+        if self.contains_val(other):
             self.raise_err(self.compare_err_msg(other, "to be not in"))
         return self
 
-    def is_equal_or_in_seq(self, other: Union[Any, Iterable]):
+    def is_equal_or_in_seq(self, other):
         if not isinstance(other, Iterable):
             other = (other,)
 
-        if self.val_to_chk.val not in other:
+        if not self.contains_val(other):
             self.raise_err(self.compare_err_msg(other, "be in"))
         return self
 
@@ -138,20 +464,24 @@ class SimpleAssertions(Base):
             self.raise_err(self.value_err_msg("to be false"))
         return self
 
-    def is_instance_of(self, other: Any):
+    def is_instance_of(self, other):
         if not isinstance(self.val_to_chk.val, other):
-            err = "Expected: [{}] to be of type [{}]".format(
-                type(self.val_to_chk.val).__name__, other
+            err = LazyMessage(
+                "Expected: [{}] to be of type [{}]",
+                type(self.val_to_chk.val).__name__,
+                other,
             )
             self.raise_err(
                 self.format_err_msg.add_desc(err, self.val_to_chk.desc)
             )
         return self
 
-    def is_not_instance_of(self, other: Any):
+    def is_not_instance_of(self, other):
         if isinstance(self.val_to_chk.val, other):
-            err = "Expected: [{}] not to be of type [{}]".format(
-                type(self.val_to_chk.val).__name__, other
+            err = LazyMessage(
+                "Expected: [{}] not to be of type [{}]",
+                type(self.val_to_chk.val).__name__,
+                other,
             )
             self.raise_err(
                 self.format_err_msg.add_desc(err, self.val_to_chk.desc)
@@ -167,6 +497,261 @@ class SimpleAssertions(Base):
 
         return self
 
+    # collection assertions, linear in the size of both collections
+
+    def contains_all(self, items: Iterable):
+        """ every element of `items` is in val (superset)"""
+        missing = ItemSummary(
+            "missing",
+            ItemCounts(items).excess_over(
+                ItemCounts(self.val_to_chk.val), ignore_counts=True
+            ),
+        )
+        if missing:
+            self.raise_err(
+                self.summary_err_msg("to contain all of", items, missing)
+            )
+        return self
+
+    def contains_only(self, items: Iterable):
+        """ every element of val is in `items` (subset)"""
+        extra = ItemSummary(
+            "unexpected",
+            ItemCounts(self.val_to_chk.val).excess_over(
+                ItemCounts(items), ignore_counts=True
+            ),
+        )
+        if extra:
+            self.raise_err(
+                self.summary_err_msg("to contain only", items, extra)
+            )
+        return self
+
+    def has_no_duplicates(self):
+        duplicates = ItemSummary(
+            "duplicated", ItemCounts(self.val_to_chk.val).duplicates()
+        )
+        if duplicates:
+            self.raise_err(
+                self.format_err_msg.mismatch(
+                    self.val_to_chk, "to have no duplicates", duplicates
+                )
+            )
+        return self
+
+    def has_same_elements_as(self, other: Iterable):
+        """ same elements, same no. of times, in any order (multiset equality)"""
+        val_counts = ItemCounts(self.val_to_chk.val)
+        other_counts = ItemCounts(other)
+        parts = [
+            summary
+            for summary in (
+                ItemSummary("missing", other_counts.excess_over(val_counts)),
+                ItemSummary("unexpected", val_counts.excess_over(other_counts)),
+            )
+            if summary
+        ]
+        if parts:
+            summary = LazyMessage(", ".join(["{}"] * len(parts)), *parts)
+            self.raise_err(
+                self.summary_err_msg("to have same elements as", other, summary)
+            )
+        return self
+
+    def is_disjoint_from(self, other: Iterable):
+        common = ItemSummary(
+            "common",
+            ItemCounts(self.val_to_chk.val).common(ItemCounts(other)),
+        )
+        if common:
+            self.raise_err(
+                self.summary_err_msg(
+                    "to have nothing in common with", other, common
+                )
+            )
+        return self
+
+    def matches_schema(self, schema):
+        """
+        nested mappings / lists match `schema`, all failing paths are
+        reported at once, see `SchemaValidator` for the schema format
+        :param schema: schema or `SchemaValidator`, compiled once per schema
+        """
+        failures = _compile_schema(schema, type(self)).validate(
+            self.val_to_chk.val
+        )
+        if failures is not None:
+            self.raise_err(
+                self.format_err_msg.mismatch(
+                    self.val_to_chk, "to match schema", failures
+                )
+            )
+        return self
+
+    def matches_snapshot(self, name, store=None):
+        """
+        val matches the stored snapshot `name`, compared by digest first;
+        rewrites the snapshot instead when running with `update_snapshots`
+        :param name: snapshot file name, relative to the store directory
+        :param store: `SnapshotStore` or directory, default see `snapshot_store`
+        """
+        from simple_assertions import snapshot
+
+        if not isinstance(store, snapshot.SnapshotStore):
+            store = snapshot.snapshot_store(store)
+        try:
+            data = snapshot.serialize(self.val_to_chk.val)
+        except TypeError as exc:
+            help_text = LazyMessage("to match snapshot [{}]", name)
+            self.raise_err(
+                self.format_err_msg.mismatch(self.val_to_chk, help_text, exc)
+            )
+            return self
+        if (_get_scoped_mode() or runtime.default).update_snapshots:
+            store.update(name, data)
+            return self
+
+        diff = store.compare(name, data)
+        if diff is False:
+            help_text = LazyMessage("to match snapshot [{}]", name)
+            detail = LazyMessage(
+                "no snapshot in [{}], run with {}=1 to create it",
+                store.directory,
+                PYASSERT_SNAPSHOT_UPDATE,
+            )
+            self.raise_err(
+                self.format_err_msg.mismatch(self.val_to_chk, help_text, detail)
+            )
+        elif diff is not None:
+            help_text = LazyMessage("to match snapshot [{}]", name)
+            self.raise_err(
+                self.format_err_msg.mismatch(self.val_to_chk, help_text, diff)
+            )
+        return self
+
+    # performance assertions, val is called without arguments
+
+    def completes_within(
+        self, ms: float, repeat=50, percentile=99, number=1, warmup=1
+    ):
+        """
+        `percentile` of per call times is at most `ms` milliseconds
+        :param ms: time limit in milliseconds
+        :param repeat: no. of timed samples
+        :param percentile: percentile (0 - 100) compared with the limit
+        :param number: no. of calls per sample, use > 1 for very fast calls
+        :param warmup: no. of calls before timing
+        """
+        func = self.val_to_chk.val
+        if not callable(func):
+            self.raise_err(self.value_err_msg("to be callable"))
+            return self
+
+        from simple_assertions.perf import time_calls
+
+        stats = time_calls(func, repeat, number, warmup, percentile)
+        if stats.at_percentile * 1000 > ms:
+            err = LazyMessage(
+                "Expected: [{}] to complete within {} ms at p{:g}, {}",
+                getattr(func, "__name__", "callable"),
+                ms,
+                percentile,
+                stats,
+            )
+            self.raise_err(
+                self.format_err_msg.add_desc(err, self.val_to_chk.desc)
+            )
+        return self
+
+    def allocates_at_most(self, bytes: int, warmup=1):
+        """
+        peak memory allocated during a call is at most `bytes`
+        :param bytes: limit in bytes
+        :param warmup: no. of calls before tracing
+        """
+        func = self.val_to_chk.val
+        if not callable(func):
+            self.raise_err(self.value_err_msg("to be callable"))
+            return self
+
+        from simple_assertions.perf import trace_allocations
+
+        stats = trace_allocations(func, warmup)
+        if stats.peak > bytes:
+            err = LazyMessage(
+                "Expected: [{}] to allocate at most {:,} bytes, {}",
+                getattr(func, "__name__", "callable"),
+                bytes,
+                stats,
+            )
+            self.raise_err(
+                self.format_err_msg.add_desc(err, self.val_to_chk.desc)
+            )
+        return self
+
+    # array assertions, numpy is imported on first use
+
+    def is_array_equal_to(self, other):
+        mask = arrays.not_equal(self.val_to_chk.val, other)
+        if mask is None or mask.any():
+            help_text = LazyMessage("to be equal to [{}]", BoundedValue(other))
+            self.raise_err(self.mismatch_err_msg(mask, help_text))
+        return self
+
+    def is_close_to(self, other, rtol=1e-05, atol=1e-08, equal_nan=False):
+        mask = arrays.not_close(
+            self.val_to_chk.val, other, rtol, atol, equal_nan
+        )
+        if mask is None or mask.any():
+            help_text = LazyMessage(
+                "to be close to [{}] (rtol={}, atol={})",
+                BoundedValue(other),
+                rtol,
+                atol,
+            )
+            self.raise_err(self.mismatch_err_msg(mask, help_text))
+        return self
+
+    def is_all_in(self, values):
+        mask = arrays.not_in(self.val_to_chk.val, values)
+        if mask.any():
+            help_text = LazyMessage("to be all in [{}]", BoundedValue(values))
+            self.raise_err(self.mismatch_err_msg(mask, help_text))
+        return self
+
+    def is_monotonic(self, increasing=True, strict=False):
+        """ elements of the (flattened) array are in order"""
+        val = arrays.as_array(self.val_to_chk.val).ravel()
+        mask = arrays.out_of_order(val, increasing, strict)
+        if mask.any():
+            help_text = "to be {}{}".format(
+                "strictly " if strict else "",
+                "increasing" if increasing else "decreasing",
+            )
+            self.raise_err(
+                self.mismatch_err_msg(mask, help_text, values=val[1:], offset=1)
+            )
+        return self
+
+    def has_no_nan(self):
+        mask = arrays.is_nan(arrays.as_array(self.val_to_chk.val))
+        if mask.any():
+            self.raise_err(self.mismatch_err_msg(mask, "to have no NaN"))
+        return self
+
+    def is_within_bounds(self, low=None, high=None):
+        """
+        low <= element <= high, for every element, None for no bound; NaN
+        elements are out of bounds
+        """
+        mask = arrays.out_of_bounds(
+            arrays.as_array(self.val_to_chk.val), low, high
+        )
+        if mask.any():
+            help_text = "to be within [{}, {}]".format(low, high)
+            self.raise_err(self.mismatch_err_msg(mask, help_text))
+        return self
+
 
 def check(val, desc=None, as_warn=False) -> SimpleAssertions:
     """
@@ -176,5 +761,21 @@ def check(val, desc=None, as_warn=False) -> SimpleAssertions:
     :param as_warn: if set, convert assertion error to warning message
     :return: assertionClass
     """
-
-    return SimpleAssertions(as_warn=as_warn).check(val, desc)
+    mode = _get_scoped_mode() or runtime.default
+    if mode.disabled or (
+        mode.sampler is not None and not mode.sampler.sample(sys._getframe(1))
+    ):
+        return NO_OP
+
+    # same state as `SimpleAssertions(as_warn).check(val, desc)` but without
+    # the chain of `__init__` / `clear_fields` / `set_fields` calls
+    asserter = _new_asserter(SimpleAssertions)
+    asserter.logger = _logger
+    asserter.collector = None
+    asserter._as_warn_flag = as_warn
+    asserter.is_warn_mode = as_warn or mode.warn
+    asserter.val_to_chk = ValToChk(val, desc)
+    return asserter
+
+
+NoOpAssertions.register(SimpleAssertions)
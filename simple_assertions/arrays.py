@@ -0,0 +1,156 @@
+"""
+helpers for array assertions, numpy is imported on first use so it stays an
+optional dependency
+"""
+_np = None
+
+# no. of mismatching elements shown in failure messages
+MAX_REPORTED = 5
+
+
+def numpy():
+    """
+    :return: numpy module
+    :raise ImportError: if numpy is not installed
+    """
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "numpy is required for array assertions, `pip install numpy`"
+            ) from None
+        _np = numpy
+    return _np
+
+
+class ArrayMismatch:
+    """
+    mismatching elements of an array, counted and located only when the
+    failure message is rendered
+    """
+
+    __slots__ = ("mask", "values", "offset", "limit")
+
+    def __init__(self, mask, values, offset=0, limit=None):
+        """
+        :param mask: bool array, True for mismatching elements
+        :param values: array of the same shape as `mask` with reported values
+        :param offset: added to reported (flat) indices
+        :param limit: no. of elements reported (default: `MAX_REPORTED`)
+        """
+        self.mask = mask
+        self.values = values
+        self.offset = offset
+        self.limit = MAX_REPORTED if limit is None else limit
+
+    @property
+    def count(self) -> int:
+        return int(numpy().count_nonzero(self.mask))
+
+    def first(self) -> list:
+        """
+        :return: [(index, value), ...] of the first `limit` mismatches
+        """
+        np = numpy()
+        flat = np.flatnonzero(self.mask)[: self.limit]
+        values = self.values.ravel()[flat].tolist()
+        if self.mask.ndim > 1:
+            indices = [
+                tuple(int(i) for i in idx)
+                for idx in zip(*np.unravel_index(flat, self.mask.shape))
+            ]
+        else:
+            indices = [int(i) + self.offset for i in flat]
+        return list(zip(indices, values))
+
+    def __str__(self):
+        count = self.count
+        first = ", ".join("[{}]={!r}".format(idx, val) for idx, val in self.first())
+        more = ", ..." if count > self.limit else ""
+        return "{} of {} element(s) mismatch: {}{}".format(
+            count, self.mask.size + self.offset, first, more
+        )
+
+
+def as_array(val):
+    return numpy().asarray(val)
+
+
+def shape(val) -> tuple:
+    return numpy().shape(val)
+
+
+def _comparable(val, other) -> bool:
+    """ `other` broadcasts to the shape of `val`"""
+    try:
+        return numpy().broadcast(val, other).shape == val.shape
+    except ValueError:
+        return False
+
+
+def not_equal(val, other):
+    """
+    :return: mismatch mask, None if shapes can not be compared
+    """
+    np = numpy()
+    val, other = np.asarray(val), np.asarray(other)
+    if not _comparable(val, other):
+        return None
+    return np.not_equal(val, other)
+
+
+def not_close(val, other, rtol, atol, equal_nan):
+    np = numpy()
+    val, other = np.asarray(val), np.asarray(other)
+    if not _comparable(val, other):
+        return None
+    return ~np.isclose(val, other, rtol=rtol, atol=atol, equal_nan=equal_nan)
+
+
+def not_in(val, values):
+    np = numpy()
+    if isinstance(values, (set, frozenset)):
+        values = list(values)
+    return ~np.isin(val, values)
+
+
+def out_of_order(val, increasing, strict):
+    """
+    :return: mask over `val[1:]`, True where an element breaks the order
+    """
+    np = numpy()
+    steps = np.diff(val)
+    if increasing:
+        mask = steps <= 0 if strict else steps < 0
+    else:
+        mask = steps >= 0 if strict else steps > 0
+    if np.issubdtype(steps.dtype, np.floating):
+        # comparisons with NaN are always False, a NaN step is not in order
+        mask |= np.isnan(steps)
+    return mask
+
+
+def is_nan(val):
+    np = numpy()
+    try:
+        return np.isnan(val)
+    except TypeError:
+        # object arrays, NaN is the only value not equal to itself
+        return val != val
+
+
+def out_of_bounds(val, low, high):
+    """ :return: mask, True outside of the bounds and for NaN elements"""
+    np = numpy()
+    if np.issubdtype(val.dtype, np.floating):
+        # comparisons with NaN are always False, NaN is not within any bounds
+        mask = np.isnan(val)
+    else:
+        mask = np.zeros(val.shape, dtype=bool)
+    if low is not None:
+        mask |= val < low
+    if high is not None:
+        mask |= val > high
+    return mask
@@ -0,0 +1,119 @@
+import threading
+from contextvars import ContextVar
+
+# collector of the current thread / task, set by `FailureCollector.__enter__`
+_active_collector = ContextVar("simple_assertions_collector", default=None)
+
+
+class FailureGroup:
+    """ failures of one assertion at one call site"""
+
+    __slots__ = ("site", "kind", "count", "examples")
+
+    def __init__(self, site, kind):
+        self.site = site
+        self.kind = kind
+        self.count = 0
+        # rendered messages of first failures
+        self.examples = []
+
+    def __repr__(self):
+        return "FailureGroup({} {}: {})".format(self.site, self.kind, self.count)
+
+
+class FailureCollector:
+    """
+    collects failures instead of raising them (soft assertions), failures are
+    grouped by call site and assertion, keeping only a count and the messages
+    of the first `examples` failures per group, so memory stays flat no matter
+    how many failures are recorded.
+
+        with FailureCollector() as failures:
+            for msg in feed:
+                check(msg.seq_num, "seq_num").is_instance_of(int)
+        # raises one AssertionError for all failures (if any)
+    """
+
+    def __init__(self, examples=3, max_groups=1000, raise_on_exit=True):
+        """
+        :param examples: no. of failure messages kept per group
+        :param max_groups: max no. of groups, extra groups are only counted
+        :param raise_on_exit: raise aggregated `AssertionError` at exit
+        """
+        self.examples = examples
+        self.max_groups = max_groups
+        self.raise_on_exit = raise_on_exit
+        self.total = 0
+        # failures which did not fit in `max_groups`
+        self.overflow = 0
+        self._groups = {}
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    def record(self, site, kind, msg):
+        """
+        :param site: call site, "[file.py:42]"
+        :param kind: assertion, i.e. "is_equal_to"
+        :param msg: failure message, rendered only if kept as example
+        """
+        key = (site, kind)
+        with self._lock:
+            self.total += 1
+            group = self._groups.get(key)
+            if group is None:
+                if len(self._groups) >= self.max_groups:
+                    self.overflow += 1
+                    return
+                group = self._groups[key] = FailureGroup(site, kind)
+            group.count += 1
+            if len(group.examples) < self.examples:
+                group.examples.append(str(msg))
+
+    @property
+    def groups(self) -> list:
+        with self._lock:
+            return list(self._groups.values())
+
+    def report(self) -> str:
+        lines = [
+            "{} assertion(s) failed in {} group(s)".format(
+                self.total, len(self._groups)
+            )
+        ]
+        for group in self.groups:
+            lines.append(
+                "{} {}: {} failure(s)".format(group.site, group.kind, group.count)
+            )
+            lines.extend("    {}".format(example) for example in group.examples)
+            if group.count > len(group.examples):
+                lines.append(
+                    "    ... {} more".format(group.count - len(group.examples))
+                )
+        if self.overflow:
+            lines.append(
+                "{} failure(s) not grouped, max_groups reached".format(
+                    self.overflow
+                )
+            )
+        return "\n".join(lines)
+
+    def raise_if_failed(self):
+        if self.total:
+            raise AssertionError(self.report())
+
+    def clear(self):
+        with self._lock:
+            self.total = 0
+            self.overflow = 0
+            self._groups.clear()
+
+    def __enter__(self):
+        self._tokens.append(_active_collector.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_collector.reset(self._tokens.pop())
+        if exc_type is None and self.raise_on_exit:
+            self.raise_if_failed()
+        return False
+
@@ -0,0 +1,268 @@
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from simple_assertions.helper import WarnVals
+
+PYASSERT_ERRORS_AS_WARNINGS = "ASSERT_ERROR_AS_WARNING"
+PYASSERT_DISABLED = "ASSERT_DISABLED"
+PYASSERT_MEMBERSHIP_INDEX = "ASSERT_MEMBERSHIP_INDEX"
+PYASSERT_SAMPLING = "ASSERT_SAMPLING"
+PYASSERT_SAMPLING_SEED = "ASSERT_SAMPLING_SEED"
+PYASSERT_SNAPSHOT_UPDATE = "ASSERT_SNAPSHOT_UPDATE"
+
+_WARN_LEVELS = frozenset((WarnVals.OnlyLineNum, WarnVals.TraceBack))
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
+# mode set by `assertion_mode` for current thread / task, None if not overridden
+_scoped_mode = ContextVar("simple_assertions_mode", default=None)
+
+
+def _is_set(envvar) -> bool:
+    return os.getenv(envvar, "").lower() in _TRUTHY
+
+
+def _as_sampler(sampler, seed=None):
+    """
+    :param sampler: `Sampler`, rate (0 - 1) or text form of `parse_sampler`,
+        False or "" for no sampling
+    """
+    if sampler is False or sampler == "":
+        return None
+    if isinstance(sampler, (str, int, float)):
+        # imported only when sampling is used
+        from simple_assertions.sampling import ProbabilitySampler, parse_sampler
+
+        if isinstance(sampler, str):
+            return parse_sampler(sampler, seed)
+        return ProbabilitySampler(sampler, seed)
+    return sampler
+
+
+def _checked_changes(changes) -> dict:
+    """
+    validate and normalise mode settings given to `configure` / `override`
+    :param changes: {setting: value}, only the settings to change
+    :return: {setting: value} for `AssertionMode.replace`
+    """
+    changes = dict(changes)
+    level = changes.get("level")
+    if level is not None:
+        level = str(level).lower()
+        if level not in _WARN_LEVELS:
+            raise ValueError(
+                "invalid level [{}], expected one of {}".format(
+                    level, sorted(_WARN_LEVELS)
+                )
+            )
+        changes["level"] = level
+        # a level implies warn, unless given
+        changes.setdefault("warn", True)
+    for name in ("warn", "disabled", "index_membership", "update_snapshots"):
+        if name in changes:
+            changes[name] = bool(changes[name])
+    # False turns off a throttle / sink, like None does for `configure`
+    for name in ("throttle", "sink"):
+        if changes.get(name) is False:
+            changes[name] = None
+    if "sampler" in changes:
+        changes["sampler"] = _as_sampler(changes["sampler"])
+    return changes
+
+
+class AssertionMode:
+    """ Immutable snapshot of the settings assertions are evaluated with"""
+
+    __slots__ = (
+        "warn",
+        "level",
+        "disabled",
+        "index_membership",
+        "throttle",
+        "sink",
+        "sampler",
+        "update_snapshots",
+    )
+
+    def __init__(
+        self,
+        warn=False,
+        level=None,
+        disabled=False,
+        index_membership=False,
+        throttle=None,
+        sink=None,
+        sampler=None,
+        update_snapshots=False,
+    ):
+        object.__setattr__(self, "warn", warn)
+        object.__setattr__(self, "level", level)
+        object.__setattr__(self, "disabled", disabled)
+        object.__setattr__(self, "index_membership", index_membership)
+        object.__setattr__(self, "throttle", throttle)
+        object.__setattr__(self, "sink", sink)
+        object.__setattr__(self, "sampler", sampler)
+        object.__setattr__(self, "update_snapshots", update_snapshots)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("AssertionMode is immutable, use `replace`")
+
+    def replace(self, **changes):
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return type(self)(**fields)
+
+    def __repr__(self):
+        return "AssertionMode({})".format(
+            ", ".join(
+                "{}={!r}".format(name, getattr(self, name))
+                for name in self.__slots__
+            )
+        )
+
+
+class RuntimeConfig:
+    """
+    process wide settings for assertions, environment variables are read only
+    once (at import) and cached, call `reload` after changing them.
+
+    Scoped overrides are stored in a context variable so they apply only to the
+    current thread / asyncio task.
+    """
+
+    def __init__(self):
+        self.default = AssertionMode()
+        self.reload()
+
+    def reload(self) -> AssertionMode:
+        """
+        re-read environment variables and reset the process wide default mode
+        :return: new default mode
+        """
+        level = os.getenv(PYASSERT_ERRORS_AS_WARNINGS, "").lower()
+        self.default = AssertionMode(
+            warn=level in _WARN_LEVELS,
+            level=level if level in _WARN_LEVELS else None,
+            disabled=_is_set(PYASSERT_DISABLED),
+            index_membership=_is_set(PYASSERT_MEMBERSHIP_INDEX),
+            sampler=self._env_sampler(),
+            update_snapshots=_is_set(PYASSERT_SNAPSHOT_UPDATE),
+        )
+        return self.default
+
+    @staticmethod
+    def _env_sampler():
+        # like other settings, invalid values are ignored, all checks run
+        try:
+            return _as_sampler(
+                os.getenv(PYASSERT_SAMPLING, ""),
+                os.getenv(PYASSERT_SAMPLING_SEED) or None,
+            )
+        except ValueError:
+            return None
+
+    def configure(self, **changes) -> AssertionMode:
+        """
+        change the process wide default mode, e.g. `configure(disabled=True)`,
+        settings are kept until next `configure` or `reload`. Takes the values
+        `override` does, None resets a setting to its default
+        :return: new default mode
+        """
+        self.default = self.default.replace(**_checked_changes(changes))
+        return self.default
+
+    @property
+    def mode(self) -> AssertionMode:
+        """ mode in effect for the current thread / task"""
+        return _scoped_mode.get() or self.default
+
+    @contextmanager
+    def override(
+        self,
+        warn=None,
+        level=None,
+        disabled=None,
+        index_membership=None,
+        throttle=None,
+        sink=None,
+        sampler=None,
+        update_snapshots=None,
+    ):
+        """
+        temporarily override the mode for the current thread / task
+        :param warn: convert assertion errors to warnings (or not)
+        :param level: one of `WarnVals`, implies `warn=True` unless given
+        :param disabled: skip evaluating assertions altogether
+        :param index_membership: use `membership_index` for `is_in` & co.
+        :param throttle: `WarningThrottle` limiting repeated warnings, False
+            for no throttle
+        :param sink: `FailureSink` receiving warnings instead of the logger,
+            False to log them
+        :param sampler: `Sampler`, rate or text form (see `parse_sampler`)
+            selecting the `check` calls evaluated, False to evaluate all
+        :param update_snapshots: `matches_snapshot` rewrites snapshots
+        """
+        # None means not given
+        changes = {
+            name: value
+            for name, value in (
+                ("warn", warn),
+                ("level", level),
+                ("disabled", disabled),
+                ("index_membership", index_membership),
+                ("throttle", throttle),
+                ("sink", sink),
+                ("sampler", sampler),
+                ("update_snapshots", update_snapshots),
+            )
+            if value is not None
+        }
+        mode = self.mode.replace(**_checked_changes(changes))
+        token = _scoped_mode.set(mode)
+        try:
+            yield mode
+        finally:
+            _scoped_mode.reset(token)
+
+
+runtime = RuntimeConfig()
+
+
+def assertion_mode(
+    warn=None,
+    level=None,
+    disabled=None,
+    index_membership=None,
+    throttle=None,
+    sink=None,
+    sampler=None,
+    update_snapshots=None,
+):
+    """
+    context manager to override assertion mode for the current thread / task
+
+        with assertion_mode(warn=True, level=WarnVals.OnlyLineNum):
+            check(1).is_equal_to(2)  # logged as warning
+
+    :param warn: convert assertion errors to warnings (or not)
+    :param level: one of `WarnVals`, implies `warn=True` unless given
+    :param disabled: skip evaluating assertions altogether
+    :param index_membership: use `membership_index` for `is_in` & co.
+    :param throttle: `WarningThrottle` limiting repeated warnings, False for
+        no throttle
+    :param sink: `FailureSink` receiving warnings instead of the logger, False
+        to log them
+    :param sampler: `Sampler`, rate or text form (see `parse_sampler`)
+        selecting the `check` calls evaluated, False to evaluate all
+    :param update_snapshots: `matches_snapshot` rewrites snapshots
+    """
+    return runtime.override(
+        warn=warn,
+        level=level,
+        disabled=disabled,
+        index_membership=index_membership,
+        throttle=throttle,
+        sink=sink,
+        sampler=sampler,
+        update_snapshots=update_snapshots,
+    )
@@ -0,0 +1,212 @@
+import asyncio
+import inspect
+import time
+
+from simple_assertions.helper import (
+    BoundedValue,
+    LazyMessage,
+    register_entry_point,
+)
+from simple_assertions.plan import CheckPlan
+
+
+class EventualCheck:
+    """
+    assertions on a value which converges over time, see `check_eventually`.
+    Assertions are recorded like `CheckPlan` steps; every new value is checked
+    against all of them, polling with exponential backoff until they pass or
+    `timeout` runs out (shared by all assertions of the chain).
+    """
+
+    def __init__(
+        self,
+        getter,
+        timeout,
+        interval,
+        backoff,
+        max_interval,
+        plan,
+        as_warn=False,
+        is_async=False,
+        clock=time.monotonic,
+    ):
+        self.getter = getter
+        self.timeout = timeout
+        self.interval = interval
+        self.backoff = backoff
+        self.max_interval = max_interval
+        self.plan = plan
+        self.as_warn = as_warn
+        self.is_async = is_async
+        self.clock = clock
+        # set when the first assertion starts polling
+        self._deadline = None
+
+    def __getattr__(self, name):
+        plan = self.__dict__.get("plan")
+        if name.startswith("_") or plan is None:
+            raise AttributeError(name)
+        add_step = getattr(plan, name)
+
+        @register_entry_point
+        def step(*args, **kwargs):
+            eventual = self._with_plan(add_step(*args, **kwargs))
+            if not self.is_async:
+                eventual._wait()
+            return eventual
+
+        return step
+
+    def _with_plan(self, plan):
+        eventual = EventualCheck.__new__(EventualCheck)
+        eventual.__dict__.update(self.__dict__)
+        eventual.plan = plan
+        return eventual
+
+    def _start(self):
+        if self._deadline is None:
+            self._deadline = self.clock() + self.timeout
+        return self._deadline
+
+    def _next_delay(self, delay):
+        return min(delay * self.backoff, self.max_interval)
+
+    def _wait(self):
+        deadline = self._start()
+        delay = self.interval
+        attempts = 0
+        while True:
+            val = self.getter()
+            attempts += 1
+            if not self.plan.failures(val):
+                return val
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = self._next_delay(delay)
+        self._fail(val, attempts)
+
+    @register_entry_point
+    async def _wait_async(self):
+        deadline = self._start()
+        delay = self.interval
+        attempts = 0
+        while True:
+            val = self.getter()
+            if inspect.isawaitable(val):
+                val = await val
+            attempts += 1
+            if not self.plan.failures(val):
+                return self
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = self._next_delay(delay)
+        self._fail(val, attempts)
+        return self
+
+    def __await__(self):
+        return self._wait_async().__await__()
+
+    def _fail(self, val, attempts):
+        plan = self.plan
+        failures = plan.failures(val)
+        err = LazyMessage(
+            "{} (still failing after {} attempt(s) in {:g}s, last value [{}])",
+            LazyMessage("; ".join(["{}"] * len(failures)), *failures),
+            attempts,
+            self.timeout,
+            BoundedValue(val),
+        )
+        asserter = plan.asserter
+        if isinstance(asserter, type):
+            asserter = asserter()
+        # messages of `failures` already have the description
+        asserter.check(val, None, self.as_warn).raise_err(err)
+
+    def __repr__(self):
+        return "EventualCheck({!r}, timeout={})".format(self.plan, self.timeout)
+
+
+def _eventual_check(getter, desc, asserter, backoff, **options):
+    if backoff < 1:
+        raise ValueError("backoff must be >= 1, got {}".format(backoff))
+    return EventualCheck(
+        getter, plan=CheckPlan(asserter, desc=desc), backoff=backoff, **options
+    )
+
+
+def check_eventually(
+    getter,
+    desc=None,
+    timeout=5.0,
+    interval=0.01,
+    backoff=2.0,
+    max_interval=1.0,
+    as_warn=False,
+    asserter=None,
+) -> EventualCheck:
+    """
+    assert on a value which is expected to converge, every assertion blocks
+    until the value returned by `getter` passes it (and all before it)
+
+        check_eventually(queue.qsize, "depth", timeout=2).is_equal_to(0)
+
+    :param getter: called without arguments to get the current value
+    :param desc: optional, description of val
+    :param timeout: seconds to wait for the chain to pass
+    :param interval: seconds before the first retry
+    :param backoff: interval is multiplied by this after every retry
+    :param max_interval: upper bound of the interval
+    :param as_warn: if set, convert final assertion error to warning message
+    :param asserter: `SimpleAssertions` (sub)class or instance
+    :return: EventualCheck
+    """
+    if inspect.iscoroutinefunction(getter):
+        raise TypeError(
+            "getter is a coroutine function, use `await check_eventually_async`"
+        )
+    return _eventual_check(
+        getter,
+        desc,
+        asserter,
+        backoff,
+        timeout=timeout,
+        interval=interval,
+        max_interval=max_interval,
+        as_warn=as_warn,
+    )
+
+
+def check_eventually_async(
+    getter,
+    desc=None,
+    timeout=5.0,
+    interval=0.01,
+    backoff=2.0,
+    max_interval=1.0,
+    as_warn=False,
+    asserter=None,
+) -> EventualCheck:
+    """
+    asyncio variant of `check_eventually`, the chain is awaited and polls with
+    `asyncio.sleep`, so any no. of pending checks share one event loop
+
+        await check_eventually_async(cache.size, "size").is_greater_than(0)
+
+    :param getter: function or coroutine function returning the current value
+    :return: EventualCheck, awaitable
+    """
+    return _eventual_check(
+        getter,
+        desc,
+        asserter,
+        backoff,
+        timeout=timeout,
+        interval=interval,
+        max_interval=max_interval,
+        as_warn=as_warn,
+        is_async=True,
+    )
@@ -0,0 +1,321 @@
+import hashlib
+import mmap
+import os
+import re
+import sys
+
+from simple_assertions import SimpleAssertions, runtime
+from simple_assertions.helper import BoundedValue, LazyMessage, noop_for
+
+# no. of failing lines listed in failure messages
+MAX_REPORTED = 10
+CHUNK_SIZE = 1 << 20
+
+
+class LineFailures:
+    """
+    failing lines of a file, only the first `limit` lines are kept, the rest
+    are counted
+    """
+
+    __slots__ = ("label", "limit", "encoding", "first", "count")
+
+    def __init__(self, label, encoding="utf-8", limit=None):
+        """
+        :param label: i.e. "not matching"
+        :param encoding: used to show the lines
+        :param limit: no. of lines listed (default: `MAX_REPORTED`)
+        """
+        self.label = label
+        self.limit = MAX_REPORTED if limit is None else limit
+        self.encoding = encoding
+        # [(line no., byte offset, line), ...]
+        self.first = []
+        self.count = 0
+
+    def add(self, lineno, offset, line):
+        self.count += 1
+        if len(self.first) < self.limit:
+            self.first.append((lineno, offset, line))
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __str__(self):
+        listed = ", ".join(
+            "line {} (byte {}) [{}]".format(
+                lineno,
+                offset,
+                BoundedValue(line.decode(self.encoding, "replace")),
+            )
+            for lineno, offset, line in self.first
+        )
+        more = self.count - len(self.first)
+        return "{} line(s) {}: {}{}".format(
+            self.count,
+            self.label,
+            listed,
+            ", ... {} more".format(more) if more else "",
+        )
+
+
+def _strip_eol(line):
+    if line.endswith(b"\n"):
+        line = line[:-2] if line.endswith(b"\r\n") else line[:-1]
+    return line
+
+
+def _lines(file):
+    """ (line no., byte offset, line without end of line) of a binary file"""
+    offset = 0
+    for lineno, line in enumerate(file, 1):
+        yield lineno, offset, _strip_eol(line)
+        offset += len(line)
+
+
+def _found(pattern, content) -> bool:
+    if isinstance(pattern, re.Pattern):
+        return pattern.search(content) is not None
+    return content.find(pattern) != -1
+
+
+class FileAssertions(SimpleAssertions):
+    """
+    assertions on the contents of a file, val is its path, see `check_file`.
+    Files are streamed in chunks or memory-mapped, so memory use does not
+    depend on the file size (except for single lines, which are read whole).
+    """
+
+    __slots__ = ("encoding", "chunk_size")
+
+    def __init__(
+        self,
+        as_warn=False,
+        logger=None,
+        collect=False,
+        encoding="utf-8",
+        chunk_size=CHUNK_SIZE,
+    ):
+        """
+        :param encoding: of str patterns / needles and of lines passed to
+            `is_sorted_by` keys
+        :param chunk_size: bytes read at once
+        """
+        super().__init__(as_warn, logger, collect)
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+
+    def _read(self, func):
+        """
+        call `func` with the file opened in binary mode
+        :return: result of `func` or the `OSError` raised opening / reading
+        """
+        try:
+            with open(os.fspath(self.val_to_chk.val), "rb") as file:
+                return func(file)
+        except OSError as exc:
+            return exc
+
+    def unreadable_err_msg(self, exc):
+        return self.format_err_msg.mismatch(
+            self.val_to_chk, "to be a readable file", exc
+        )
+
+    def _chunks(self, file):
+        read = file.read
+        chunk_size = self.chunk_size
+        chunk = read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = read(chunk_size)
+
+    def _as_bytes(self, pattern):
+        """ bytes pattern of a str, bytes or compiled pattern"""
+        if isinstance(pattern, re.Pattern):
+            if isinstance(pattern.pattern, bytes):
+                return pattern
+            return re.compile(
+                pattern.pattern.encode(self.encoding),
+                pattern.flags & ~re.UNICODE,
+            )
+        if isinstance(pattern, str):
+            return pattern.encode(self.encoding)
+        return pattern
+
+    def has_line_count(self, count: int):
+        """ file has `count` lines, a last line without end of line counts"""
+
+        def count_lines(file):
+            lines = 0
+            last = b"\n"
+            for chunk in self._chunks(file):
+                lines += chunk.count(b"\n")
+                last = chunk
+            return lines if last.endswith(b"\n") else lines + 1
+
+        lines = self._read(count_lines)
+        if isinstance(lines, OSError):
+            self.raise_err(self.unreadable_err_msg(lines))
+        elif lines != count:
+            self.raise_err(
+                self.format_err_msg.mismatch(
+                    self.val_to_chk,
+                    "to have {} line(s)".format(count),
+                    "has {}".format(lines),
+                )
+            )
+        return self
+
+    def contains(self, needle):
+        """
+        file contains `needle`, searched in a memory map of the file
+        :param needle: bytes / str or compiled regular expression
+        """
+        pattern = self._as_bytes(needle)
+
+        def search(file):
+            fileno = file.fileno()
+            if os.fstat(fileno).st_size == 0:
+                # empty files cannot be mapped
+                return _found(pattern, b"")
+            with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as content:
+                return _found(pattern, content)
+
+        found = self._read(search)
+        if isinstance(found, OSError):
+            self.raise_err(self.unreadable_err_msg(found))
+        elif not found:
+            self.raise_err(
+                self.format_err_msg.compare(
+                    self.val_to_chk, needle, "to contain"
+                )
+            )
+        return self
+
+    def every_line_matches(self, pattern):
+        """
+        every line (without end of line) matches `pattern` from its start,
+        like `re.match`; end the pattern with `$` to match whole lines
+        :param pattern: str, bytes or compiled regular expression
+        """
+        match = re.compile(self._as_bytes(pattern)).match
+        failures = LineFailures("not matching", self.encoding)
+
+        def match_lines(file):
+            for lineno, offset, line in _lines(file):
+                if match(line) is None:
+                    failures.add(lineno, offset, line)
+
+        error = self._read(match_lines)
+        if error is not None:
+            self.raise_err(self.unreadable_err_msg(error))
+        elif failures:
+            self.raise_err(
+                self.summary_err_msg("every line to match", pattern, failures)
+            )
+        return self
+
+    def is_sorted_by(self, key=None, reverse=False, strict=False):
+        """
+        lines are sorted, each line is compared only with the previous one
+        :param key: function(line) -> value compared, lines are decoded str,
+            lines which can't be decoded fail and aren't compared
+        :param reverse: descending order
+        :param strict: equal neighbours fail as well
+        """
+        failures = LineFailures("out of order", self.encoding)
+        encoding = self.encoding
+        undecodable = LineFailures("not decodable as {}".format(encoding))
+
+        def is_out_of_order(previous, current):
+            if reverse:
+                previous, current = current, previous
+            return previous >= current if strict else previous > current
+
+        def compare_lines(file):
+            previous, has_previous = None, False
+            for lineno, offset, line in _lines(file):
+                try:
+                    current = line.decode(encoding)
+                except UnicodeDecodeError:
+                    undecodable.add(lineno, offset, line)
+                    has_previous = False
+                    continue
+                if key is not None:
+                    current = key(current)
+                if has_previous and is_out_of_order(previous, current):
+                    failures.add(lineno, offset, line)
+                previous, has_previous = current, True
+
+        error = self._read(compare_lines)
+        if error is not None:
+            self.raise_err(self.unreadable_err_msg(error))
+        elif failures or undecodable:
+            order = "descending" if reverse else "ascending"
+            if failures and undecodable:
+                detail = LazyMessage("{}; {}", failures, undecodable)
+            else:
+                detail = failures or undecodable
+            self.raise_err(
+                self.format_err_msg.mismatch(
+                    self.val_to_chk,
+                    "to be sorted {}{}".format(
+                        "strictly " if strict else "", order
+                    ),
+                    detail,
+                )
+            )
+        return self
+
+    def has_checksum(self, digest: str, algorithm="sha256"):
+        """
+        :param digest: expected hex digest
+        :param algorithm: any `hashlib` algorithm
+        """
+
+        def hexdigest(file):
+            hasher = hashlib.new(algorithm)
+            for chunk in self._chunks(file):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+
+        actual = self._read(hexdigest)
+        if isinstance(actual, OSError):
+            self.raise_err(self.unreadable_err_msg(actual))
+        elif actual != digest.lower():
+            self.raise_err(
+                self.format_err_msg.mismatch(
+                    self.val_to_chk,
+                    LazyMessage("to have {} [{}]", algorithm, digest),
+                    LazyMessage("has [{}]", actual),
+                )
+            )
+        return self
+
+
+def check_file(
+    path, desc=None, as_warn=False, encoding="utf-8", chunk_size=CHUNK_SIZE
+) -> FileAssertions:
+    """
+    assertions on the contents of a (large) file
+
+        check_file("out/trades.csv").has_line_count(1000001).is_sorted_by(
+            key=lambda line: line.split(",")[0]
+        )
+
+    :param path: path of the file
+    :param desc: optional, description of the file
+    :param as_warn: if set, convert assertion error to warning message
+    :param encoding: of str patterns / needles and of lines passed to keys
+    :param chunk_size: bytes read at once
+    :return: FileAssertions
+    """
+    mode = runtime.mode
+    if mode.disabled or (
+        mode.sampler is not None and not mode.sampler.sample(sys._getframe(1))
+    ):
+        return noop_for(FileAssertions)
+
+    asserter = FileAssertions(as_warn, encoding=encoding, chunk_size=chunk_size)
+    asserter.set_fields(path, desc, as_warn)
+    return asserter
@@ -1,8 +1,9 @@
 import os
-import inspect
-import logging
-
-logger = logging.getLogger(__name__)
+import sys
+import reprlib
+from collections import deque
+from collections.abc import Mapping, Sequence
+from itertools import count, islice
 
 
 class WarnVals:
@@ -12,43 +13,630 @@ class WarnVals:
     Full = TraceBack = "2"
 
 
+class NoOpAssertions:
+    """
+    returned by `check` when assertions are disabled, every assertion method
+    (including the ones added by subclasses) does nothing and returns self.
+
+    methods are copied from asserter classes as they are first seen rather than
+    resolved with `__getattr__`, which would slow down every lookup
+    """
+
+    __slots__ = ()
+    registered = set()
+
+    def _noop(self, *args, **kwargs):
+        return self
+
+    @classmethod
+    def register(cls, asserter_cls):
+        for name in dir(asserter_cls):
+            if name.startswith("_") or name in cls.__dict__:
+                continue
+            if callable(getattr(asserter_cls, name, None)):
+                setattr(cls, name, cls._noop)
+        cls.registered.add(asserter_cls)
+
+    def __repr__(self):
+        return "NoOpAssertions()"
+
+
+NO_OP = NoOpAssertions()
+
+
+def noop_for(asserter_cls) -> NoOpAssertions:
+    """
+    shared no-op asserter, which also ignores methods of `asserter_cls`
+    :param asserter_cls: class whose methods are expected to be called
+    :return: NoOpAssertions
+    """
+    if asserter_cls not in NoOpAssertions.registered:
+        NoOpAssertions.register(asserter_cls)
+    return NO_OP
+
+
 class ValToChk:
+    __slots__ = ("val", "desc")
+
     def __init__(self, val, desc):
         self.val = val
         self.desc = desc
 
 
-def show_line_no(msg, keywords=("check", "check_that")):
-    frame = inspect.currentframe()
-    err_frame = None
+# (code object, keywords) -> does code call any of the keywords
+_CALLS_KEYWORD = {}
+# (file name, line no.) -> "[file.py:42]"
+_CALL_SITES = {}
+_MAX_CACHED = 4096
+# functions / methods binding a value to an asserter, the frame calling them is
+# the call site of a failure
+CHECK_FUNCTIONS = ("check", "check_that", "check_file")
+# code of functions running assertions on behalf of their caller
+_ENTRY_POINTS = set()
 
-    while frame:
-        names = frame.f_code.co_names
-        if any([k in names for k in keywords]):
-            err_frame = frame
-            break
+
+def register_entry_point(func):
+    """
+    mark `func` as running assertions for its caller (like `check` does), so
+    the caller of `func` is reported as call site of failures
+    :return: func, can be used as decorator
+    """
+    _ENTRY_POINTS.add(func.__code__)
+    return func
+
+
+# code of wrappers around assertion methods, see `register_hook`
+_HOOKS = set()
+
+
+def register_hook(func):
+    """
+    mark `func` as wrapper of assertion methods (i.e. instrumentation), its
+    frames are skipped when naming the failed assertion
+    :return: func, can be used as decorator
+    """
+    _HOOKS.add(func.__code__)
+    return func
+
+
+def assertion_name(frame) -> str:
+    """ name of the assertion running in `frame`, or in the one it wraps"""
+    while frame.f_code in _HOOKS:
         frame = frame.f_back
+    return frame.f_code.co_name
+
+
+def _calls_keyword(code, keywords) -> bool:
+    key = (code, keywords)
+    found = _CALLS_KEYWORD.get(key)
+    if found is None:
+        names = code.co_names
+        found = any(k in names for k in keywords)
+        if len(_CALLS_KEYWORD) >= _MAX_CACHED:
+            _CALLS_KEYWORD.clear()
+        _CALLS_KEYWORD[key] = found
+    return found
+
+
+def find_call_site(keywords=CHECK_FUNCTIONS, depth=0):
+    """
+    find the frame which called one of `keywords`, search starts `depth` frames
+    above the caller (where the call site usually is) and only if nothing is
+    found there, frames skipped by `depth` are searched
+    :param keywords: names of functions / methods to look for
+    :param depth: no. of frames to skip above the caller
+    :return: frame or None
+    """
+    try:
+        start = sys._getframe(depth + 1)
+    except ValueError:
+        start = None
+
+    frame = start
+    while frame is not None:
+        if frame.f_code in _ENTRY_POINTS:
+            return frame.f_back
+        if _calls_keyword(frame.f_code, keywords):
+            return frame
+        frame = frame.f_back
+
+    frame = sys._getframe(1)
+    while frame is not None and frame is not start:
+        if frame.f_code in _ENTRY_POINTS:
+            return frame.f_back
+        if _calls_keyword(frame.f_code, keywords):
+            return frame
+        frame = frame.f_back
+    return None
+
+
+def format_call_site(frame) -> str:
+    """ "[file.py:42]" for the frame, memoized per file & line"""
+    key = (frame.f_code.co_filename, frame.f_lineno)
+    text = _CALL_SITES.get(key)
+    if text is None:
+        text = "[{}:{}]".format(os.path.basename(key[0]), key[1])
+        if len(_CALL_SITES) >= _MAX_CACHED:
+            _CALL_SITES.clear()
+        _CALL_SITES[key] = text
+    return text
+
+
+def show_line_no(msg, keywords=CHECK_FUNCTIONS, depth=0):
+    """
+    prefix msg with "[file.py:line]" of the code which called `check`
+    :param msg: message
+    :param keywords: names of functions / methods to look for
+    :param depth: no. of frames to skip above the caller, when known
+    :return: message with call site
+    """
+    frame = find_call_site(keywords, depth + 1)
+
+    if frame is None:
+        import logging
+
+        logging.getLogger(__name__).error(
+            "failed to get line no. for error, please check!"
+        )
+        frame = sys._getframe(1)
+
+    return LazyMessage("{}: {}", format_call_site(frame), msg)
+
+
+# max frames kept by `capture_stack`
+STACK_LIMIT = 20
+# frames -> CapturedStack, so repeated failures share one (rendered) stack
+_STACKS = {}
+_STACK_IDS = count(1)
+
+
+class CapturedStack:
+    """
+    call stack as (file name, line no., function) tuples, outermost first.
+    Rendered (in `traceback` format) on first use and cached, identical stacks
+    are the same object, see `capture_stack`
+    """
+
+    __slots__ = ("frames", "stack_id", "_text", "rendered")
+
+    def __init__(self, frames: tuple, stack_id: int):
+        self.frames = frames
+        self.stack_id = stack_id
+        self._text = None
+        # set once the stack was included in a message
+        self.rendered = False
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            import linecache
+
+            lines = []
+            for filename, lineno, name in self.frames:
+                lines.append(
+                    '  File "{}", line {}, in {}\n'.format(filename, lineno, name)
+                )
+                line = linecache.getline(filename, lineno).strip()
+                if line:
+                    lines.append("    {}\n".format(line))
+            self._text = "".join(lines)
+        return self._text
+
+    def __str__(self):
+        return self.text
+
+    def __iter__(self):
+        return iter(self.frames)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __repr__(self):
+        return "CapturedStack(#{}, {} frames)".format(
+            self.stack_id, len(self.frames)
+        )
+
+
+def capture_stack(depth=0, limit=None) -> CapturedStack:
+    """
+    capture the call stack without formatting it
+    :param depth: no. of frames to skip above the caller
+    :param limit: max no. of frames (innermost are kept), default STACK_LIMIT
+    :return: CapturedStack, same object for identical stacks
+    """
+    limit = limit or STACK_LIMIT
+    frame = sys._getframe(depth + 1)
+    frames = []
+    while frame is not None and len(frames) < limit:
+        code = frame.f_code
+        frames.append((code.co_filename, frame.f_lineno, code.co_name))
+        frame = frame.f_back
+    frames.reverse()
+    frames = tuple(frames)
+
+    stack = _STACKS.get(frames)
+    if stack is None:
+        if len(_STACKS) >= _MAX_CACHED:
+            _STACKS.clear()
+        stack = _STACKS[frames] = CapturedStack(frames, next(_STACK_IDS))
+    return stack
+
+
+class StackReference:
+    """
+    stack as shown in a warning message, full trace the first time a stack is
+    shown and only a reference to it for repeated failures
+    """
+
+    __slots__ = ("stack",)
+
+    def __init__(self, stack: CapturedStack):
+        self.stack = stack
+
+    def __str__(self):
+        stack = self.stack
+        if stack.rendered:
+            return "Stack #{} (same as above)".format(stack.stack_id)
+        stack.rendered = True
+        return "Stack #{} (most recent call last):\n{}".format(
+            stack.stack_id, stack.text.rstrip("\n")
+        )
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+class LazyMessage:
+    """
+    error message which is formatted only when it is read, i.e. `str(exc)` or
+    a log handler emitting the record, rendered text is cached.
+
+    Behaves like the rendered str: str methods (`replace`, `startswith`...),
+    `%`, indexing and iteration work on the text and return str, but
+    `isinstance(msg, str)` is False.
 
-    if not err_frame:
-        logger.error("failed to get line no. for error, please check!")
-        logger.error("dumping src frame: {}".format(frame))
-        err_frame = frame
+    Note: values are kept as is, so if they are modified before the message is
+    read, the message shows the modified value.
+    """
 
-    return "[{}:{}]: {}".format(
-        os.path.basename(err_frame.f_code.co_filename), err_frame.f_lineno, msg
+    __slots__ = ("fmt", "args", "_text")
+
+    def __init__(self, fmt: str, *args):
+        self.fmt = fmt
+        self.args = args
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self.fmt.format(*self.args)
+        return self._text
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __eq__(self, other):
+        if isinstance(other, (str, LazyMessage)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __len__(self):
+        return len(str(self))
+
+    def __contains__(self, item):
+        return item in str(self)
+
+    def __add__(self, other):
+        return str(self) + other
+
+    def __radd__(self, other):
+        return other + str(self)
+
+    def __mul__(self, count):
+        return str(self) * count
+
+    __rmul__ = __mul__
+
+    def __mod__(self, values):
+        return str(self) % values
+
+    def __getitem__(self, index):
+        return str(self)[index]
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __getattr__(self, name):
+        # only called for attributes LazyMessage doesn't have, i.e. str methods
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(str(self), name)
+
+    def __reduce__(self):
+        # rendered text only, values might not be picklable
+        return str, (str(self),)
+
+
+_CONTAINERS = (list, tuple, set, frozenset, dict, deque)
+
+
+class BoundedRepr(reprlib.Repr):
+    """
+    `reprlib.Repr` used to render values in error messages, unlike `reprlib` it
+    never sorts sets / dicts, so the cost depends on the limits and not on the
+    size of the value.
+    """
+
+    def __init__(self, maxitems=20, maxstring=200, maxother=200, maxlevel=6):
+        super().__init__()
+        self.set_limits(maxitems, maxstring, maxother, maxlevel)
+
+    def set_limits(
+        self, maxitems=None, maxstring=None, maxother=None, maxlevel=None
+    ):
+        """
+        :param maxitems: max items shown for containers
+        :param maxstring: max chars shown for strings / bytes
+        :param maxother: max chars shown for any other value
+        :param maxlevel: max nesting level shown for containers
+        """
+        if maxitems is not None:
+            self.maxtuple = self.maxlist = self.maxarray = maxitems
+            self.maxset = self.maxfrozenset = self.maxdeque = maxitems
+            self.maxdict = maxitems
+        if maxstring is not None:
+            self.maxstring = maxstring
+        if maxother is not None:
+            self.maxother = self.maxlong = maxother
+        if maxlevel is not None:
+            self.maxlevel = maxlevel
+
+    def repr_set(self, x, level):
+        if not x:
+            return "set()"
+        return self._repr_iterable(x, level, "{", "}", self.maxset)
+
+    def repr_frozenset(self, x, level):
+        if not x:
+            return "frozenset()"
+        return self._repr_iterable(
+            x, level, "frozenset({", "})", self.maxfrozenset
+        )
+
+    def repr_dict(self, x, level):
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{...}"
+        items = [
+            "{}: {}".format(self.repr1(k, level - 1), self.repr1(v, level - 1))
+            for k, v in islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            items.append("...")
+        return "{" + ", ".join(items) + "}"
+
+    def is_truncated(self, value) -> bool:
+        """ would `render` show only part of the value?"""
+        if isinstance(value, (str, bytes)):
+            return len(value) > self.maxstring
+        if isinstance(value, _CONTAINERS):
+            return len(value) > self.maxlist
+        return False
+
+    def render(self, value) -> str:
+        """
+        str of `value` for error messages, small values are shown same as
+        `str(value)`, large ones are cut with their type and length
+        """
+        if isinstance(value, str):
+            if len(value) <= self.maxstring:
+                return value
+            return "{}...(str, len={})".format(
+                value[: self.maxstring], len(value)
+            )
+        if isinstance(value, _CONTAINERS):
+            text = self.repr(value)
+            if len(value) > self.maxlist:
+                text = "{}(len={}) {}".format(
+                    type(value).__name__, len(value), text
+                )
+            return text
+        if isinstance(value, bytes):
+            return self.repr(value)
+
+        text = str(value)
+        if len(text) > self.maxother:
+            text = "{}...({}, len={})".format(
+                text[: self.maxother], type(value).__name__, len(text)
+            )
+        return text
+
+
+bounded_repr = BoundedRepr()
+
+
+def set_repr_limits(maxitems=None, maxstring=None, maxother=None, maxlevel=None):
+    """ change how much of the values is shown in error messages"""
+    bounded_repr.set_limits(maxitems, maxstring, maxother, maxlevel)
+
+
+class BoundedValue:
+    """ value rendered with `bounded_repr` when the message is formatted"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return bounded_repr.render(self.value)
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+def _first_mismatch(lhs, rhs, chunk=4096) -> int:
+    """
+    index of first differing item of two sliceable sequences, compares slices
+    to stay at C speed for long equal prefixes
+    """
+    size = min(len(lhs), len(rhs))
+    start = 0
+    while start < size:
+        if lhs[start : start + chunk] != rhs[start : start + chunk]:
+            break
+        start += chunk
+    for idx in range(start, min(start + chunk, size)):
+        if lhs[idx] != rhs[idx]:
+            return idx
+    return size
+
+
+def first_difference(lhs, rhs):
+    """
+    describe the first difference of two str / bytes, sequences or mappings
+    :return: description or None if values are not comparable item by item
+    """
+    show = bounded_repr.repr
+
+    if isinstance(lhs, (str, bytes)) and type(lhs) is type(rhs):
+        idx = _first_mismatch(lhs, rhs)
+        return "first difference at index {}: {} != {} (len {} vs {})".format(
+            idx,
+            show(lhs[idx : idx + 20]),
+            show(rhs[idx : idx + 20]),
+            len(lhs),
+            len(rhs),
+        )
+
+    if isinstance(lhs, Mapping) and isinstance(rhs, Mapping):
+        for key, val in lhs.items():
+            if key not in rhs:
+                return "key {} missing on right".format(show(key))
+            if rhs[key] != val:
+                return "first difference at key {}: {} != {}".format(
+                    show(key), show(val), show(rhs[key])
+                )
+        for key in rhs:
+            if key not in lhs:
+                return "unexpected key {} on right".format(show(key))
+        return None
+
+    if (
+        isinstance(lhs, (Sequence, deque))
+        and isinstance(rhs, (Sequence, deque))
+        and not isinstance(lhs, (str, bytes))
+        and not isinstance(rhs, (str, bytes))
+    ):
+        if isinstance(lhs, (list, tuple)) and type(lhs) is type(rhs):
+            idx = _first_mismatch(lhs, rhs)
+        else:
+            idx = next(
+                (i for i, (a, b) in enumerate(zip(lhs, rhs)) if a != b),
+                min(len(lhs), len(rhs)),
+            )
+        if idx < min(len(lhs), len(rhs)):
+            return "first difference at index {}: {} != {}".format(
+                idx, show(lhs[idx]), show(rhs[idx])
+            )
+        if len(lhs) != len(rhs):
+            longer = lhs if len(lhs) > len(rhs) else rhs
+            idx = min(len(lhs), len(rhs))
+            return "len {} vs {}, first extra item at index {}: {}".format(
+                len(lhs), len(rhs), idx, show(longer[idx])
+            )
+    return None
+
+
+class Difference:
+    """
+    first difference of values, only shown if one of the values is too large
+    to be shown in full
+    """
+
+    __slots__ = ("lhs", "rhs")
+
+    def __init__(self, lhs, rhs):
+        self.lhs = lhs
+        self.rhs = rhs
+
+    def __str__(self):
+        if not (
+            bounded_repr.is_truncated(self.lhs)
+            or bounded_repr.is_truncated(self.rhs)
+        ):
+            return ""
+        diff = first_difference(self.lhs, self.rhs)
+        return "; {}".format(diff) if diff else ""
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+def message_template(msg) -> str:
+    """
+    message with values replaced by "{}", i.e. "[seq]: Expected:[{}] to be
+    equal to [{}]", used to group repeating failures
+    """
+    if not isinstance(msg, LazyMessage):
+        return str(msg)
+    return msg.fmt.format(
+        *(
+            message_template(arg)
+            if isinstance(arg, LazyMessage)
+            else arg
+            if isinstance(arg, str)
+            else ""
+            if isinstance(arg, Difference)
+            else "{}"
+            for arg in msg.args
+        )
     )
 
 
 class ErrorFormatter:
+    """ stateless, a single instance is shared by all asserters"""
+
     def add_desc(self, msg, desc):
         if desc and len(desc) > 0:
-            msg = "[{}]: {}".format(desc, msg)
+            msg = LazyMessage("[{}]: {}", desc, msg)
         return msg
 
     def compare(self, lhs: ValToChk, rhs, cmp_condition: str):
-        err_msg = "Expected:[{}] {} [{}]".format(lhs.val, cmp_condition, rhs)
+        err_msg = LazyMessage(
+            "Expected:[{}] {} [{}]",
+            BoundedValue(lhs.val),
+            cmp_condition,
+            BoundedValue(rhs),
+        )
+        return self.add_desc(err_msg, lhs.desc)
+
+    def difference(self, lhs: ValToChk, rhs, cmp_condition: str):
+        """ same as `compare` but also shows where large values differ"""
+        err_msg = LazyMessage(
+            "Expected:[{}] {} [{}]{}",
+            BoundedValue(lhs.val),
+            cmp_condition,
+            BoundedValue(rhs),
+            Difference(lhs.val, rhs),
+        )
+        return self.add_desc(err_msg, lhs.desc)
+
+    def mismatch(self, lhs: ValToChk, cmp_condition, detail):
+        """ elementwise comparison of arrays, `detail` lists the mismatches"""
+        err_msg = LazyMessage(
+            "Expected:[{}] {}, {}", BoundedValue(lhs.val), cmp_condition, detail
+        )
         return self.add_desc(err_msg, lhs.desc)
 
     def value(self, val_to_chk: ValToChk, cmp_condition: str):
-        err_msg = "Expected:<{}> {}".format(val_to_chk.val, cmp_condition)
+        err_msg = LazyMessage(
+            "Expected:<{}> {}", BoundedValue(val_to_chk.val), cmp_condition
+        )
         return self.add_desc(err_msg, val_to_chk.desc)
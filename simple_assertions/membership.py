@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict, deque
+
+# exact types only, subclasses may override `__contains__`; sets / dicts are
+# already hashed and `in` on str / bytes is a substring check
+_INDEXABLE = (list, tuple, deque)
+
+
+class _Entry:
+    __slots__ = ("container", "size", "first", "last", "index")
+
+    def __init__(self, container):
+        self.container = container  # keeps id(container) from being reused
+        self.size = len(container)
+        self.first = id(container[0])
+        self.last = id(container[-1])
+        try:
+            self.index = frozenset(container)
+        except TypeError:
+            # unhashable items, remembered so they are not retried every call
+            self.index = None
+
+    def is_stale(self, container) -> bool:
+        return (
+            self.size != len(container)
+            or self.first != id(container[0])
+            or self.last != id(container[-1])
+        )
+
+
+class MembershipIndex:
+    """
+    LRU cache of `frozenset` copies of large lists / tuples / deques used with
+    `is_in`, `is_not_in` and `is_equal_or_in_seq`, so repeated checks against
+    the same collection are O(1) instead of a linear scan.
+
+    Entries are keyed on identity of the collection and dropped when its length
+    or first / last items change, replacing items in the middle of a list
+    without changing its length is not detected, call `invalidate` for that.
+    """
+
+    def __init__(self, maxsize=32, min_size=64):
+        """
+        :param maxsize: max number of collections to keep indexed
+        :param min_size: smaller collections are always scanned
+        """
+        self.maxsize = maxsize
+        self.min_size = min_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def contains(self, container, val) -> bool:
+        """ same result as `val in container`"""
+        if (
+            type(container) not in _INDEXABLE
+            or not container
+            or len(container) < self.min_size
+        ):
+            return val in container
+        try:
+            hash(val)
+        except TypeError:
+            return val in container
+
+        index = self._index_of(container)
+        if index is None:
+            return val in container
+        return val in index
+
+    def _index_of(self, container):
+        key = id(container)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.is_stale(container):
+                self._entries.move_to_end(key)
+                return entry.index
+
+        entry = _Entry(container)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry.index
+
+    def invalidate(self, container):
+        with self._lock:
+            self._entries.pop(id(container), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+membership_index = MembershipIndex()
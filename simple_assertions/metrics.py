@@ -0,0 +1,259 @@
+import dis
+import functools
+import os
+import sys
+import threading
+import time
+
+from simple_assertions.helper import register_hook
+
+# helpers of `Base` which are not assertions
+_NOT_ASSERTIONS = frozenset(
+    (
+        "check",
+        "set_fields",
+        "clear_fields",
+        "compare_err_msg",
+        "diff_err_msg",
+        "value_err_msg",
+        "mismatch_err_msg",
+        "summary_err_msg",
+        "contains_val",
+        "raise_err",
+    )
+)
+
+
+class Histogram:
+    """
+    power of two buckets of nanoseconds, bucket n counts values in
+    [2 ** (n - 1), 2 ** n)
+    """
+
+    __slots__ = ("buckets", "count", "total")
+
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total = 0
+
+    def add(self, ns):
+        self.buckets[ns.bit_length()] += 1
+        self.count += 1
+        self.total += ns
+
+    def merge(self, other):
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, pct) -> int:
+        """ upper bound of the bucket holding the `pct` percentile, in ns"""
+        rank = pct / 100.0 * self.count
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return 2 ** bucket
+        return 0
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ns": self.total,
+            "mean_ns": self.total // self.count if self.count else 0,
+            "p50_ns": self.percentile(50),
+            "p99_ns": self.percentile(99),
+        }
+
+
+class _SiteStats:
+    __slots__ = ("passed", "failed", "evaluation", "emission")
+
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        # time in the assertion except `raise_err`
+        self.evaluation = Histogram()
+        # time in `raise_err`, formatting and logging / raising the failure
+        self.emission = Histogram()
+
+    def merge(self, other):
+        self.passed += other.passed
+        self.failed += other.failed
+        self.evaluation.merge(other.evaluation)
+        self.emission.merge(other.emission)
+
+
+class _ThreadState(threading.local):
+    # running totals of this thread, assertions compare them before and after
+    # the call, which also works for assertions calling other assertions
+    failures = 0
+    emission = 0
+    # {(assertion, code, instruction): _SiteStats}, merged by `stats`
+    stats = None
+
+
+def _line_of(code, lasti) -> int:
+    line = code.co_firstlineno
+    for offset, lineno in dis.findlinestarts(code):
+        if offset > lasti:
+            break
+        if lineno is not None:
+            line = lineno
+    return line
+
+
+def _call_site(code, lasti) -> str:
+    return "[{}:{}]".format(
+        os.path.basename(code.co_filename), _line_of(code, lasti)
+    )
+
+
+class AssertionMetrics:
+    """
+    opt-in counters and timings per assertion and call site. `enable` wraps
+    the assertion methods of the given classes, `disable` restores them, so
+    nothing is measured (or paid) while disabled.
+
+    Values passing a compiled plan (`compile_check`) never reach the
+    assertion methods and are not counted.
+    """
+
+    def __init__(self, clock=time.perf_counter_ns):
+        self.clock = clock
+        # stats of every thread, counters are updated without locking
+        self._thread_stats = []
+        self._lock = threading.Lock()
+        self._local = _ThreadState()
+        # class -> {name: original function}
+        self._patched = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._patched)
+
+    def enable(self, *classes):
+        """
+        :param classes: asserter classes to instrument, default
+            `SimpleAssertions`; subclasses are covered for inherited
+            assertions, pass them to instrument their own
+        """
+        from simple_assertions import Base, SimpleAssertions
+
+        self._patch(Base, "raise_err", self._wrap_raise_err)
+        for cls in classes or (SimpleAssertions,):
+            for name, func in list(vars(cls).items()):
+                if (
+                    name.startswith("_")
+                    or name in _NOT_ASSERTIONS
+                    or not callable(func)
+                    or isinstance(func, type)
+                ):
+                    continue
+                self._patch(cls, name, self._wrap_assertion)
+
+    def disable(self):
+        for cls, originals in self._patched.items():
+            for name, func in originals.items():
+                setattr(cls, name, func)
+        self._patched.clear()
+
+    def _patch(self, cls, name, wrap):
+        originals = self._patched.setdefault(cls, {})
+        if name not in originals:
+            originals[name] = vars(cls)[name]
+            setattr(cls, name, wrap(name, originals[name]))
+
+    def _wrap_assertion(self, name, func):
+        local = self._local
+        clock = self.clock
+
+        @register_hook
+        @functools.wraps(func)
+        def assertion(asserter, *args, **kwargs):
+            failures = local.failures
+            emission = local.emission
+            start = clock()
+            try:
+                return func(asserter, *args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                # call site is resolved to file & line only by `stats`
+                frame = sys._getframe(1)
+                key = (name, frame.f_code, frame.f_lasti)
+                thread_stats = local.stats
+                if thread_stats is None:
+                    thread_stats = self._new_thread_stats()
+                stats = thread_stats.get(key)
+                if stats is None:
+                    stats = self._new_site_stats(key)
+                emission = local.emission - emission
+                if local.failures != failures:
+                    stats.failed += 1
+                    stats.emission.add(emission)
+                else:
+                    stats.passed += 1
+                stats.evaluation.add(elapsed - emission)
+
+        return assertion
+
+    def _wrap_raise_err(self, name, func):
+        local = self._local
+        clock = self.clock
+
+        @register_hook
+        @functools.wraps(func)
+        def raise_err(asserter, msg):
+            local.failures += 1
+            start = clock()
+            try:
+                return func(asserter, msg)
+            finally:
+                local.emission += clock() - start
+
+        return raise_err
+
+    def _new_thread_stats(self) -> dict:
+        stats = self._local.stats = {}
+        with self._lock:
+            self._thread_stats.append(stats)
+        return stats
+
+    def _new_site_stats(self, key) -> _SiteStats:
+        stats = self._local.stats[key] = _SiteStats()
+        return stats
+
+    def stats(self) -> dict:
+        """
+        snapshot of the counters, merged over all threads
+        :return: {(assertion, call site): {"passed", "failed", "evaluation",
+            "emission"}}, timings as `Histogram.snapshot`
+        """
+        merged = {}
+        with self._lock:
+            thread_stats = list(self._thread_stats)
+        for stats in thread_stats:
+            for (name, code, lasti), site in list(stats.items()):
+                key = (name, _call_site(code, lasti))
+                total = merged.get(key)
+                if total is None:
+                    total = merged[key] = _SiteStats()
+                total.merge(site)
+        return {
+            key: {
+                "passed": stats.passed,
+                "failed": stats.failed,
+                "evaluation": stats.evaluation.snapshot(),
+                "emission": stats.emission.snapshot(),
+            }
+            for key, stats in merged.items()
+        }
+
+    def reset(self):
+        with self._lock:
+            for stats in self._thread_stats:
+                stats.clear()
+
+
+assertion_metrics = AssertionMetrics()
@@ -0,0 +1,127 @@
+from collections import Counter
+from collections.abc import Collection, Mapping
+
+from simple_assertions.helper import BoundedValue
+
+# no. of distinct elements listed in failure messages
+MAX_REPORTED = 10
+
+
+class ItemCounts:
+    """
+    occurrences of every element of a collection, counted in one pass with a
+    `Counter`; unhashable elements (lists, dicts...) are counted separately by
+    equality, which is quadratic in the no. of distinct unhashable elements only
+    """
+
+    __slots__ = ("hashed", "unhashed")
+
+    def __init__(self, items):
+        # a mapping is a collection of its keys, `Counter` would take it as
+        # counts
+        if isinstance(items, Mapping) or not isinstance(items, Collection):
+            items = tuple(items)
+        self.unhashed = []
+        try:
+            self.hashed = Counter(items)
+        except TypeError:
+            self.hashed = Counter()
+            self._count_mixed(items)
+
+    def _count_mixed(self, items):
+        hashed, unhashed = self.hashed, self.unhashed
+        for item in items:
+            try:
+                hashed[item] += 1
+            except TypeError:
+                for pair in unhashed:
+                    if pair[0] == item:
+                        pair[1] += 1
+                        break
+                else:
+                    unhashed.append([item, 1])
+
+    def count(self, item) -> int:
+        try:
+            return self.hashed.get(item, 0)
+        except TypeError:
+            for other, count in self.unhashed:
+                if other == item:
+                    return count
+            return 0
+
+    def items(self):
+        """ (element, count) in order of first occurrence, hashable first"""
+        yield from self.hashed.items()
+        for item, count in self.unhashed:
+            yield item, count
+
+    def excess_over(self, other, ignore_counts=False):
+        """
+        elements occurring more often than in `other`
+        :param other: ItemCounts
+        :param ignore_counts: only elements not in `other` at all
+        :return: iterator of (element, count in excess)
+        """
+        for item, count in self.items():
+            other_count = other.count(item)
+            if ignore_counts:
+                if not other_count:
+                    yield item, count
+            elif count > other_count:
+                yield item, count - other_count
+
+    def common(self, other):
+        """ elements also in `other`, with counts of `self`"""
+        for item, count in self.items():
+            if other.count(item):
+                yield item, count
+
+    def duplicates(self):
+        for item, count in self.items():
+            if count > 1:
+                yield item, count
+
+
+class ItemSummary:
+    """
+    bounded summary of (element, count) pairs, only the first `limit` pairs
+    are kept, the rest are counted
+    """
+
+    __slots__ = ("label", "first", "distinct", "total")
+
+    def __init__(self, label, pairs, limit=None):
+        """
+        :param label: i.e. "missing"
+        :param pairs: iterable of (element, count)
+        :param limit: no. of elements listed (default: `MAX_REPORTED`)
+        """
+        limit = MAX_REPORTED if limit is None else limit
+        self.label = label
+        self.first = []
+        self.distinct = 0
+        self.total = 0
+        for item, count in pairs:
+            self.distinct += 1
+            self.total += count
+            if len(self.first) < limit:
+                self.first.append((item, count))
+
+    def __bool__(self):
+        return self.distinct > 0
+
+    def __str__(self):
+        listed = ", ".join(
+            "{} (x{})".format(BoundedValue(item), count)
+            if count > 1
+            else str(BoundedValue(item))
+            for item, count in self.first
+        )
+        more = self.distinct - len(self.first)
+        return "{} {} element(s): [{}{}]".format(
+            self.total,
+            self.label,
+            listed,
+            ", ... {} more".format(more) if more else "",
+        )
@@ -0,0 +1,115 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from simple_assertions.stream import StreamCheck, _Counters
+
+
+class ValidationResult(_Counters):
+    """
+    merged outcome of `validate_parallel`, counters like `StreamCheck` and
+    `failed`, the failed records in input order
+    """
+
+    def __init__(self, fields):
+        super().__init__(fields)
+        # [CheckedRecord, ...]
+        self.failed = []
+
+    def merge(self, chunk):
+        """
+        add counters and failures of one chunk, chunks must be merged in
+        input order
+        :param chunk: `StreamCheck` of the chunk, already consumed
+        """
+        self.records += chunk.records
+        self.failed_records += chunk.failed_records
+        self.failures += chunk.failures
+        for name, stats in chunk.fields.items():
+            merged = self.fields[name]
+            merged.checked += stats.checked
+            merged.failed += stats.failed
+            merged.missing += stats.missing
+
+    def raise_if_failed(self):
+        if self.failures:
+            raise AssertionError(self.summary())
+
+
+def _check_chunk(offset, records, rules):
+    """
+    worker, checks one chunk of records
+    :return: (consumed StreamCheck, failed records)
+    """
+    stream = StreamCheck(records, rules)
+    failed = list(stream)
+    for record in failed:
+        record.index += offset
+    # getters may be closures, only the counters go back to the parent
+    stream._rules = stream._records = None
+    return stream, failed
+
+
+def _chunks(records, chunksize):
+    records = iter(records)
+    offset = 0
+    while True:
+        chunk = list(islice(records, chunksize))
+        if not chunk:
+            return
+        yield offset, chunk
+        offset += len(chunk)
+
+
+def validate_parallel(records, rules, workers=None, chunksize=1000):
+    """
+    check fields of every record like `check_stream`, with chunks of records
+    checked in a pool of processes
+
+        rules = {
+            "msg_type": compile_check(FixAssertions).is_valid_msg_type(),
+            "header.seq_num": compile_check().is_instance_of(int),
+        }
+        result = validate_parallel(batch, rules, workers=8)
+        result.raise_if_failed()
+
+    Records, rules (plans, field paths or module level getters) and the
+    asserters of the plans must be picklable. Workers read assertion mode from
+    the environment, scoped `assertion_mode` overrides are not passed on.
+    Only `workers * 2` chunks are in flight, so `records` may be a generator.
+
+    :param records: any iterable
+    :param rules: {field path or getter: CheckPlan}
+    :param workers: no. of processes (default: no. of CPUs), 1 checks in the
+        current process
+    :param chunksize: no. of records sent to a worker at once
+    :return: ValidationResult, failures in input order
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1, got {}".format(chunksize))
+    # validate rules before starting any process
+    fields = StreamCheck((), rules).fields
+    result = ValidationResult(fields)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for offset, chunk in _chunks(records, chunksize):
+            _merge(result, _check_chunk(offset, chunk, rules))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for offset, chunk in _chunks(records, chunksize):
+            pending.append(pool.submit(_check_chunk, offset, chunk, rules))
+            if len(pending) >= workers * 2:
+                _merge(result, pending.popleft().result())
+        while pending:
+            _merge(result, pending.popleft().result())
+    return result
+
+
+def _merge(result, outcome):
+    stream, failed = outcome
+    result.merge(stream)
+    result.failed.extend(failed)
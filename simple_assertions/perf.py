@@ -0,0 +1,123 @@
+import gc
+import math
+import time
+import tracemalloc
+
+
+def percentile(samples, pct):
+    """
+    nearest rank percentile
+    :param samples: sorted samples
+    :param pct: 0 - 100
+    """
+    rank = max(int(math.ceil(pct / 100.0 * len(samples))), 1)
+    return samples[min(rank, len(samples)) - 1]
+
+
+def _format_ms(seconds) -> str:
+    return "{:.3f} ms".format(seconds * 1000)
+
+
+class TimingStats:
+    """ distribution of per call times, in seconds"""
+
+    __slots__ = ("samples", "pct")
+
+    def __init__(self, samples, pct=99):
+        self.samples = sorted(samples)
+        self.pct = pct
+
+    @property
+    def min(self):
+        return self.samples[0]
+
+    @property
+    def median(self):
+        return percentile(self.samples, 50)
+
+    @property
+    def at_percentile(self):
+        return percentile(self.samples, self.pct)
+
+    def __str__(self):
+        return "min {}, median {}, p{:g} {}, max {} over {} run(s)".format(
+            _format_ms(self.min),
+            _format_ms(self.median),
+            self.pct,
+            _format_ms(self.at_percentile),
+            _format_ms(self.samples[-1]),
+            len(self.samples),
+        )
+
+
+def time_calls(func, repeat=50, number=1, warmup=1, pct=99) -> TimingStats:
+    """
+    time `func()` like `timeit`: garbage collection is disabled while timing
+    and every sample is the mean of `number` back to back calls
+    :param func: called without arguments
+    :param repeat: no. of samples
+    :param number: no. of calls per sample
+    :param warmup: no. of calls before timing
+    :param pct: percentile reported next to min / median
+    :return: TimingStats
+    """
+    for _ in range(warmup):
+        func()
+
+    loops = range(number)
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in loops:
+                func()
+            samples.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return TimingStats(samples, pct)
+
+
+class AllocationStats:
+    """ memory allocated by a call, in bytes"""
+
+    __slots__ = ("peak", "retained")
+
+    def __init__(self, peak, retained):
+        # max. allocated at any time during the call
+        self.peak = peak
+        # still allocated after the call returned
+        self.retained = retained
+
+    def __str__(self):
+        return "peak {:,} bytes, retained {:,} bytes".format(
+            self.peak, self.retained
+        )
+
+
+def trace_allocations(func, warmup=1) -> AllocationStats:
+    """
+    memory allocated by `func()`, traced with `tracemalloc` (started and
+    stopped here unless already tracing; before python 3.9 the peak of an
+    ongoing trace can not be reset and may include earlier allocations)
+    :param func: called without arguments
+    :param warmup: no. of calls before tracing, to fill caches
+    """
+    for _ in range(warmup):
+        func()
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return AllocationStats(max(peak - before, 0), max(after - before, 0))
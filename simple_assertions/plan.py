@@ -0,0 +1,236 @@
+from collections import deque
+from collections.abc import Iterable
+
+from simple_assertions.helper import register_entry_point, NoOpAssertions
+
+# items of `in` checks converted to frozenset, others keep their own `in`
+_SET_CONVERTIBLE = (list, tuple, set, frozenset, deque)
+
+
+def _membership_const(other):
+    if type(other) in _SET_CONVERTIBLE:
+        try:
+            return frozenset(other)
+        except TypeError:
+            pass
+    return other
+
+
+def _is_equal_or_in_seq_const(other):
+    if not isinstance(other, Iterable):
+        other = (other,)
+    return _membership_const(other)
+
+
+# assertion -> (expression passing only if the assertion passes, constant);
+# `{v}` is the value and `{c}` the precomputed constant. Expressions may be
+# more strict than the assertion (`is_numeric`), the assertion decides then
+_BUILTIN_STEPS = {
+    "is_equal_to": ("not ({v} != {c})", lambda other: other),
+    "is_not_equal_to": ("not ({v} == {c})", lambda other: other),
+    "is_populated": ("{v} not in {c}", lambda: (None, "")),
+    "is_not_populated": ("{v} in {c}", lambda: (None, "")),
+    "is_in": ("{v} in {c}", _membership_const),
+    "is_not_in": ("{v} not in {c}", _membership_const),
+    "is_equal_or_in_seq": ("{v} in {c}", _is_equal_or_in_seq_const),
+    "is_true": ("not not {v}", lambda: None),
+    "is_false": ("not {v}", lambda: None),
+    "is_instance_of": ("isinstance({v}, {c})", lambda other: other),
+    "is_not_instance_of": ("not isinstance({v}, {c})", lambda other: other),
+    "is_numeric": ("isinstance({v}, {c})", lambda: (float, int)),
+}
+
+
+class CheckPlan:
+    """
+    chain of assertions recorded once and run against many values
+
+        plan = compile_check().is_instance_of(str).is_in(("fix4.1", "fix4.2"))
+        for msg in feed:
+            plan(msg.msg_type, "msg_type")
+
+    Built-in assertions are compiled into a single expression (membership
+    collections become frozensets), which is all that runs for passing values.
+    Only when it fails, or for assertions added by subclasses, the assertion
+    methods run on a bound asserter, so messages, warn mode, collectors etc.
+    behave exactly like the fluent API.
+
+    Plans are immutable, every assertion returns a new plan, and picklable.
+    """
+
+    def __init__(self, asserter=None, steps=(), desc=None):
+        """
+        :param asserter: `SimpleAssertions` (sub)class or instance
+        :param steps: ((assertion name, args, kwargs), ...)
+        :param desc: default description of checked values
+        """
+        if asserter is None:
+            from simple_assertions import SimpleAssertions
+
+            asserter = SimpleAssertions
+        self.asserter = asserter
+        self.steps = tuple(steps)
+        self.desc = desc
+        self._fast = None
+        self._bind = None
+
+    def __getattr__(self, name):
+        asserter = self.__dict__.get("asserter")
+        if name.startswith("_") or asserter is None:
+            raise AttributeError(name)
+        if not callable(getattr(asserter, name, None)):
+            raise AttributeError(
+                "{} has no assertion [{}]".format(
+                    self._asserter_cls.__name__, name
+                )
+            )
+
+        def add_step(*args, **kwargs):
+            return CheckPlan(
+                asserter, self.steps + ((name, args, kwargs),), self.desc
+            )
+
+        return add_step
+
+    @property
+    def _asserter_cls(self):
+        if isinstance(self.asserter, type):
+            return self.asserter
+        return type(self.asserter)
+
+    def _compile(self):
+        """
+        build the function evaluating all steps at once
+        :return: function(val) -> bool, True only if all steps pass
+        """
+        asserter = self.asserter
+        if isinstance(asserter, type):
+            asserter = asserter()
+        self._bind = asserter.check
+
+        namespace = {}
+        expression = self._expression(namespace)
+        if expression is None:
+            self._fast = _never
+        elif not self.steps:
+            self._fast = _always
+        else:
+            source = (
+                "def fast(v):\n"
+                "    try:\n"
+                "        return {}\n"
+                "    except TypeError:\n"
+                "        return False\n"
+            ).format(expression)
+            exec(source, namespace)
+            self._fast = namespace["fast"]
+        return self._fast
+
+    def _expression(self, namespace, var="v"):
+        """
+        python expression passing only if all steps pass, may raise TypeError
+        :param namespace: globals of the compiled code, constants are added
+        :param var: name of the checked value in the expression
+        :return: str, None if a step has to run its assertion for every value
+        """
+        from simple_assertions import SimpleAssertions
+
+        cls = self._asserter_cls
+        expressions = []
+        for name, args, kwargs in self.steps:
+            builtin = _BUILTIN_STEPS.get(name)
+            overridden = getattr(cls, name) is not getattr(
+                SimpleAssertions, name, None
+            )
+            if builtin is None or overridden or kwargs:
+                # user assertion, has to run for every value
+                return None
+            expression, make_const = builtin
+            const = "c{}".format(len(namespace))
+            namespace[const] = make_const(*args)
+            expression = expression.format(v=var, c=const)
+            expressions.append("({})".format(expression))
+        return " and ".join(expressions) or "True"
+
+    @register_entry_point
+    def __call__(self, val, desc=None, as_warn=False):
+        """
+        run the plan against `val`
+        :param val: val to check
+        :param desc: optional, description of val (default: plan's desc)
+        :param as_warn: if set, convert assertion error to warning message
+        """
+        fast = self._fast or self._compile()
+        if fast(val):
+            return
+
+        asserter = self._bind(val, desc or self.desc, as_warn)
+        for name, args, kwargs in self.steps:
+            getattr(asserter, name)(*args, **kwargs)
+
+    @register_entry_point
+    def failures(self, val, desc=None) -> list:
+        """
+        run the plan against `val` without raising or logging failures
+        :param val: val to check
+        :param desc: optional, description of val (default: plan's desc)
+        :return: failure messages, empty if all assertions passed
+        """
+        fast = self._fast or self._compile()
+        if fast(val):
+            return []
+
+        asserter = self._bind(val, desc or self.desc)
+        if isinstance(asserter, NoOpAssertions):
+            return []
+
+        failures = asserter.collector = _MessageList()
+        for name, args, kwargs in self.steps:
+            getattr(asserter, name)(*args, **kwargs)
+        return failures
+
+    def __getstate__(self):
+        return {
+            "asserter": self.asserter,
+            "steps": self.steps,
+            "desc": self.desc,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(state["asserter"], state["steps"], state["desc"])
+
+    def __repr__(self):
+        return "CheckPlan({}{})".format(
+            self._asserter_cls.__name__,
+            "".join(".{}(...)".format(name) for name, _, _ in self.steps),
+        )
+
+
+class _MessageList(list):
+    """ collector keeping only the messages"""
+
+    def record(self, site, kind, msg):
+        self.append(msg)
+
+
+def _never(val):
+    return False
+
+
+def _always(val):
+    return True
+
+
+def compile_check(asserter=None, desc=None) -> CheckPlan:
+    """
+    start a reusable chain of assertions
+
+        plan = compile_check().is_instance_of(str).is_in(("fix4.1", "fix4.2"))
+        plan(msg.msg_type, "msg_type")
+
+    :param asserter: `SimpleAssertions` (sub)class or instance running the
+        assertions, default `SimpleAssertions`
+    :param desc: default description of checked values
+    :return: CheckPlan
+    """
+    return CheckPlan(asserter, desc=desc)
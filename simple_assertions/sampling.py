@@ -0,0 +1,123 @@
+"""
+samplers deciding which `check(...)` calls are evaluated, see `assertion_mode`
+"""
+import random
+
+
+class Sampler:
+    """
+    `sample(frame)` is called by `check` with the frame of its caller and
+    returns False to skip the check (a no-op chain is returned instead). It is
+    on the hot path, so it must be cheap; the built-in samplers avoid locks and
+    may be off by a few samples when threads race.
+    """
+
+    def sample(self, frame) -> bool:
+        raise NotImplementedError
+
+
+def _site(frame):
+    # call site without resolving the line no., which is comparatively slow
+    return frame.f_code, frame.f_lasti
+
+
+class ProbabilitySampler(Sampler):
+    """ evaluates every check with probability `rate`"""
+
+    def __init__(self, rate, seed=None):
+        """
+        :param rate: 0 - 1
+        :param seed: seed for deterministic runs, i.e. in tests
+        """
+        if not 0 <= rate <= 1:
+            raise ValueError("rate must be in [0, 1], got {}".format(rate))
+        self.rate = rate
+        self._random = random.Random(seed).random
+
+    def sample(self, frame) -> bool:
+        return self._random() < self.rate
+
+    def __repr__(self):
+        return "ProbabilitySampler({})".format(self.rate)
+
+
+class EveryNthSampler(Sampler):
+    """ evaluates the first and then every `n`-th check of each call site"""
+
+    def __init__(self, n):
+        if n < 1:
+            raise ValueError("n must be >= 1, got {}".format(n))
+        self.n = n
+        self._counts = {}
+
+    def sample(self, frame) -> bool:
+        site = _site(frame)
+        count = self._counts.get(site, 0)
+        self._counts[site] = count + 1
+        return count % self.n == 0
+
+    def __repr__(self):
+        return "EveryNthSampler({})".format(self.n)
+
+
+class AdaptiveSampler(Sampler):
+    """
+    evaluates the first `first` checks of each call site, after that the gap
+    between evaluated checks grows with the no. of calls (about `first`
+    samples per doubling of calls) up to `max_interval`; hot call sites are
+    sampled less and less while rare ones are always checked
+    """
+
+    def __init__(self, first=100, max_interval=1000):
+        if first < 1 or max_interval < 1:
+            raise ValueError("first and max_interval must be >= 1")
+        self.first = first
+        self.max_interval = max_interval
+        # call site -> [calls, next sampled call]
+        self._sites = {}
+
+    def sample(self, frame) -> bool:
+        site = _site(frame)
+        state = self._sites.get(site)
+        if state is None:
+            state = self._sites[site] = [0, 0]
+        calls = state[0]
+        state[0] = calls + 1
+        if calls < self.first:
+            return True
+        if calls >= state[1]:
+            state[1] = calls + min(self.max_interval, calls // self.first)
+            return True
+        return False
+
+    def __repr__(self):
+        return "AdaptiveSampler(first={}, max_interval={})".format(
+            self.first, self.max_interval
+        )
+
+
+def parse_sampler(spec, seed=None) -> Sampler:
+    """
+    sampler from its text form, as used by the `ASSERT_SAMPLING` env. var.
+
+        "0.1"                   evaluate 10% of checks
+        "every:100"             every 100th check per call site
+        "adaptive"              `AdaptiveSampler()`
+        "adaptive:50:10000"     `AdaptiveSampler(first=50, max_interval=10000)`
+
+    :param spec: text form
+    :param seed: seed of the probability sampler
+    :return: Sampler, None for an empty spec
+    """
+    spec = spec.strip().lower()
+    if not spec:
+        return None
+    kind, _, args = spec.partition(":")
+    try:
+        if kind == "every":
+            return EveryNthSampler(int(args))
+        if kind == "adaptive":
+            return AdaptiveSampler(*(int(arg) for arg in args.split(":") if arg))
+        return ProbabilitySampler(float(spec), seed)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("invalid sampling [{}]: {}".format(spec, exc)) from None
@@ -0,0 +1,369 @@
+import threading
+from collections.abc import Mapping
+
+from simple_assertions.helper import BoundedValue, LazyMessage
+from simple_assertions.plan import CheckPlan
+
+# no. of failing paths listed in failure messages
+MAX_REPORTED = 10
+
+# returned by `Mapping.get` for keys not present in the payload
+_MISSING = object()
+
+
+class OptionalKey:
+    """ key of a mapping schema which may be left out, see `optional`"""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __repr__(self):
+        return "optional({!r})".format(self.key)
+
+
+def optional(key) -> OptionalKey:
+    """
+    mark a key of a mapping schema as optional, it is validated only if present
+
+        {"id": int, optional("note"): str}
+    """
+    return OptionalKey(key)
+
+
+class SchemaFailures:
+    """
+    failing paths of a payload, messages of only the first `limit` paths are
+    kept, the rest are counted
+    """
+
+    __slots__ = ("limit", "messages", "count")
+
+    def __init__(self, limit=None):
+        self.limit = MAX_REPORTED if limit is None else limit
+        # [message, ...], one per failing path
+        self.messages = []
+        self.count = 0
+
+    def add(self, messages):
+        """ :param messages: failure messages of one path"""
+        self.count += 1
+        if len(self.messages) < self.limit:
+            if len(messages) == 1:
+                self.messages.append(messages[0])
+            else:
+                self.messages.append(
+                    LazyMessage("; ".join(["{}"] * len(messages)), *messages)
+                )
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def __str__(self):
+        more = self.count - len(self.messages)
+        return "{} failure(s): {}{}".format(
+            self.count,
+            "; ".join(str(msg) for msg in self.messages),
+            ", ... {} more".format(more) if more else "",
+        )
+
+
+def _join(path, key) -> str:
+    # paths are format templates, "{}" is filled with list indices on failure
+    key = str(key).replace("{", "{{").replace("}", "}}")
+    return "{}.{}".format(path, key) if path else key
+
+
+def _describe(path, msg):
+    return LazyMessage("[{}]: {}", path, msg) if path else msg
+
+
+def _is_types(schema) -> bool:
+    if isinstance(schema, type):
+        return True
+    return (
+        isinstance(schema, tuple)
+        and bool(schema)
+        and all(isinstance(item, type) for item in schema)
+    )
+
+
+class SchemaValidator:
+    """
+    schema of nested mappings / lists compiled once into a single function
+    (like `CheckPlan`) checking a payload in one pass. Schema elements:
+
+        CheckPlan               leaf, i.e. `compile_check().is_in(("buy", "sell"))`
+        type / tuple of types   leaf, shorthand for `is_instance_of`
+        None                    leaf, any value
+        {key: schema, ...}      mapping, every key is required unless `optional`
+                                (keys not in the schema are not checked)
+        [schema]                list or tuple, every item matches schema
+
+    Built-in assertions of leaves are inlined, assertion methods only run for
+    values failing them or for assertions added by subclasses. Schemas are
+    not copied, changing one after compiling it has no effect on the validator.
+    """
+
+    def __init__(self, schema, asserter=None):
+        """
+        :param schema: see above
+        :param asserter: `SimpleAssertions` (sub)class or instance used for
+            type shorthands, default `SimpleAssertions`
+        """
+        self.schema = schema
+        self.asserter = asserter
+        self._validate = _SchemaCompiler(asserter).compile(schema)
+
+    def validate(self, payload, limit=None):
+        """
+        :param payload: value to validate
+        :param limit: no. of failing paths listed (default: `MAX_REPORTED`)
+        :return: SchemaFailures, None if payload matches (nothing is allocated)
+        """
+        return self._validate(payload, limit)
+
+    def failures(self, payload, limit=None) -> SchemaFailures:
+        """
+        :param payload: value to validate
+        :param limit: no. of failing paths listed (default: `MAX_REPORTED`)
+        :return: SchemaFailures, empty if payload matches
+        """
+        failures = self._validate(payload, limit)
+        return SchemaFailures(limit) if failures is None else failures
+
+    def __repr__(self):
+        return "SchemaValidator({})".format(BoundedValue(self.schema))
+
+
+class _SchemaCompiler:
+    """
+    generates the source of `validate(v, limit)`, returning None or the
+    `SchemaFailures` created on the first failure; paths are format templates
+    filled with the indices of enclosing lists only when a check fails
+    """
+
+    def __init__(self, asserter):
+        self.asserter = asserter
+        self.namespace = {
+            "Mapping": Mapping,
+            "add": _add,
+            "MISSING": _MISSING,
+            "SEQUENCES": (list, tuple),
+            "explain": _explain,
+            "missing": _missing,
+            "not_a": _not_a,
+        }
+        self.lines = ["def validate(v, limit):", "    out = None"]
+        self.names = 0
+
+    def compile(self, schema):
+        self._emit(schema, "v", "", 1, ())
+        self._line(1, "return out")
+        exec("\n".join(self.lines), self.namespace)
+        return self.namespace["validate"]
+
+    def _line(self, depth, code):
+        self.lines.append("    " * depth + code)
+
+    def _var(self, prefix) -> str:
+        self.names += 1
+        return "{}{}".format(prefix, self.names)
+
+    def _const(self, prefix, value) -> str:
+        name = self._var(prefix)
+        self.namespace[name] = value
+        return name
+
+    def _path(self, path, indices) -> str:
+        return "{}.format({})".format(self._const("p", path), ", ".join(indices))
+
+    def _emit(self, schema, var, path, depth, indices):
+        if schema is None:
+            self._line(depth, "pass")
+        elif isinstance(schema, CheckPlan):
+            self._leaf(schema, var, path, depth, indices)
+        elif _is_types(schema):
+            plan = CheckPlan(self.asserter).is_instance_of(schema)
+            self._leaf(plan, var, path, depth, indices)
+        elif isinstance(schema, Mapping):
+            self._mapping(schema, var, path, depth, indices)
+        elif isinstance(schema, list) and len(schema) == 1:
+            self._sequence(schema[0], var, path, depth, indices)
+        else:
+            raise TypeError(
+                "unsupported schema element [{}] at [{}], expected CheckPlan, "
+                "type, None, mapping or [item schema]".format(
+                    BoundedValue(schema), path.format(*["*"] * len(indices))
+                )
+            )
+
+    def _leaf(self, plan, var, path, depth, indices):
+        explain = "out = explain({}, {}, {}, out, limit)".format(
+            self._const("f", plan.failures), var, self._path(path, indices)
+        )
+        expression = plan._expression(self.namespace, var)
+        if expression is None:
+            self._line(depth, explain)
+            return
+        # the expression may be stricter than the assertions, they decide
+        self._line(depth, "try:")
+        self._line(depth + 1, "ok = {}".format(expression))
+        self._line(depth, "except TypeError:")
+        self._line(depth + 1, "ok = False")
+        self._line(depth, "if not ok:")
+        self._line(depth + 1, explain)
+
+    def _mapping(self, schema, var, path, depth, indices):
+        self._line(
+            depth,
+            "if type({0}) is not dict and not isinstance({0}, Mapping):".format(
+                var
+            ),
+        )
+        self._line(
+            depth + 1,
+            "out = add(out, limit, [not_a('mapping', {}, {})])".format(
+                var, self._path(path, indices)
+            ),
+        )
+        self._line(depth, "else:")
+        self._line(depth + 1, "pass")
+        for key, field_schema in schema.items():
+            required = not isinstance(key, OptionalKey)
+            if not required:
+                key = key.key
+            field_path = _join(path, key)
+            field = self._var("v")
+            self._line(
+                depth + 1,
+                "{} = {}.get({}, MISSING)".format(
+                    field, var, self._const("k", key)
+                ),
+            )
+            self._line(depth + 1, "if {} is MISSING:".format(field))
+            if required:
+                self._line(
+                    depth + 2,
+                    "out = add(out, limit, [missing({})])".format(
+                        self._path(field_path, indices)
+                    ),
+                )
+            else:
+                self._line(depth + 2, "pass")
+            if field_schema is not None:
+                self._line(depth + 1, "else:")
+                self._emit(field_schema, field, field_path, depth + 2, indices)
+
+    def _sequence(self, schema, var, path, depth, indices):
+        self._line(depth, "if not isinstance({}, SEQUENCES):".format(var))
+        self._line(
+            depth + 1,
+            "out = add(out, limit, [not_a('list', {}, {})])".format(
+                var, self._path(path, indices)
+            ),
+        )
+        if schema is None:
+            return
+        index, item = self._var("i"), self._var("v")
+        self._line(depth, "else:")
+        self._line(
+            depth + 1, "for {}, {} in enumerate({}):".format(index, item, var)
+        )
+        item_path = "{}[{{}}]".format(path)
+        self._emit(schema, item, item_path, depth + 2, indices + (index,))
+
+
+def _add(out, limit, messages) -> SchemaFailures:
+    """ add the messages of a failing path, to new failures if `out` is None"""
+    if out is None:
+        out = SchemaFailures(limit)
+    out.add(messages)
+    return out
+
+
+def _explain(failures, val, path, out, limit):
+    """ run the assertions of a leaf failing its fast path"""
+    messages = failures(val, path)
+    if messages:
+        return _add(out, limit, messages)
+    return out
+
+
+def _not_a(kind, val, path):
+    return _describe(
+        path, LazyMessage("Expected:[{}] to be a {}", BoundedValue(val), kind)
+    )
+
+
+def _missing(path):
+    return _describe(path, "Expected key to be present")
+
+
+class _ValidatorCache:
+    """
+    validators keyed on identity of the schema, the oldest are dropped when
+    full; lookups don't lock, only adding an entry does
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        # {asserter: {id(schema): validator}}, no key tuple built per lookup
+        self._entries = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, schema, asserter) -> SchemaValidator:
+        # the entry keeps the schema alive, so its id is not reused
+        try:
+            return self._entries[asserter][id(schema)]
+        except KeyError:
+            pass
+
+        validator = SchemaValidator(schema, asserter)
+        with self._lock:
+            entries = self._entries
+            while self._size >= self.maxsize:
+                oldest = next(iter(entries))
+                validators = entries[oldest]
+                if validators:
+                    del validators[next(iter(validators))]
+                    self._size -= 1
+                else:
+                    del entries[oldest]
+            validators = entries.setdefault(asserter, {})
+            key = id(schema)
+            if key not in validators:
+                validators[key] = validator
+                self._size += 1
+            return validators[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_validators = _ValidatorCache()
+
+
+def compile_schema(schema, asserter=None) -> SchemaValidator:
+    """
+    compile a schema (see `SchemaValidator`), validators are cached by
+    identity of the schema, so define schemas once (i.e. at module level)
+
+        ORDER = {"id": int, "side": compile_check().is_in(("buy", "sell"))}
+        check(payload, "order").matches_schema(ORDER)
+
+    :param schema: schema or `SchemaValidator`
+    :param asserter: `SimpleAssertions` (sub)class or instance used for type
+        shorthands
+    :return: SchemaValidator
+    """
+    if isinstance(schema, SchemaValidator):
+        return schema
+    return _validators.get(schema, asserter)
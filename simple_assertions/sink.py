@@ -0,0 +1,298 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import weakref
+
+from simple_assertions.helper import bounded_repr
+
+# sinks with a running writer thread, flushed and closed at exit
+_OPEN = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_sinks():
+    for sink in list(_OPEN):
+        sink.close()
+
+
+class FailureRecord:
+    """
+    failure passed to a `FailureSink`, the message and value are kept as is
+    and rendered only by `as_dict`, possibly on another thread
+    """
+
+    __slots__ = (
+        "timestamp",
+        "site",
+        "assertion",
+        "desc",
+        "value",
+        "message",
+        "stack",
+    )
+
+    def __init__(self, site, assertion, val_to_chk, message, stack=None):
+        """
+        :param site: call site, "[file.py:42]"
+        :param assertion: assertion, i.e. "is_equal_to"
+        :param val_to_chk: `ValToChk` of the failed check, if any
+        :param message: failure message
+        :param stack: `CapturedStack` when running with `WarnVals.TraceBack`
+        """
+        self.timestamp = time.time()
+        self.site = site
+        self.assertion = assertion
+        self.desc = val_to_chk.desc if val_to_chk is not None else None
+        self.value = val_to_chk.val if val_to_chk is not None else None
+        self.message = message
+        self.stack = stack
+
+    def as_dict(self) -> dict:
+        record = {
+            "timestamp": self.timestamp,
+            "site": self.site,
+            "assertion": self.assertion,
+            "desc": self.desc,
+            "value": _render(bounded_repr.render, self.value),
+            "message": _render(str, self.message),
+        }
+        if self.stack is not None:
+            record["stack"] = [
+                "{}:{} in {}".format(*frame) for frame in self.stack.frames
+            ]
+        return record
+
+
+def _render(render, obj) -> str:
+    # values may be changed by the checking thread while rendered here
+    try:
+        return render(obj)
+    except Exception as exc:
+        return "<failed to render: {!r}>".format(exc)
+
+
+class FailureSink:
+    """
+    receives failures in warn mode instead of the logger, set with
+    `assertion_mode(sink=...)` or `runtime.configure(sink=...)`.
+    `emit` is called on the thread running the assertion and should return
+    quickly.
+    """
+
+    def emit(self, record: FailureRecord):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+# markers passed to the writer thread
+_FLUSH = object()
+_STOP = object()
+# seconds between checks that the writer thread is still alive
+_POLL = 0.1
+
+
+def _remaining(deadline) -> float:
+    """ seconds to wait before checking the writer thread again"""
+    if deadline is None:
+        return _POLL
+    return min(max(deadline - time.monotonic(), 0), _POLL)
+
+
+class JsonlQueueSink(FailureSink):
+    """
+    queues failures and writes them from a background thread as JSON lines,
+    in batches of up to `batch_size` records and at least every
+    `flush_interval` seconds.
+
+    When the queue is full new failures are dropped and counted in `dropped`,
+    or with `block` set the assertion waits up to `timeout` seconds for space
+    (backpressure). Pending records are written at exit. Errors writing or
+    flushing the target are counted in `errors` and don't stop the writer.
+    """
+
+    def __init__(
+        self,
+        target,
+        maxsize=10000,
+        batch_size=256,
+        flush_interval=1.0,
+        block=False,
+        timeout=None,
+    ):
+        """
+        :param target: path (appended to) or writable text file
+        :param maxsize: max. no. of queued records
+        :param batch_size: max. no. of records written at once
+        :param flush_interval: max. seconds before queued records are written
+        :param block: wait for space in the queue instead of dropping
+        :param timeout: max. seconds to wait with `block`, None waits forever
+        """
+        self.target = target
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block = block
+        self.timeout = timeout
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize)
+        self._closed = False
+        # opened here so a bad path fails the caller, not the writer thread
+        self._out, self._owned = self._open()
+        self._thread = threading.Thread(
+            target=self._run, name="simple-assertions-sink", daemon=True
+        )
+        self._thread.start()
+        _OPEN.add(self)
+
+    def emit(self, record: FailureRecord):
+        if self._closed:
+            self._drop()
+            return
+        try:
+            if self.block:
+                self._queue.put(record, timeout=self.timeout)
+            else:
+                self._queue.put_nowait(record)
+        except queue.Full:
+            self._drop()
+
+    def _drop(self):
+        with self._lock:
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+    def flush(self, timeout=None):
+        """ wait until records queued so far are written"""
+        if self._closed:
+            return
+        done = threading.Event()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._put_marker((_FLUSH, done), deadline):
+            return
+        # the writer thread may stop before it gets to the marker
+        while self._thread.is_alive():
+            wait = _remaining(deadline)
+            if done.wait(wait) or wait < _POLL:
+                return
+
+    def close(self, timeout=None):
+        """ write pending records and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        _OPEN.discard(self)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if self._put_marker((_STOP, None), deadline):
+            self._thread.join(timeout)
+
+    def _put_marker(self, item, deadline) -> bool:
+        """ queue `item` for a running writer thread, False if it can't be"""
+        while self._thread.is_alive():
+            wait = _remaining(deadline)
+            try:
+                self._queue.put(item, timeout=wait)
+                return True
+            except queue.Full:
+                if wait < _POLL:
+                    return False
+        return False
+
+    def _open(self):
+        if hasattr(self.target, "write"):
+            return self.target, False
+        return open(os.fspath(self.target), "a", encoding="utf-8"), True
+
+    def _run(self):
+        out = self._out
+        batch = []
+        flush_at = time.monotonic() + self.flush_interval
+        try:
+            while True:
+                try:
+                    item = self._queue.get(
+                        timeout=max(flush_at - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    item = None
+
+                if isinstance(item, FailureRecord):
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        self._write(out, batch)
+                elif item is not None:
+                    marker, done = item
+                    try:
+                        self._write(out, batch)
+                        self._flush(out)
+                    finally:
+                        if done is not None:
+                            done.set()
+                    if marker is _STOP:
+                        return
+
+                if time.monotonic() >= flush_at:
+                    self._write(out, batch)
+                    self._flush(out)
+                    flush_at = time.monotonic() + self.flush_interval
+        finally:
+            self._release_waiters()
+            if self._owned:
+                try:
+                    out.close()
+                except Exception:
+                    self._error()
+
+    def _release_waiters(self):
+        """ wake up `flush` calls queued behind a stopped writer"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, tuple) and item[1] is not None:
+                item[1].set()
+
+    def _flush(self, out):
+        try:
+            out.flush()
+        except Exception:
+            # e.g. disk full or closed file, keep the writer alive
+            self._error()
+
+    def _error(self):
+        with self._lock:
+            self.errors += 1
+
+    def _write(self, out, batch):
+        if not batch:
+            return
+        lines = "".join(
+            json.dumps(record.as_dict(), default=str) + "\n" for record in batch
+        )
+        try:
+            out.write(lines)
+        except Exception:
+            # keep the writer alive, failed records count as dropped
+            with self._lock:
+                self.dropped += len(batch)
+                self.errors += 1
+        else:
+            self.written += len(batch)
+        batch.clear()
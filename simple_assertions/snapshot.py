@@ -0,0 +1,362 @@
+import difflib
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Mapping
+from itertools import islice
+
+from simple_assertions.helper import find_call_site
+
+PYASSERT_SNAPSHOT_DIR = "ASSERT_SNAPSHOT_DIR"
+# default directory, next to the file of the first `matches_snapshot` call
+SNAPSHOT_DIR = "__snapshots__"
+INDEX_FILE = "index.jsonl"
+# the index is rewritten with one line per snapshot once it has more lines than
+# twice the no. of snapshots (and at least this many)
+MIN_COMPACT_LINES = 64
+# max. no. of diff lines in failure messages
+MAX_DIFF_LINES = 40
+
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _jsonable(val):
+    """
+    `val` as plain JSON types, the same for equal values in every run: keys
+    which aren't str are stored as their repr, sets are sorted
+    :raise TypeError: for values without a stable JSON form, i.e. objects whose
+        repr includes their address
+    """
+    if isinstance(val, _SCALARS):
+        return val
+    if isinstance(val, Mapping):
+        converted, keys = {}, {}
+        for key, item in val.items():
+            text = key if isinstance(key, str) else repr(key)
+            if text in keys:
+                raise TypeError(
+                    "keys [{!r}] and [{!r}] are both stored as [{}]".format(
+                        keys[text], key, text
+                    )
+                )
+            keys[text] = key
+            converted[text] = _jsonable(item)
+        return converted
+    if isinstance(val, (list, tuple)):
+        return [_jsonable(item) for item in val]
+    if isinstance(val, (set, frozenset)):
+        items = [_jsonable(item) for item in val]
+        try:
+            return sorted(items)
+        except TypeError:
+            return sorted(items, key=repr)
+    raise TypeError(
+        "{} has no snapshot form, serialize it first (i.e. to a str or "
+        "dict)".format(type(val).__name__)
+    )
+
+
+def serialize(val) -> bytes:
+    """
+    bytes stored for a value: bytes as is, str as utf-8 and anything else as
+    (sorted, indented) JSON, so diffs are readable
+    :raise TypeError: if val (or part of it) has no stable JSON form
+    """
+    if isinstance(val, (bytes, bytearray, memoryview)):
+        return bytes(val)
+    if isinstance(val, str):
+        return val.encode("utf-8")
+    return json.dumps(_jsonable(val), indent=2, sort_keys=True).encode("utf-8")
+
+
+# hunk header of a unified diff, "@@ -1,5 +1,6 @@"
+_HUNK = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+def _shift(hunk, offset) -> str:
+    """ hunk header with line numbers moved by `offset`"""
+    return "@@ -{}{} +{}{} @@".format(
+        int(hunk.group(1)) + offset,
+        hunk.group(2) or "",
+        int(hunk.group(3)) + offset,
+        hunk.group(4) or "",
+    )
+
+
+def _split_lines(data) -> list:
+    return data.decode("utf-8", "replace").splitlines(keepends=True)
+
+
+def _index_line(name, entry) -> bytes:
+    digest, size, mtime_ns = entry
+    line = json.dumps(
+        {"name": name, "sha256": digest, "size": size, "mtime_ns": mtime_ns}
+    )
+    return line.encode("utf-8") + b"\n"
+
+
+class SnapshotDiff:
+    """
+    difference between a snapshot and the actual value, rendered (as a
+    bounded unified diff) only when the failure message is
+    """
+
+    __slots__ = ("name", "expected", "actual")
+
+    def __init__(self, name, expected, actual):
+        """
+        :param name: snapshot name
+        :param expected: snapshot bytes
+        :param actual: serialized value
+        """
+        self.name = name
+        self.expected = expected
+        self.actual = actual
+
+    def __str__(self):
+        expected = _split_lines(self.expected)
+        actual = _split_lines(self.actual)
+        # only the differing middle is diffed, large outputs usually differ
+        # in a few lines
+        start = 0
+        while (
+            start < len(expected)
+            and start < len(actual)
+            and expected[start] == actual[start]
+        ):
+            start += 1
+        end = 0
+        while (
+            end < len(expected) - start
+            and end < len(actual) - start
+            and expected[-end - 1] == actual[-end - 1]
+        ):
+            end += 1
+        context = 2
+        first = max(start - context, 0)
+        diff = difflib.unified_diff(
+            expected[first : len(expected) - end + context],
+            actual[first : len(actual) - end + context],
+            "snapshot",
+            "actual",
+            n=context,
+        )
+        lines = [
+            _HUNK.sub(lambda hunk: _shift(hunk, first), line.rstrip("\r\n"))
+            for line in islice(diff, MAX_DIFF_LINES)
+        ]
+        more = sum(1 for _ in diff)
+        return "differs from line {}:\n{}{}".format(
+            start + 1,
+            "\n".join(lines),
+            "\n... {} more diff line(s)".format(more) if more else "",
+        )
+
+
+class SnapshotStore:
+    """
+    directory of snapshot files with an index of their sha256 digests, sizes
+    and modification times (`index.jsonl`), so a matching value is compared
+    by digest and a `stat` of its snapshot, without reading the snapshot.
+
+    The index is a cache: entries are appended as JSON lines, the last one of
+    a name wins, and values not matching the index (or snapshots changed
+    since they were indexed) are verified against the snapshot file itself.
+    Snapshots are replaced atomically and index lines are appended in single
+    writes, so concurrent test workers can share a store without locking. Once
+    most lines are superseded the index is compacted (replaced atomically as
+    well), an entry appended by another worker meanwhile may be lost, which
+    only means its snapshot is read once more.
+    """
+
+    def __init__(self, directory):
+        """ :param directory: snapshot directory, created on first update"""
+        self.directory = os.path.abspath(directory)
+        self.index_path = os.path.join(self.directory, INDEX_FILE)
+        # {name: (sha256 hex digest, size, mtime_ns)}, None until loaded
+        self._index = None
+        # no. of lines in the index file, as far as this store knows
+        self._index_lines = 0
+        self._lock = threading.Lock()
+
+    def path_of(self, name) -> str:
+        """ :return: path of snapshot `name`, which must be inside the store"""
+        path = os.path.normpath(os.path.join(self.directory, name))
+        if path == self.index_path or not path.startswith(
+            os.path.join(self.directory, "")
+        ):
+            raise ValueError(
+                "invalid snapshot name [{}], must be relative to [{}]".format(
+                    name, self.directory
+                )
+            )
+        return path
+
+    def _load_index(self):
+        """ :return: {name: entry}, no. of lines in the index file"""
+        index = {}
+        lines = 0
+        try:
+            with open(self.index_path, "rb") as file:
+                for line in file:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                        index[entry["name"]] = (
+                            entry["sha256"],
+                            entry["size"],
+                            entry["mtime_ns"],
+                        )
+                    except (ValueError, KeyError, TypeError):
+                        # line cut short by a crashed worker
+                        continue
+        except FileNotFoundError:
+            pass
+        return index, lines
+
+    def _entry(self, name):
+        """ :return: indexed (digest, size, mtime_ns) of a snapshot or None"""
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index, self._index_lines = self._load_index()
+                index = self._index
+        return index.get(name)
+
+    def _is_indexed(self, name, path, digest) -> bool:
+        """ snapshot has `digest` and is unchanged since it was indexed"""
+        entry = self._entry(name)
+        if entry is None or entry[0] != digest:
+            return False
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == entry[1:]
+
+    def _remember(self, name, path, digest):
+        stat = os.stat(path)
+        entry = (digest, stat.st_size, stat.st_mtime_ns)
+        self._entry(name)
+        with self._lock:
+            self._index[name] = entry
+        return entry
+
+    def read(self, name):
+        """ :return: bytes of snapshot `name`, None if there is none"""
+        try:
+            with open(self.path_of(name), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def compare(self, name, data):
+        """
+        :param name: snapshot name
+        :param data: serialized value
+        :return: None if `data` matches the snapshot, `SnapshotDiff` if it
+            doesn't and False if there is no snapshot
+        """
+        path = self.path_of(name)
+        digest = hashlib.sha256(data).hexdigest()
+        if self._is_indexed(name, path, digest):
+            return None
+
+        expected = self.read(name)
+        if expected is None:
+            return False
+        if hashlib.sha256(expected).hexdigest() == digest:
+            # updated by another worker, or the index is missing / stale
+            self._remember(name, path, digest)
+            return None
+        return SnapshotDiff(name, expected, data)
+
+    def update(self, name, data) -> bool:
+        """
+        write snapshot `name` if missing or different
+        :return: True if written
+        """
+        path = self.path_of(name)
+        digest = hashlib.sha256(data).hexdigest()
+        if self._is_indexed(name, path, digest):
+            return False
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=".snapshot-"
+        )
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        entry = self._remember(name, path, digest)
+        # a single write on a file opened for appending
+        with open(self.index_path, "ab") as index:
+            index.write(_index_line(name, entry))
+        with self._lock:
+            self._index_lines += 1
+            compact = self._index_lines > max(
+                2 * len(self._index), MIN_COMPACT_LINES
+            )
+        if compact:
+            self.compact()
+        return True
+
+    def compact(self):
+        """ rewrite the index with only the last entry of every snapshot"""
+        # re-read, to keep entries appended by other workers
+        index, _ = self._load_index()
+        handle, tmp_path = tempfile.mkstemp(
+            dir=self.directory, prefix=".index-"
+        )
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.writelines(
+                    _index_line(name, entry) for name, entry in index.items()
+                )
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        with self._lock:
+            self._index.update(index)
+            self._index_lines = len(index)
+
+    def __repr__(self):
+        return "SnapshotStore({!r})".format(self.directory)
+
+
+# directory -> SnapshotStore
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+
+def snapshot_store(directory=None) -> SnapshotStore:
+    """
+    shared store of a directory
+    :param directory: default `ASSERT_SNAPSHOT_DIR`, or `__snapshots__` next to
+        the file calling the assertion
+    :return: SnapshotStore
+    """
+    if directory is None:
+        directory = os.getenv(PYASSERT_SNAPSHOT_DIR)
+    if directory is None:
+        frame = find_call_site(depth=2)
+        base = os.path.dirname(frame.f_code.co_filename) if frame else "."
+        directory = os.path.join(base, SNAPSHOT_DIR)
+    directory = os.path.abspath(directory)
+
+    store = _STORES.get(directory)
+    if store is None:
+        with _STORES_LOCK:
+            store = _STORES.setdefault(directory, SnapshotStore(directory))
+    return store
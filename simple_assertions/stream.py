@@ -0,0 +1,204 @@
+from collections.abc import Mapping
+
+from simple_assertions.plan import CheckPlan
+
+# returned by getters for fields not present in the record
+_MISSING = object()
+
+
+def field_getter(path):
+    """
+    getter for a dotted field path, every part is looked up as key for
+    mappings and as attribute otherwise, i.e. "header.seq_num"
+    :param path: field path
+    :return: function(record) -> value of the field
+    """
+    parts = tuple(path.split("."))
+
+    def get(record):
+        val = record
+        for part in parts:
+            if isinstance(val, Mapping):
+                val = val.get(part, _MISSING)
+            else:
+                val = getattr(val, part, _MISSING)
+            if val is _MISSING:
+                break
+        return val
+
+    get.__name__ = path
+    return get
+
+
+class FieldFailure:
+    """ failed assertion(s) of one field of a record"""
+
+    __slots__ = ("field", "value", "messages")
+
+    def __init__(self, field, value, messages):
+        self.field = field
+        self.value = value
+        self.messages = messages
+
+    def __repr__(self):
+        return "FieldFailure({}: {})".format(
+            self.field, "; ".join(str(msg) for msg in self.messages)
+        )
+
+
+class CheckedRecord:
+    """ record from the stream with failures of its fields"""
+
+    __slots__ = ("index", "record", "failures")
+
+    def __init__(self, index, record, failures):
+        self.index = index
+        self.record = record
+        # [FieldFailure, ...], empty if record passed
+        self.failures = failures
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    def __repr__(self):
+        return "CheckedRecord(#{} {})".format(self.index, self.failures)
+
+
+class FieldStats:
+    """ counters of one field"""
+
+    __slots__ = ("checked", "failed", "missing")
+
+    def __init__(self):
+        self.checked = 0
+        self.failed = 0
+        self.missing = 0
+
+    def __repr__(self):
+        return "FieldStats(checked={}, failed={}, missing={})".format(
+            self.checked, self.failed, self.missing
+        )
+
+
+class _Counters:
+    """ record and per field counters of checked records"""
+
+    def __init__(self, fields):
+        self.fields = {name: FieldStats() for name in fields}
+        self.records = 0
+        self.failed_records = 0
+        self.failures = 0
+        # set if stopped early because of `max_failures`
+        self.stopped = False
+
+    def summary(self) -> str:
+        lines = [
+            "{} of {} record(s) failed{}".format(
+                self.failed_records,
+                self.records,
+                ", stopped early" if self.stopped else "",
+            )
+        ]
+        for name, stats in self.fields.items():
+            lines.append(
+                "{}: {} failed, {} missing of {}".format(
+                    name, stats.failed, stats.missing, stats.checked
+                )
+            )
+        return "\n".join(lines)
+
+
+class StreamCheck(_Counters):
+    """
+    lazily checks records of an iterable, see `check_stream`. Only the
+    current record is kept, the counters (`records`, `failed_records`,
+    `failures` and `fields`) are updated as the stream is consumed.
+    """
+
+    def __init__(self, records, rules, max_failures=None, annotate=False):
+        """
+        :param records: any iterable, consumed lazily
+        :param rules: {field path or getter: CheckPlan}
+        :param max_failures: stop after the record reaching this many failures
+        :param annotate: yield every record, not only failed ones
+        """
+        self._records = records
+        self._rules = []
+        for field, plan in rules.items():
+            if not isinstance(plan, CheckPlan):
+                raise TypeError(
+                    "rule for [{}] must be a CheckPlan, got {}".format(
+                        field, type(plan).__name__
+                    )
+                )
+            if callable(field):
+                getter = field
+                name = getattr(field, "__name__", repr(field))
+            else:
+                getter = field_getter(field)
+                name = field
+            self._rules.append((name, getter, plan))
+        super().__init__(name for name, _, _ in self._rules)
+
+        self.max_failures = max_failures
+        self.annotate = annotate
+
+    def __iter__(self):
+        rules = self._rules
+        fields = self.fields
+        max_failures = self.max_failures
+        annotate = self.annotate
+
+        for index, record in enumerate(self._records):
+            self.records += 1
+            failures = []
+            for name, getter, plan in rules:
+                stats = fields[name]
+                stats.checked += 1
+                val = getter(record)
+                if val is _MISSING:
+                    stats.missing += 1
+                    missing = "field [{}] missing".format(name)
+                    failures.append(FieldFailure(name, None, [missing]))
+                    continue
+                messages = plan.failures(val, name)
+                if messages:
+                    stats.failed += 1
+                    failures.append(FieldFailure(name, val, messages))
+
+            if failures:
+                self.failed_records += 1
+                self.failures += len(failures)
+            if failures or annotate:
+                yield CheckedRecord(index, record, failures)
+            if max_failures is not None and self.failures >= max_failures:
+                self.stopped = True
+                return
+
+
+def check_stream(records, rules, max_failures=None, annotate=False):
+    """
+    check fields of every record of an iterable (file, socket, queue...)
+
+        rules = {
+            "msg_type": compile_check().is_in(("fix4.1", "fix4.2")),
+            "header.seq_num": compile_check().is_instance_of(int),
+        }
+        stream = check_stream(feed, rules, max_failures=100)
+        for failed in stream:
+            print(failed.index, failed.failures)
+        print(stream.summary())
+
+    Records are consumed lazily, one at a time, so memory does not grow with
+    the length of the feed. Failures are collected per record and never raised.
+
+    :param records: any iterable
+    :param rules: {field path or getter: CheckPlan}, paths are dotted and
+        looked up as keys of mappings or attributes of other objects
+    :param max_failures: stop after the record reaching this many failures
+    :param annotate: yield every record (`CheckedRecord.passed`), not only
+        failed ones
+    :return: StreamCheck, iterable of `CheckedRecord`
+    """
+    return StreamCheck(records, rules, max_failures, annotate)
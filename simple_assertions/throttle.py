@@ -0,0 +1,169 @@
+import atexit
+import logging
+import threading
+import time
+import weakref
+
+# throttles with suppressed repeats, summarised at exit
+_PENDING = weakref.WeakSet()
+
+
+@atexit.register
+def _log_pending_summaries():
+    for throttle in list(_PENDING):
+        throttle.log_summaries(force=True)
+
+
+class _Counts:
+    __slots__ = ("seen", "emitted", "pending")
+
+    def __init__(self):
+        self.seen = 0
+        self.emitted = 0
+        # suppressed since last summary
+        self.pending = 0
+
+
+class WarningThrottle:
+    """
+    limits warnings logged for repeating failures, keyed by call site and
+    message template. For every key the first `first` warnings are logged and
+    after that only every `every`-th one; on top of that at most `rate`
+    warnings per `per` seconds are logged over all keys (token bucket).
+
+    Suppressed repeats are summarised with the next warning logged after
+    `summary_interval` seconds, by `close` and at exit as "suppressed 48,211
+    repeats of [test_x.py:42]: ...", `report` returns exact counts.
+    """
+
+    def __init__(
+        self,
+        first=10,
+        every=1000,
+        rate=None,
+        per=1.0,
+        summary_interval=60.0,
+        logger=None,
+        clock=time.monotonic,
+    ):
+        """
+        :param first: no. of warnings always logged per key
+        :param every: after `first`, log every n-th repeat (0 / None: never)
+        :param rate: max warnings logged per `per` seconds (None: no limit)
+        :param per: token bucket window in seconds
+        :param summary_interval: min seconds between summaries
+        :param logger: where summaries are logged
+        :param clock: time source, for tests
+        """
+        self.first = first
+        self.every = every
+        self.rate = rate
+        self.per = per
+        self.summary_interval = summary_interval
+        self.logger = logger or logging.getLogger("simple_assertions")
+        self.clock = clock
+
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._tokens = rate
+        self._refilled_at = clock()
+        self._summary_at = clock()
+        self._pending = False
+
+    def allow(self, key) -> bool:
+        """
+        count a warning for `key` and decide if it should be logged
+        :param key: (call site, message template)
+        :return: bool
+        """
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = _Counts()
+            counts.seen += 1
+
+            allowed = counts.seen <= self.first or bool(
+                self.every and (counts.seen - self.first) % self.every == 0
+            )
+            if allowed and self.rate is not None:
+                allowed = self._take_token()
+
+            if allowed:
+                counts.emitted += 1
+            else:
+                counts.pending += 1
+                if not self._pending:
+                    self._pending = True
+                    _PENDING.add(self)
+            return allowed
+
+    def _take_token(self) -> bool:
+        now = self.clock()
+        elapsed = now - self._refilled_at
+        if elapsed > 0:
+            self._tokens = min(
+                self.rate, self._tokens + elapsed * self.rate / self.per
+            )
+            self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def summaries(self, force=False) -> list:
+        """
+        summary lines of repeats suppressed since the last summary, empty
+        unless `summary_interval` has passed or `force` is set
+        """
+        if not self._pending:
+            return []
+
+        now = self.clock()
+        with self._lock:
+            if not force and now - self._summary_at < self.summary_interval:
+                return []
+            self._summary_at = now
+            self._pending = False
+            _PENDING.discard(self)
+
+            lines = []
+            for (site, template), counts in self._counts.items():
+                if counts.pending:
+                    lines.append(
+                        "suppressed {:,} repeats of {}: {}".format(
+                            counts.pending, site, template
+                        )
+                    )
+                    counts.pending = 0
+            return lines
+
+    def log_summaries(self, force=False):
+        for line in self.summaries(force):
+            self.logger.warning(line)
+
+    def close(self):
+        """ log the summaries of all repeats suppressed so far"""
+        self.log_summaries(force=True)
+
+    def report(self) -> dict:
+        """
+        exact counts per key
+        :return: {(call site, template): {"seen", "emitted", "suppressed"}}
+        """
+        with self._lock:
+            return {
+                key: {
+                    "seen": counts.seen,
+                    "emitted": counts.emitted,
+                    "suppressed": counts.seen - counts.emitted,
+                }
+                for key, counts in self._counts.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self._pending = False
+            _PENDING.discard(self)
+            self._tokens = self.rate
+            self._refilled_at = self._summary_at = self.clock()
@@ -1,6 +1,8 @@
 import os
 from contextlib import ContextDecorator
 
+from simple_assertions import runtime
+
 
 class SetEnvVarContext(ContextDecorator):
     def __init__(self, var, val):
@@ -9,6 +11,8 @@ class SetEnvVarContext(ContextDecorator):
 
     def __enter__(self):
         os.environ[self.var] = self.val
+        runtime.reload()
 
     def __exit__(self, *exc):
         del os.environ[self.var]
+        runtime.reload()
@@ -0,0 +1,67 @@
+import tracemalloc
+import unittest
+
+from simple_assertions import check, SimpleAssertions
+from tests.test_extend import ExtendAssertions
+
+# one slotted asserter and one slotted `ValToChk`
+PASSING_CHECK_BUDGET = 128
+
+
+def passing_check(val):
+    check(val).is_equal_to(val)
+
+
+class AllocationCases(unittest.TestCase):
+    def setUp(self) -> None:
+        tracemalloc.start()
+
+    def tearDown(self) -> None:
+        tracemalloc.stop()
+
+    def measure_peak(self, func, *args):
+        # warm up any caches before measuring
+        for _ in range(10):
+            func(*args)
+
+        peaks = []
+        for _ in range(10):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            func(*args)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        return min(peaks)
+
+    @unittest.skipUnless(
+        hasattr(tracemalloc, "reset_peak"), "tracemalloc.reset_peak needs 3.9+"
+    )
+    def test_passing_check_allocation_budget(self):
+        peak = self.measure_peak(passing_check, "fix4.1")
+        self.assertLessEqual(
+            peak,
+            PASSING_CHECK_BUDGET,
+            "check(x).is_equal_to(x) allocated {} bytes".format(peak),
+        )
+
+    def test_passing_checks_do_not_retain_memory(self):
+        passing_check(10)
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(1000):
+            passing_check(i)
+        self.assertLess(tracemalloc.get_traced_memory()[0] - before, 1024)
+
+    def test_asserters_are_slotted(self):
+        self.assertFalse(hasattr(check(1), "__dict__"))
+        self.assertFalse(hasattr(SimpleAssertions(), "__dict__"))
+        self.assertIs(
+            SimpleAssertions().format_err_msg, check(1).format_err_msg
+        )
+
+    def test_subclass_without_slots(self):
+        asserter = ExtendAssertions()
+        asserter.custom_state = 1
+        asserter.check(10).is_greater_than(5).is_equal_to(10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import subprocess
+import sys
+import unittest
+
+from simple_assertions import check, assertion_mode, arrays
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class LazyImportCases(unittest.TestCase):
+    def test_numpy_not_imported_with_package(self):
+        out = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, simple_assertions; print('numpy' in sys.modules)",
+            ]
+        )
+        self.assertEqual(out.strip(), b"False")
+
+    @unittest.skipIf(np is not None, "numpy is installed")
+    def test_missing_numpy(self):
+        with self.assertRaises(ImportError) as ctx:
+            check([1, 2], "prices").is_array_equal_to([1, 2])
+        self.assertIn("pip install numpy", str(ctx.exception))
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class ArrayAssertionCases(unittest.TestCase):
+    def test_equal(self):
+        check(np.arange(5), "ids").is_array_equal_to([0, 1, 2, 3, 4])
+        check(np.zeros((2, 3))).is_array_equal_to(0)
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.arange(10), "ids").is_array_equal_to(
+                np.where(np.arange(10) % 3 == 0, -1, np.arange(10))
+            )
+        msg = str(ctx.exception)
+        self.assertIn("[ids]", msg)
+        self.assertIn("4 of 10 element(s) mismatch: [0]=0, [3]=3, [6]=6", msg)
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.arange(3)).is_array_equal_to([0, 1])
+        self.assertIn("shape (3,) does not match", str(ctx.exception))
+
+    def test_reports_first_indices_only(self):
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.arange(100)).is_array_equal_to(np.full(100, -1))
+        msg = str(ctx.exception)
+        self.assertIn("100 of 100 element(s) mismatch", msg)
+        self.assertIn("[4]=4, ...", msg)
+        self.assertNotIn("[5]=5", msg)
+
+    def test_close(self):
+        check(np.array([1.0, 2.0])).is_close_to([1.0, 2.0 + 1e-9])
+        check(np.array([np.nan])).is_close_to([np.nan], equal_nan=True)
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.array([[1.0, 2.0], [3.0, 4.0]])).is_close_to(
+                [[1.0, 2.0], [3.0, 4.5]], atol=0.1
+            )
+        self.assertIn("1 of 4 element(s) mismatch: [(1, 1)]=4.0", str(ctx.exception))
+
+    def test_all_in(self):
+        check(np.array([1, 2, 1])).is_all_in({1, 2})
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.array([1, 5, 2, 7])).is_all_in([1, 2])
+        self.assertIn("2 of 4 element(s) mismatch: [1]=5, [3]=7", str(ctx.exception))
+
+    def test_monotonic(self):
+        check(np.array([1, 1, 2, 3])).is_monotonic()
+        check(np.array([3, 2, 1])).is_monotonic(increasing=False, strict=True)
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.array([1, 2, 2, 1])).is_monotonic(strict=True)
+        msg = str(ctx.exception)
+        self.assertIn("to be strictly increasing", msg)
+        self.assertIn("2 of 4 element(s) mismatch: [2]=2, [3]=1", msg)
+
+        # NaN hides nothing, steps from and to NaN are out of order
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.array([1, np.nan, 0])).is_monotonic()
+        self.assertIn("2 of 3 element(s) mismatch: [1]=nan, [2]=0", str(ctx.exception))
+        with self.assertRaises(AssertionError):
+            check(np.array([3.0, np.nan])).is_monotonic(increasing=False)
+
+    def test_no_nan_and_bounds(self):
+        check(np.arange(3)).has_no_nan().is_within_bounds(0, 2)
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.array([0.0, np.nan, 1.0])).has_no_nan()
+        self.assertIn("1 of 3 element(s) mismatch: [1]=nan", str(ctx.exception))
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.array([-1, 0, 5, 10])).is_within_bounds(low=0, high=5)
+        self.assertIn("[0]=-1, [3]=10", str(ctx.exception))
+
+        # NaN compares False to both bounds, but is not within them
+        with self.assertRaises(AssertionError) as ctx:
+            check(np.array([0.5, np.nan])).is_within_bounds(0, 1)
+        self.assertIn("1 of 2 element(s) mismatch: [1]=nan", str(ctx.exception))
+        with self.assertRaises(AssertionError):
+            check(np.array([np.nan])).is_within_bounds()
+
+    def test_warn_mode(self):
+        with assertion_mode(warn=True), self.assertLogs("simple_assertions"):
+            check(np.arange(3)).is_within_bounds(high=1)
+
+
+class ArrayMismatchCases(unittest.TestCase):
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_rendered_lazily(self):
+        mismatch = arrays.ArrayMismatch(np.array([False, True]), np.array([1, 2]))
+        self.assertEqual(mismatch.count, 1)
+        self.assertEqual(mismatch.first(), [(1, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
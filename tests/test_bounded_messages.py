@@ -0,0 +1,71 @@
+import unittest
+
+from simple_assertions import check, bounded_repr, set_repr_limits
+from simple_assertions.helper import first_difference
+
+
+class BoundedMessageCases(unittest.TestCase):
+    def error_of(self, func):
+        with self.assertRaises(AssertionError) as ctx:
+            func()
+        return str(ctx.exception)
+
+    def test_small_values_unchanged(self):
+        err = self.error_of(lambda: check("1", "id").is_in([1, 2]))
+        self.assertEqual(err, "[id]: Expected:[1] to be in [[1, 2]]")
+
+        err = self.error_of(lambda: check("fix4.1").is_equal_to("fix4"))
+        self.assertEqual(err, "Expected:[fix4.1] to be equal to [fix4]")
+
+    def test_large_membership_is_bounded(self):
+        ids = list(range(2000000))
+        err = self.error_of(lambda: check(-1).is_in(ids))
+        self.assertLess(len(err), 300)
+        self.assertIn("list(len=2000000) [0, 1, 2,", err)
+
+        err = self.error_of(lambda: check(-1).is_equal_or_in_seq(set(ids)))
+        self.assertIn("set(len=2000000)", err)
+
+    def test_long_string_diff(self):
+        lhs = "a" * 10000 + "b" + "a" * 10
+        rhs = "a" * 10000 + "c" + "a" * 10
+        err = self.error_of(lambda: check(lhs).is_equal_to(rhs))
+        self.assertLess(len(err), 700)
+        self.assertIn("(str, len=10011)", err)
+        self.assertIn("first difference at index 10000: 'baaaaaaaaaa' != 'caaaaaaaaaa'", err)
+
+    def test_sequence_and_dict_diff(self):
+        lhs = list(range(1000))
+        rhs = list(range(1000))
+        rhs[500] = -1
+        err = self.error_of(lambda: check(lhs).is_equal_to(rhs))
+        self.assertIn("first difference at index 500: 500 != -1", err)
+
+        self.assertEqual(
+            first_difference([1, 2], [1, 2, 3]),
+            "len 2 vs 3, first extra item at index 2: 3",
+        )
+        self.assertEqual(
+            first_difference({"a": 1, "b": 2}, {"a": 1, "b": 3}),
+            "first difference at key 'b': 2 != 3",
+        )
+        self.assertEqual(
+            first_difference({"a": 1}, {"a": 1, "c": 2}),
+            "unexpected key 'c' on right",
+        )
+        self.assertEqual(first_difference({"a": 1}, {}), "key 'a' missing on right")
+
+    def test_set_repr_limits(self):
+        try:
+            set_repr_limits(maxitems=3, maxstring=5)
+            self.assertEqual(bounded_repr.render([1, 2, 3]), "[1, 2, 3]")
+            self.assertEqual(
+                bounded_repr.render([1, 2, 3, 4]), "list(len=4) [1, 2, 3, ...]"
+            )
+            self.assertEqual(bounded_repr.render("abcdefg"), "abcde...(str, len=7)")
+        finally:
+            set_repr_limits(maxitems=20, maxstring=200)
+
+
+if __name__ == "__main__":
+    unittest.main()
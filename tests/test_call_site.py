@@ -0,0 +1,74 @@
+import inspect
+import logging
+import unittest
+
+from simple_assertions import (
+    check,
+    assertion_mode,
+    show_line_no,
+    SimpleAssertions,
+    WarnVals,
+)
+from simple_assertions.helper import find_call_site
+
+
+class NestedAssertions(SimpleAssertions):
+    def is_small_int(self):
+        # extra frame between the call site and `raise_err`
+        return self.is_instance_of(int).is_in(range(10))
+
+
+def fail_deep(depth):
+    if depth:
+        return fail_deep(depth - 1)
+    line = inspect.currentframe().f_lineno + 1
+    check(1).is_equal_to(2)
+    return line
+
+
+class CallSiteCases(unittest.TestCase):
+    def warn_output(self, func):
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            with assertion_mode(level=WarnVals.OnlyLineNum):
+                line = func()
+        return logs.output[0], line
+
+    def test_line_of_check(self):
+        def func():
+            line = inspect.currentframe().f_lineno + 1
+            check(1, "one").is_equal_to(2)
+            return line
+
+        output, line = self.warn_output(func)
+        self.assertIn("[test_call_site.py:{}]: [one]".format(line), output)
+
+    def test_deep_stack(self):
+        output, line = self.warn_output(lambda: fail_deep(200))
+        self.assertIn("[test_call_site.py:{}]".format(line), output)
+
+    def test_nested_assertion_methods(self):
+        def func():
+            line = inspect.currentframe().f_lineno + 1
+            NestedAssertions().check(50).is_small_int()
+            return line
+
+        # call site is one frame further than the depth hint
+        output, line = self.warn_output(func)
+        self.assertIn("[test_call_site.py:{}]".format(line), output)
+
+    def test_call_site_not_found(self):
+        def no_keyword():
+            return find_call_site(keywords=("no_such_name",))
+
+        self.assertIsNone(no_keyword())
+        with self.assertLogs("simple_assertions.helper", logging.ERROR):
+            msg = show_line_no("err", keywords=("no_such_name",))
+        self.assertTrue(str(msg).startswith("[test_call_site.py:"))
+
+    def test_depth_hint_beyond_stack(self):
+        frame = find_call_site(depth=10000, keywords=("find_call_site",))
+        self.assertEqual(frame.f_code.co_name, "test_depth_hint_beyond_stack")
+
+
+if __name__ == "__main__":
+    unittest.main()
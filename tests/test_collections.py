@@ -0,0 +1,97 @@
+import unittest
+
+from simple_assertions import check, ItemCounts, ItemSummary
+
+
+class CollectionAssertionCases(unittest.TestCase):
+    def test_contains_all_and_only(self):
+        check([1, 2, 3], "ids").contains_all([3, 1]).contains_only((1, 2, 3, 4))
+        check("abc").contains_all("cab").contains_only("abcd")
+
+        with self.assertRaises(AssertionError) as ctx:
+            check([1, 2, 3], "ids").contains_all([1, 4, 5, 5])
+        self.assertEqual(
+            str(ctx.exception),
+            "[ids]: Expected:[[1, 2, 3]] to contain all of [[1, 4, 5, 5]], "
+            "3 missing element(s): [4, 5 (x2)]",
+        )
+
+        with self.assertRaises(AssertionError) as ctx:
+            check([1, 2, 9, 9]).contains_only({1, 2})
+        self.assertIn("2 unexpected element(s): [9 (x2)]", str(ctx.exception))
+
+    def test_no_duplicates(self):
+        check([1, 2, 3]).has_no_duplicates()
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(["a", "b", "a", "c", "a"]).has_no_duplicates()
+        self.assertIn("3 duplicated element(s): [a (x3)]", str(ctx.exception))
+
+    def test_same_elements(self):
+        check([3, 1, 2, 1]).has_same_elements_as([1, 1, 2, 3])
+
+        with self.assertRaises(AssertionError) as ctx:
+            check([1, 2, 2]).has_same_elements_as([1, 2, 3])
+        self.assertIn(
+            "1 missing element(s): [3], 1 unexpected element(s): [2]",
+            str(ctx.exception),
+        )
+
+        with self.assertRaises(AssertionError) as ctx:
+            check([1, 2]).has_same_elements_as([1, 2, 2])
+        msg = str(ctx.exception)
+        self.assertIn("1 missing element(s): [2]", msg)
+        self.assertNotIn("unexpected", msg)
+
+    def test_disjoint(self):
+        check({1, 2}).is_disjoint_from([3, 4])
+
+        with self.assertRaises(AssertionError) as ctx:
+            check([1, 2, 2]).is_disjoint_from(iter([2, 5]))
+        self.assertIn("2 common element(s): [2 (x2)]", str(ctx.exception))
+
+    def test_unhashable_elements(self):
+        rows = [{"id": 1}, {"id": 2}, [3], "x"]
+        check(rows).contains_all([[3], {"id": 2}]).has_no_duplicates()
+        check(rows).has_same_elements_as(["x", [3], {"id": 2}, {"id": 1}])
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(rows + [{"id": 1}]).has_no_duplicates()
+        self.assertIn("[{'id': 1} (x2)]", str(ctx.exception))
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(rows).contains_only([{"id": 1}, "x"])
+        self.assertIn("2 unexpected element(s)", str(ctx.exception))
+
+    def test_summary_is_bounded(self):
+        with self.assertRaises(AssertionError) as ctx:
+            check(list(range(10 ** 5))).has_same_elements_as(
+                list(range(1, 10 ** 5 + 1))
+            )
+        msg = str(ctx.exception)
+        self.assertIn("1 missing element(s): [100000]", msg)
+        self.assertIn("1 unexpected element(s): [0]", msg)
+        self.assertLess(len(msg), 1000)
+
+        summary = ItemSummary("missing", ((idx, 1) for idx in range(100)), 3)
+        self.assertEqual(str(summary), "100 missing element(s): [0, 1, 2, ... 97 more]")
+
+    def test_mapping_elements_are_keys(self):
+        check({"a": 0}).contains_only(["a"]).contains_all(["a"])
+        check({"a": 5, "b": 0}).has_no_duplicates()
+        check(["a", "b"]).has_same_elements_as({"b": 2, "a": 0})
+        with self.assertRaises(AssertionError) as ctx:
+            check({"a": 1}).contains_only(["b"])
+        self.assertIn("1 unexpected element(s): [a]", str(ctx.exception))
+        self.assertEqual(ItemCounts({"a": 5}).count("a"), 1)
+
+    def test_item_counts(self):
+        counts = ItemCounts(iter([1, [1], 1, [1], "a"]))
+        self.assertEqual(counts.count(1), 2)
+        self.assertEqual(counts.count([1]), 2)
+        self.assertEqual(counts.count({}), 0)
+        self.assertEqual(list(counts.items()), [(1, 2), ("a", 1), ([1], 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
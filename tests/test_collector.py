@@ -0,0 +1,93 @@
+import tracemalloc
+import unittest
+
+from simple_assertions import check, SimpleAssertions, FailureCollector
+from tests.test_extend import ExtendAssertions
+
+
+class FailureCollectorCases(unittest.TestCase):
+    def test_collects_and_raises_once(self):
+        with self.assertRaises(AssertionError) as ctx:
+            with FailureCollector(examples=2) as failures:
+                for i in range(10):
+                    check(i, "seq_num").is_equal_to(5)
+                    check(i, "seq_num").is_instance_of(str)
+
+        self.assertEqual(failures.total, 19)
+        groups = {group.kind: group for group in failures.groups}
+        self.assertEqual(groups["is_equal_to"].count, 9)
+        self.assertEqual(groups["is_instance_of"].count, 10)
+        self.assertEqual(
+            groups["is_equal_to"].examples,
+            [
+                "[seq_num]: Expected:[0] to be equal to [5]",
+                "[seq_num]: Expected:[1] to be equal to [5]",
+            ],
+        )
+        self.assertTrue(groups["is_equal_to"].site.startswith("[test_collector.py:"))
+
+        report = str(ctx.exception)
+        self.assertIn("19 assertion(s) failed in 2 group(s)", report)
+        self.assertIn("is_equal_to: 9 failure(s)", report)
+        self.assertIn("... 7 more", report)
+
+    def test_passing_block(self):
+        with FailureCollector() as failures:
+            check(1).is_equal_to(1)
+        self.assertEqual(failures.total, 0)
+
+    def test_no_raise_on_exit(self):
+        with FailureCollector(raise_on_exit=False) as failures:
+            check(1).is_true().is_false()
+        self.assertEqual(failures.total, 1)
+        with self.assertRaises(AssertionError):
+            failures.raise_if_failed()
+
+    def test_collect_instance(self):
+        asserter = ExtendAssertions()
+        self.assertIsNone(asserter.collector)
+
+        with self.assertRaises(AssertionError) as ctx:
+            with SimpleAssertions(collect=True) as soft:
+                soft.check(1).is_equal_to(2)
+                soft.check("a").is_numeric()
+                check_fn = soft.check
+                check_fn(None, "data").is_populated()
+
+        self.assertIn("3 assertion(s) failed in 3 group(s)", str(ctx.exception))
+        self.assertEqual(soft.collector.total, 3)
+
+    def test_bounded_groups(self):
+        failures = FailureCollector(max_groups=2, raise_on_exit=False)
+        for i in range(5):
+            failures.record("[x.py:{}]".format(i), "is_true", "err")
+        self.assertEqual(len(failures.groups), 2)
+        self.assertEqual(failures.overflow, 3)
+        self.assertIn("3 failure(s) not grouped", failures.report())
+
+    @unittest.skipUnless(
+        hasattr(tracemalloc, "reset_peak"), "tracemalloc.reset_peak needs 3.9+"
+    )
+    def test_memory_stays_flat(self):
+        def validate(count):
+            with FailureCollector(raise_on_exit=False) as failures:
+                for i in range(count):
+                    check(i, "val").is_equal_to(-1)
+            return failures
+
+        tracemalloc.start()
+        try:
+            validate(1000)
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            failures = validate(20000)
+            peak = tracemalloc.get_traced_memory()[1] - before
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(failures.total, 20000)
+        self.assertLess(peak, 64 * 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
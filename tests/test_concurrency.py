@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from simple_assertions import SimpleAssertions
+from tests.test_extend import ExtendAssertions
+
+
+class SlottedAssertions(SimpleAssertions):
+    __slots__ = ("limit",)
+
+    def __init__(self, limit, as_warn=False, logger=None):
+        super().__init__(as_warn, logger)
+        self.limit = limit
+
+    def is_below_limit(self):
+        if self.val_to_chk.val >= self.limit:
+            self.raise_err(self.compare_err_msg(self.limit, "to be below"))
+        return self
+
+
+class SharedInstanceCases(unittest.TestCase):
+    def test_check_does_not_mutate_instance(self):
+        asserter = SimpleAssertions()
+        first = asserter.check(1, "first")
+        second = asserter.check(2, "second", as_warn=True)
+
+        self.assertIsNot(first, second)
+        self.assertIsNone(asserter.val_to_chk)
+        self.assertEqual(first.val_to_chk.val, 1)
+        self.assertFalse(first.is_warn_mode)
+        self.assertTrue(second.is_warn_mode)
+        first.is_equal_to(1)
+
+    def test_subclass_state_is_kept(self):
+        asserter = ExtendAssertions()
+        asserter.threshold = 5
+        bound = asserter.check(10)
+        self.assertIsInstance(bound, ExtendAssertions)
+        self.assertEqual(bound.threshold, 5)
+        bound.is_greater_than(bound.threshold)
+
+        slotted = SlottedAssertions(limit=3)
+        slotted.check(2).is_below_limit()
+        with self.assertRaises(AssertionError):
+            slotted.check(3).is_below_limit()
+
+    def test_threads_sharing_one_instance(self):
+        check = ExtendAssertions().check
+
+        def worker(offset):
+            failures = 0
+            for i in range(offset, offset + 2000):
+                bound = check(i, "val_{}".format(i), as_warn=i % 2 == 0)
+                try:
+                    bound.is_equal_to(i).is_greater_than(i - 1)
+                    bound.is_less_than(i + 1)
+                except AssertionError:
+                    failures += 1
+                if bound.val_to_chk.desc != "val_{}".format(i):
+                    failures += 1
+            return failures
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            failures = list(pool.map(worker, range(0, 64000, 2000)))
+
+        self.assertEqual(sum(failures), 0)
+
+    def test_asyncio_tasks_sharing_one_instance(self):
+        check = SimpleAssertions().check
+
+        async def task(i):
+            bound = check(i, "task_{}".format(i))
+            await asyncio.sleep(0)
+            bound.is_equal_to(i)
+            return bound.val_to_chk.desc
+
+        async def main():
+            return await asyncio.gather(*(task(i) for i in range(500)))
+
+        descs = asyncio.run(main())
+        self.assertEqual(descs, ["task_{}".format(i) for i in range(500)])
+
+
+if __name__ == "__main__":
+    unittest.main()
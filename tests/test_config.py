@@ -0,0 +1,128 @@
+import asyncio
+import os
+import threading
+import unittest
+from unittest import mock
+
+from simple_assertions import (
+    check,
+    runtime,
+    assertion_mode,
+    FailureSink,
+    PYASSERT_ERRORS_AS_WARNINGS,
+    WarningThrottle,
+    WarnVals,
+)
+from tests.helper import SetEnvVarContext
+
+
+class RuntimeConfigCases(unittest.TestCase):
+    def test_env_var_is_cached_until_reload(self):
+        with SetEnvVarContext(PYASSERT_ERRORS_AS_WARNINGS, WarnVals.OnlyLineNum):
+            self.assertTrue(runtime.mode.warn)
+            with mock.patch.object(os, "getenv") as getenv:
+                check(1).is_equal_to(2)
+                getenv.assert_not_called()
+
+        self.assertFalse(runtime.mode.warn)
+        with self.assertRaises(AssertionError):
+            check(1).is_equal_to(2)
+
+    def test_invalid_env_value_is_ignored(self):
+        with SetEnvVarContext(PYASSERT_ERRORS_AS_WARNINGS, "yes"):
+            self.assertFalse(runtime.mode.warn)
+            self.assertIsNone(runtime.mode.level)
+
+    def test_assertion_mode_override(self):
+        with assertion_mode(warn=True):
+            check(1).is_equal_to(2)
+            with assertion_mode(warn=False):
+                with self.assertRaises(AssertionError):
+                    check(1).is_equal_to(2)
+
+        with assertion_mode(level=WarnVals.OnlyLineNum) as mode:
+            self.assertTrue(mode.warn)
+            self.assertEqual(mode.level, WarnVals.OnlyLineNum)
+            check(1).is_equal_to(2)
+
+        self.assertIs(runtime.mode, runtime.default)
+
+    def test_nested_mode_turns_off_throttle_and_sink(self):
+        throttle, sink = WarningThrottle(), FailureSink()
+        with assertion_mode(throttle=throttle, sink=sink):
+            with assertion_mode(throttle=None, sink=None) as mode:
+                self.assertIs(mode.throttle, throttle)
+                self.assertIs(mode.sink, sink)
+            with assertion_mode(throttle=False, sink=False) as mode:
+                self.assertIsNone(mode.throttle)
+                self.assertIsNone(mode.sink)
+                with self.assertLogs("simple_assertions", level="WARNING"):
+                    with assertion_mode(warn=True):
+                        check(1).is_equal_to(2)
+
+    def test_configure_checks_settings(self):
+        try:
+            mode = runtime.configure(level=WarnVals.OnlyLineNum)
+            self.assertTrue(mode.warn)
+            check(1).is_equal_to(2)
+
+            with self.assertRaises(ValueError):
+                runtime.configure(level="9")
+            self.assertEqual(runtime.default.level, WarnVals.OnlyLineNum)
+
+            runtime.configure(throttle=WarningThrottle(), sink=FailureSink())
+            mode = runtime.configure(throttle=False, sink=False)
+            self.assertIsNone(mode.throttle)
+            self.assertIsNone(mode.sink)
+            with self.assertLogs("simple_assertions", level="WARNING"):
+                check(1).is_equal_to(2)
+        finally:
+            runtime.reload()
+
+    def test_assertion_mode_invalid_level(self):
+        with self.assertRaises(ValueError):
+            with assertion_mode(level="9"):
+                pass
+
+    def test_override_is_thread_local(self):
+        entered = threading.Event()
+        release = threading.Event()
+        seen = []
+
+        def worker():
+            with assertion_mode(warn=True):
+                entered.set()
+                release.wait(5)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        entered.wait(5)
+        seen.append(runtime.mode.warn)
+        release.set()
+        t.join()
+
+        self.assertEqual(seen, [False])
+
+    def test_override_is_task_local(self):
+        async def warn_task(started, release):
+            with assertion_mode(warn=True):
+                started.set()
+                await release.wait()
+                return runtime.mode.warn
+
+        async def strict_task(started):
+            await started.wait()
+            return runtime.mode.warn
+
+        async def main():
+            started, release = asyncio.Event(), asyncio.Event()
+            warn = asyncio.ensure_future(warn_task(started, release))
+            strict = await strict_task(started)
+            release.set()
+            return await warn, strict
+
+        self.assertEqual(asyncio.run(main()), (True, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from simple_assertions import (
+    check,
+    runtime,
+    assertion_mode,
+    SimpleAssertions,
+    NO_OP,
+    PYASSERT_DISABLED,
+)
+from tests.helper import SetEnvVarContext
+from tests.test_extend import ExtendAssertions
+
+
+class DisabledModeCases(unittest.TestCase):
+    def test_check_returns_shared_noop(self):
+        with assertion_mode(disabled=True):
+            self.assertIs(check(1), NO_OP)
+            self.assertIs(check(2, "other"), check(3))
+            self.assertIs(SimpleAssertions().check(1), NO_OP)
+
+    def test_failing_assertions_are_skipped(self):
+        with assertion_mode(disabled=True):
+            check(1).is_equal_to(2).is_in([3, 4]).is_instance_of(str)
+            check(None).is_true().is_populated()
+
+    def test_subclass_methods_are_noop(self):
+        asserter = ExtendAssertions()
+        with assertion_mode(disabled=True):
+            result = asserter.check(20).is_less_than(10).is_greater_than(30)
+            self.assertIs(result, NO_OP)
+            asserter.check("abc").is_valid_msg_type()
+
+    def test_disabled_using_env_var(self):
+        with SetEnvVarContext(PYASSERT_DISABLED, "1"):
+            self.assertIs(check(1), NO_OP)
+        with self.assertRaises(AssertionError):
+            check(1).is_equal_to(2)
+
+    def test_disabled_using_configure(self):
+        runtime.configure(disabled=True)
+        try:
+            check(1).is_equal_to(2)
+        finally:
+            runtime.configure(disabled=False)
+        with self.assertRaises(AssertionError):
+            check(1).is_equal_to(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import time
+import unittest
+
+from simple_assertions import (
+    check_eventually,
+    check_eventually_async,
+    assertion_mode,
+    WarnVals,
+)
+from tests.test_extend import ExtendAssertions
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+class CheckEventuallyCases(unittest.TestCase):
+    def test_polls_until_chain_passes(self):
+        counter = Counter()
+        check_eventually(
+            lambda: min(counter(), 3), "calls", interval=0.001
+        ).is_instance_of(int).is_equal_to(3).is_populated()
+        # every assertion gets a fresh value, checked with all assertions so far
+        self.assertEqual(counter.calls, 4)
+
+    def test_failure_reports_last_value_and_attempts(self):
+        with self.assertRaises(AssertionError) as ctx:
+            check_eventually(
+                lambda: 7, "depth", timeout=0.05, interval=0.001
+            ).is_equal_to(0)
+        msg = str(ctx.exception)
+        self.assertTrue(msg.startswith("[depth]: Expected:[7] to be equal to [0]"))
+        self.assertIn("still failing after", msg)
+        self.assertIn("last value [7]", msg)
+
+    def test_exponential_backoff(self):
+        counter = Counter()
+        start = time.monotonic()
+        with self.assertRaises(AssertionError) as ctx:
+            check_eventually(
+                counter, timeout=0.2, interval=0.01, backoff=2, max_interval=0.05
+            ).is_equal_to(0)
+        # sleeps of 10, 20, 40, 50, 50... ms
+        self.assertLessEqual(counter.calls, 8)
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertIn("{} attempt(s)".format(counter.calls), str(ctx.exception))
+
+        with self.assertRaises(ValueError):
+            check_eventually(counter, backoff=0.5)
+
+    def test_subclass_assertions_and_warn_mode(self):
+        counter = Counter()
+        check_eventually(
+            counter, interval=0.001, asserter=ExtendAssertions
+        ).is_greater_than(5)
+        self.assertEqual(counter.calls, 5)
+
+        with assertion_mode(level=WarnVals.OnlyLineNum), self.assertLogs(
+            "simple_assertions", logging.WARNING
+        ) as logs:
+            check_eventually(lambda: 1, timeout=0.01).is_equal_to(2)
+        self.assertIn("test_eventually.py", logs.output[0])
+
+    def test_rejects_coroutine_getter(self):
+        async def getter():
+            return 1
+
+        with self.assertRaises(TypeError):
+            check_eventually(getter)
+
+
+class CheckEventuallyAsyncCases(unittest.TestCase):
+    def test_awaits_getter(self):
+        counter = Counter()
+
+        async def depth():
+            await asyncio.sleep(0)
+            return 5 - counter()
+
+        async def main():
+            await check_eventually_async(depth, "depth", interval=0.001).is_equal_to(
+                0
+            )
+
+        asyncio.run(main())
+        self.assertEqual(counter.calls, 5)
+
+    def test_many_checks_share_the_loop(self):
+        counter = Counter()
+
+        async def main():
+            pending = [
+                check_eventually_async(counter, interval=0.001).is_in(
+                    range(200, 10 ** 6)
+                )
+                for _ in range(100)
+            ]
+            return await asyncio.gather(*pending)
+
+        start = time.monotonic()
+        done = asyncio.run(main())
+        self.assertEqual(len(done), 100)
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_failure(self):
+        async def main():
+            await check_eventually_async(
+                lambda: "fix5", "msg_type", timeout=0.02
+            ).is_in(("fix4.1", "fix4.2"))
+
+        with self.assertRaises(AssertionError) as ctx:
+            asyncio.run(main())
+        self.assertIn("last value [fix5]", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
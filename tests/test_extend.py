@@ -1,7 +1,5 @@
 from typing import Union
 import unittest
-from contextlib import redirect_stderr
-from io import StringIO
 
 
 from simple_assertions import (
@@ -113,16 +111,20 @@ class ExtendUseCase(unittest.TestCase):
 
     def test_basic_all_as_warn_env_var_traceback(self):
         with SetEnvVarContext(PYASSERT_ERRORS_AS_WARNINGS, WarnVals.TraceBack):
-            output = StringIO()
-            with redirect_stderr(output):
+            with self.assertLogs("simple_assertions", "WARNING") as logs:
                 self.check(self.msg, "msg_type_check").is_not_instance_of(
                     (SampleMsg, int)
                 )
-            self.assertIn(
-                "traceback.print_stack()",
-                output.getvalue(),
-                "failed to find err text stderr",
-            )
+
+        record = logs.records[0]
+        self.assertIn(
+            "test_basic_all_as_warn_env_var_traceback",
+            [name for _, _, name in record.assert_stack],
+            "failed to find test in captured stack! Captured:\n {}".format(
+                record.assert_stack
+            ),
+        )
+        self.assertIn("most recent call last", record.getMessage())
 
     def test_base_selective_warn(self):
         self.check(self.msg.msg_type, "msg_type").is_equal_to("fix4.1")
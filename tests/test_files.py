@@ -0,0 +1,161 @@
+import hashlib
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+
+from simple_assertions import (
+    assertion_mode,
+    check_file,
+    FailureCollector,
+    FileAssertions,
+    NoOpAssertions,
+    WarnVals,
+)
+
+TRADES = (
+    b"id,symbol,qty\n"
+    b"1,ABC,100\n"
+    b"2,XYZ,50\r\n"
+    b"3,ABC,x\n"
+    b"5,DEF,10\n"
+    b"4,GHI,20"
+)
+
+
+class FileAssertionCases(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = self.write("trades.csv", TRADES)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp, name)
+        with open(path, "wb") as out:
+            out.write(content)
+        return path
+
+    def test_line_count(self):
+        # small chunks, lines and end of lines span chunk boundaries
+        check_file(self.path, chunk_size=3).has_line_count(6)
+        check_file(self.write("nl.csv", b"a\nb\n")).has_line_count(2)
+        check_file(self.write("empty.csv", b"")).has_line_count(0)
+
+        with self.assertRaises(AssertionError) as ctx:
+            check_file(self.path, "trades").has_line_count(5)
+        self.assertEqual(
+            str(ctx.exception),
+            "[trades]: Expected:[{}] to have 5 line(s), has 6".format(
+                self.path
+            ),
+        )
+
+    def test_contains(self):
+        check_file(self.path).contains(b"XYZ,50").contains("DEF")
+        check_file(self.path).contains(re.compile(r"^\d+,GHI", re.M))
+        check_file(self.path).contains(re.compile(rb"qty\n1,"))
+
+        with self.assertRaises(AssertionError) as ctx:
+            check_file(self.path).contains("QQQ")
+        self.assertIn("to contain [QQQ]", str(ctx.exception))
+        with self.assertRaises(AssertionError):
+            check_file(self.write("empty.csv", b"")).contains(b"a")
+
+    def test_every_line_matches(self):
+        with self.assertRaises(AssertionError) as ctx:
+            check_file(self.path).every_line_matches(r"\d+,[A-Z]+,\d+$")
+
+        err = str(ctx.exception)
+        self.assertIn("every line to match", err)
+        self.assertIn(
+            "2 line(s) not matching: line 1 (byte 0) [id,symbol,qty]", err
+        )
+        self.assertIn("line 4 (byte 34) [3,ABC,x]", err)
+        self.assertEqual(TRADES.index(b"3,ABC,x"), 34)
+
+        check_file(self.path).every_line_matches(re.compile(r"\w+,\w+,\w+$"))
+
+    def test_is_sorted_by(self):
+        with self.assertRaises(AssertionError) as ctx:
+            check_file(self.path).is_sorted_by(
+                key=lambda line: int(line.split(",")[0])
+                if line[0].isdigit()
+                else 0
+            )
+        err = str(ctx.exception)
+        self.assertIn("to be sorted ascending, 1 line(s) out of order", err)
+        self.assertIn(
+            "line 6 (byte {}) [4,GHI,20]".format(TRADES.index(b"4,")), err
+        )
+
+        sorted_path = self.write("sorted.txt", b"a\nb\nb\nc\n")
+        check_file(sorted_path).is_sorted_by()
+        check_file(sorted_path).is_sorted_by(
+            key=lambda line: -ord(line), reverse=True
+        )
+        with self.assertRaises(AssertionError):
+            check_file(sorted_path).is_sorted_by(strict=True)
+        with self.assertRaises(AssertionError):
+            check_file(sorted_path).is_sorted_by(reverse=True)
+
+    def test_is_sorted_by_undecodable_line(self):
+        path = self.write("latin1.txt", b"a\nb\xe9\nc\nb\n")
+        with self.assertRaises(AssertionError) as ctx:
+            check_file(path).is_sorted_by()
+        err = str(ctx.exception)
+        self.assertIn("1 line(s) out of order: line 4 (byte 7) [b]", err)
+        self.assertIn(
+            "1 line(s) not decodable as utf-8: line 2 (byte 2) [b\ufffd]", err
+        )
+        sorted_path = self.write("sorted-latin1.txt", b"a\nb\xe9\nc\n")
+        with self.assertRaises(AssertionError):
+            check_file(sorted_path).is_sorted_by()
+        check_file(sorted_path, encoding="latin-1").is_sorted_by()
+
+    def test_checksum(self):
+        digest = hashlib.sha256(TRADES).hexdigest()
+        check_file(self.path, chunk_size=4).has_checksum(digest)
+        check_file(self.path).has_checksum(
+            hashlib.md5(TRADES).hexdigest().upper(), algorithm="md5"
+        )
+        with self.assertRaises(AssertionError) as ctx:
+            check_file(self.path).has_checksum("00")
+        self.assertIn(
+            "to have sha256 [00], has [{}]".format(digest), str(ctx.exception)
+        )
+
+    def test_unreadable_file(self):
+        missing = os.path.join(self.tmp, "missing.csv")
+        with self.assertRaises(AssertionError) as ctx:
+            check_file(missing).has_line_count(1)
+        self.assertIn("to be a readable file", str(ctx.exception))
+
+        with self.assertRaises(AssertionError):
+            with FailureCollector() as failures:
+                check_file(missing).has_line_count(1).contains(b"a")
+        self.assertEqual(failures.total, 2)
+
+    def test_warn_and_disabled_modes(self):
+        with assertion_mode(warn=True):
+            with self.assertLogs("simple_assertions", level="WARNING") as logs:
+                check_file(self.path).has_line_count(1).contains(b"ABC")
+        self.assertEqual(len(logs.output), 1)
+        line = sys._getframe().f_lineno - 2
+        self.assertIn("[test_files.py:{}]".format(line), logs.output[0])
+
+        with assertion_mode(level=WarnVals.OnlyLineNum):
+            with self.assertLogs("simple_assertions", level="WARNING") as logs:
+                check_file(self.path).contains(b"QQQ")
+        line = sys._getframe().f_lineno - 1
+        self.assertIn("[test_files.py:{}]".format(line), logs.output[0])
+
+        with assertion_mode(disabled=True):
+            asserter = check_file(self.path)
+            self.assertIsInstance(asserter, NoOpAssertions)
+            asserter.has_line_count(1).is_sorted_by()
+
+        self.assertIsInstance(check_file(self.path), FileAssertions)
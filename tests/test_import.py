@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# cumulative import time of the package, with a warm bytecode cache
+IMPORT_BUDGET_US = 50000
+# never imported by `import simple_assertions`
+HEAVY_MODULES = (
+    "logging",
+    "inspect",
+    "traceback",
+    "typing",
+    "asyncio",
+    "concurrent.futures",
+    "json",
+    "tracemalloc",
+    "linecache",
+    "numpy",
+)
+
+
+def run_python(*args, cache_dir):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (root, env.get("PYTHONPATH")))
+    )
+    return subprocess.run(
+        [sys.executable] + list(args),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+
+
+class ImportCases(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.mkdtemp()
+        # compile once, the budget is for importing, not compiling
+        run_python("-c", "import simple_assertions", cache_dir=self.cache_dir)
+
+    def test_import_time_budget(self):
+        result = run_python(
+            "-X",
+            "importtime",
+            "-c",
+            "import simple_assertions",
+            cache_dir=self.cache_dir,
+        )
+        # "import time: self [us] | cumulative | imported package"
+        for line in result.stderr.splitlines():
+            _, cumulative, name = line.split("|")
+            if name.strip() == "simple_assertions":
+                self.assertLess(int(cumulative), IMPORT_BUDGET_US, result.stderr)
+                break
+        else:
+            self.fail("no import time reported\n" + result.stderr)
+
+    def test_no_heavy_modules_or_side_effects(self):
+        result = run_python(
+            "-c",
+            "import sys; before = set(sys.modules); import simple_assertions;"
+            "print(' '.join(sorted(set(sys.modules) - before)))",
+            cache_dir=self.cache_dir,
+        )
+        loaded = set(result.stdout.split())
+        self.assertIn("simple_assertions", loaded)
+        self.assertEqual(sorted(loaded.intersection(HEAVY_MODULES)), [])
+
+        result = run_python(
+            "-c",
+            "import logging, simple_assertions;"
+            "print(len(logging.getLogger().handlers))",
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(result.stdout.strip(), "0")
+
+    def test_lazy_attributes(self):
+        result = run_python(
+            "-c",
+            "import sys, simple_assertions as sa;"
+            "assert 'simple_assertions.plan' not in sys.modules;"
+            "sa.compile_check().is_equal_to(1)(1);"
+            "assert 'simple_assertions.plan' in sys.modules;"
+            "assert 'check_stream' in dir(sa);"
+            "print(sa.check_stream.__module__)",
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(result.stdout.strip(), "simple_assertions.stream")
+
+        import simple_assertions
+
+        with self.assertRaises(AttributeError):
+            simple_assertions.no_such_thing
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import logging
+import pickle
+import unittest
+
+from simple_assertions import check, SimpleAssertions, LazyMessage
+from tests.test_extend import ExtendAssertions
+
+
+class CountingStr:
+    def __init__(self, val):
+        self.val = val
+        self.rendered = 0
+
+    def __str__(self):
+        self.rendered += 1
+        return str(self.val)
+
+    def __eq__(self, other):
+        return isinstance(other, CountingStr) and self.val == other.val
+
+    __hash__ = object.__hash__
+
+
+class LazyMessageCases(unittest.TestCase):
+    def setUp(self) -> None:
+        self.quiet_logger = logging.getLogger("tests.lazy.quiet")
+        self.quiet_logger.setLevel(logging.ERROR)
+
+    def test_not_rendered_until_read(self):
+        val = CountingStr("abc")
+        with self.assertRaises(AssertionError) as ctx:
+            check(val, "val").is_equal_to("xyz")
+        self.assertEqual(val.rendered, 0)
+
+        self.assertEqual(str(ctx.exception), "[val]: Expected:[abc] to be equal to [xyz]")
+        str(ctx.exception)
+        self.assertEqual(val.rendered, 1)
+
+    def test_not_rendered_for_filtered_warnings(self):
+        val = CountingStr(1)
+        asserter = SimpleAssertions(as_warn=True, logger=self.quiet_logger)
+        asserter.check(val, "val").is_in([2, 3]).is_false().is_instance_of(int)
+        self.assertEqual(val.rendered, 0)
+
+    def test_rendered_when_logged(self):
+        val = CountingStr(1)
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            check(val, "val", as_warn=True).is_equal_to(2)
+        self.assertIn("Expected:[1] to be equal to [2]", logs.output[0])
+        self.assertEqual(val.rendered, 1)
+
+    def test_subclass_messages(self):
+        with self.assertRaises(AssertionError) as ctx:
+            ExtendAssertions().check(20, "seq").is_less_than(10)
+        self.assertEqual(
+            str(ctx.exception), "[seq]: Expected:[20] to be less than [10]"
+        )
+
+    def test_behaves_like_str(self):
+        msg = LazyMessage("Expected:<{}> {}", 1, "to be true")
+        self.assertEqual(msg, "Expected:<1> to be true")
+        self.assertIn("to be true", msg)
+        self.assertEqual("err: " + msg, "err: Expected:<1> to be true")
+        self.assertEqual("{:>25}".format(msg), "  Expected:<1> to be true")
+        self.assertEqual(pickle.loads(pickle.dumps(msg)), str(msg))
+
+        # str methods, as used by subclasses post-processing messages
+        self.assertEqual(msg.replace("<1>", "<2>"), "Expected:<2> to be true")
+        self.assertTrue(msg.startswith("Expected"))
+        self.assertEqual(msg.upper(), "EXPECTED:<1> TO BE TRUE")
+        self.assertEqual(msg[:9], "Expected:")
+        self.assertEqual(LazyMessage("{}%s", "a") % "b", "ab")
+        with self.assertRaises(AttributeError):
+            msg.no_such_method()
+
+    def test_subclass_post_processing(self):
+        class Shouting(SimpleAssertions):
+            def is_positive(self):
+                if self.val_to_chk.val <= 0:
+                    msg = self.value_err_msg("to be positive")
+                    self.raise_err(msg.replace("Expected", "EXPECTED").strip())
+                return self
+
+        with self.assertRaises(AssertionError) as ctx:
+            Shouting().check(-1).is_positive()
+        self.assertEqual(str(ctx.exception), "EXPECTED:<-1> to be positive")
+
+    def test_logger_without_is_enabled_for(self):
+        class PrintLogger:
+            def __init__(self):
+                self.lines = []
+
+            def warning(self, msg, *args):
+                self.lines.append(str(msg))
+
+        logger = PrintLogger()
+        SimpleAssertions(as_warn=True, logger=logger).check(1).is_equal_to(2)
+        self.assertEqual(len(logger.lines), 1)
+        self.assertIn("Expected:[1] to be equal to [2]", logger.lines[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
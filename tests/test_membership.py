@@ -0,0 +1,95 @@
+import unittest
+from collections import deque
+
+from simple_assertions import (
+    check,
+    assertion_mode,
+    MembershipIndex,
+    membership_index,
+)
+
+
+class Unhashable:
+    __hash__ = None
+
+    def __init__(self, val):
+        self.val = val
+
+    def __eq__(self, other):
+        return self.val == getattr(other, "val", other)
+
+
+class MembershipIndexCases(unittest.TestCase):
+    def setUp(self) -> None:
+        membership_index.clear()
+
+    def test_same_result_as_in(self):
+        index = MembershipIndex(min_size=1)
+        nan = float("nan")
+        values = [1, 2.0, "a", (1, 2), None, nan, True]
+        for container in (values, tuple(values), deque(values)):
+            for val in (1, 1.0, 2, "a", "b", (1, 2), None, nan, float("nan"), 0, [1]):
+                self.assertEqual(
+                    index.contains(container, val),
+                    val in container,
+                    "{!r} in {!r}".format(val, container),
+                )
+
+    def test_index_is_cached_and_refreshed(self):
+        index = MembershipIndex(min_size=1)
+        ids = list(range(100))
+        self.assertTrue(index.contains(ids, 5))
+        self.assertEqual(len(index), 1)
+        self.assertTrue(index.contains(ids, 6))
+        self.assertEqual(len(index), 1)
+
+        ids.append(1000)
+        self.assertTrue(index.contains(ids, 1000))
+        ids[-1] = 2000
+        self.assertTrue(index.contains(ids, 2000))
+        self.assertFalse(index.contains(ids, 1000))
+
+    def test_lru_eviction(self):
+        index = MembershipIndex(maxsize=2, min_size=1)
+        first, second, third = [1], [2], [3]
+        index.contains(first, 1)
+        index.contains(second, 2)
+        index.contains(first, 1)
+        index.contains(third, 3)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(
+            [e.container for e in index._entries.values()], [first, third]
+        )
+
+    def test_unhashable_items_fall_back_to_scan(self):
+        index = MembershipIndex(min_size=1)
+        items = [Unhashable(1), Unhashable(2)]
+        self.assertTrue(index.contains(items, 2))
+        self.assertFalse(index.contains(items, 3))
+        self.assertTrue(index.contains([1, 2], Unhashable(2)))
+
+    def test_small_and_non_indexable_containers_are_scanned(self):
+        self.assertTrue(membership_index.contains("abc", "bc"))
+        self.assertTrue(membership_index.contains({1: 2}, 1))
+        self.assertTrue(membership_index.contains([1, 2], 2))
+        self.assertEqual(len(membership_index), 0)
+
+    def test_assertions_use_index_when_enabled(self):
+        allowed = list(range(1000))
+        with assertion_mode(index_membership=True):
+            check(10).is_in(allowed)
+            check(1.0).is_in(allowed)
+            check(-1).is_not_in(allowed)
+            check(999).is_equal_or_in_seq(allowed)
+            with self.assertRaises(AssertionError):
+                check(1000).is_in(allowed)
+            with self.assertRaises(AssertionError):
+                check(True).is_not_in(allowed)
+        self.assertEqual(len(membership_index), 1)
+
+        check(5).is_in(list(range(1000)))
+        self.assertEqual(len(membership_index), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
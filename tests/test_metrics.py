@@ -0,0 +1,115 @@
+import logging
+import sys
+import threading
+import unittest
+
+from simple_assertions import (
+    check,
+    assertion_mode,
+    AssertionMetrics,
+    FailureCollector,
+    Histogram,
+    SimpleAssertions,
+)
+from tests.test_extend import ExtendAssertions
+
+
+class AssertionMetricsCases(unittest.TestCase):
+    def setUp(self) -> None:
+        self.metrics = AssertionMetrics()
+        self.addCleanup(self.metrics.disable)
+
+    def test_counts_per_assertion_and_call_site(self):
+        self.metrics.enable()
+        with FailureCollector(raise_on_exit=False) as collector:
+            line = sys._getframe().f_lineno + 2
+            for val in range(10):
+                check(val, "seq_num").is_instance_of(int).is_in((1, 2, 3))
+            check(5).is_in((1, 2, 3))
+
+        stats = self.metrics.stats()
+        site = "[test_metrics.py:{}]".format(line)
+        self.assertEqual(stats[("is_instance_of", site)]["passed"], 10)
+        self.assertEqual(stats[("is_in", site)]["passed"], 3)
+        self.assertEqual(stats[("is_in", site)]["failed"], 7)
+        self.assertEqual(stats[("is_in", site)]["evaluation"]["count"], 10)
+        self.assertEqual(stats[("is_in", site)]["emission"]["count"], 7)
+        other = "[test_metrics.py:{}]".format(line + 1)
+        self.assertEqual(stats[("is_in", other)]["failed"], 1)
+        # failures are still reported as usual
+        self.assertEqual(collector.total, 8)
+        self.assertEqual(collector.groups[0].kind, "is_in")
+
+    def test_raised_and_warned_failures(self):
+        self.metrics.enable()
+
+        def failing():
+            check(1).is_equal_to(2)
+
+        with self.assertRaises(AssertionError):
+            failing()
+        with assertion_mode(warn=True), self.assertLogs(
+            "simple_assertions", logging.WARNING
+        ):
+            failing()
+
+        (stats,) = self.metrics.stats().values()
+        self.assertEqual(stats["failed"], 2)
+        self.assertGreater(stats["emission"]["total_ns"], 0)
+
+    def test_disable_restores_methods(self):
+        original = SimpleAssertions.is_equal_to
+        self.metrics.enable()
+        self.assertIsNot(SimpleAssertions.is_equal_to, original)
+        self.assertTrue(self.metrics.enabled)
+        self.metrics.disable()
+        self.assertIs(SimpleAssertions.is_equal_to, original)
+        self.assertFalse(self.metrics.enabled)
+
+        check(1).is_equal_to(1)
+        self.assertEqual(self.metrics.stats(), {})
+
+    def test_subclasses_and_threads(self):
+        self.metrics.enable(SimpleAssertions, ExtendAssertions)
+        asserter = ExtendAssertions()
+
+        def run():
+            for val in range(100):
+                asserter.check(val).is_less_than(1000).is_equal_to(val)
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = {name: s for (name, _), s in self.metrics.stats().items()}
+        self.assertEqual(stats["is_less_than"]["passed"], 400)
+        self.assertEqual(stats["is_equal_to"]["passed"], 400)
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.stats(), {})
+
+        # the emptied per thread counters are reused after a reset
+        registered = len(self.metrics._thread_stats)
+        for _ in range(3):
+            asserter.check(1).is_equal_to(1)
+            self.metrics.reset()
+        asserter.check(1).is_equal_to(1)
+        self.assertEqual(len(self.metrics._thread_stats), registered + 1)
+        stats = {name: s for (name, _), s in self.metrics.stats().items()}
+        self.assertEqual(stats["is_equal_to"]["passed"], 1)
+
+    def test_histogram(self):
+        histogram = Histogram()
+        for ns in (100, 100, 100, 5000):
+            histogram.add(ns)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 4)
+        self.assertEqual(snapshot["p50_ns"], 128)
+        self.assertEqual(snapshot["p99_ns"], 8192)
+        self.assertEqual(snapshot["mean_ns"], 1325)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+from simple_assertions import (
+    check_stream,
+    compile_check,
+    validate_parallel,
+)
+from tests.test_extend import ExtendAssertions, SampleMsg
+
+
+def records(count):
+    return [
+        SampleMsg("fix3" if idx % 7 == 0 else "fix4.2", idx, None)
+        for idx in range(count)
+    ]
+
+
+class ValidateParallelCases(unittest.TestCase):
+    def setUp(self) -> None:
+        # subclass assertion, runs on the asserter in the worker processes
+        self.rules = {
+            "msg_type": compile_check(ExtendAssertions).is_valid_msg_type(),
+            "seq_num": compile_check(ExtendAssertions).is_less_than(95),
+        }
+
+    def test_matches_stream_in_input_order(self):
+        expected = list(check_stream(records(100), self.rules))
+        result = validate_parallel(
+            records(100), self.rules, workers=2, chunksize=9
+        )
+
+        self.assertEqual(
+            [rec.index for rec in result.failed], [rec.index for rec in expected]
+        )
+        self.assertEqual(
+            [rec.record.seq_num for rec in result.failed],
+            [rec.index for rec in expected],
+        )
+        self.assertEqual(
+            [str(rec.failures[0].messages[0]) for rec in result.failed],
+            [str(rec.failures[0].messages[0]) for rec in expected],
+        )
+        self.assertEqual(result.records, 100)
+        self.assertEqual(result.failed_records, 19)
+        self.assertEqual(result.fields["msg_type"].failed, 15)
+        self.assertEqual(result.fields["seq_num"].failed, 5)
+        self.assertEqual(result.fields["seq_num"].checked, 100)
+
+    def test_single_worker_and_generators(self):
+        result = validate_parallel(
+            iter(records(30)), self.rules, workers=1, chunksize=4
+        )
+        self.assertEqual([rec.index for rec in result.failed], [0, 7, 14, 21, 28])
+        with self.assertRaises(AssertionError) as ctx:
+            result.raise_if_failed()
+        self.assertIn("5 of 30 record(s) failed", str(ctx.exception))
+
+    def test_passing_and_invalid_input(self):
+        result = validate_parallel(records(10)[1:7], self.rules, workers=2)
+        self.assertEqual(result.failed, [])
+        result.raise_if_failed()
+
+        with self.assertRaises(TypeError):
+            validate_parallel([], {"seq_num": int})
+        with self.assertRaises(ValueError):
+            validate_parallel([], self.rules, chunksize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
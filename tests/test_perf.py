@@ -0,0 +1,72 @@
+import logging
+import time
+import unittest
+
+from simple_assertions import (
+    check,
+    assertion_mode,
+    time_calls,
+    trace_allocations,
+    TimingStats,
+)
+from simple_assertions.perf import percentile
+
+
+class PerfAssertionCases(unittest.TestCase):
+    def test_completes_within(self):
+        calls = []
+        check(lambda: calls.append(1)).completes_within(
+            ms=50, repeat=10, warmup=2
+        )
+        self.assertEqual(len(calls), 12)
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(lambda: time.sleep(0.002), "sleep").completes_within(
+                ms=0.5, repeat=3, percentile=90
+            )
+        msg = str(ctx.exception)
+        self.assertIn(
+            "[sleep]: Expected: [<lambda>] to complete within 0.5 ms at p90", msg
+        )
+        self.assertIn("median", msg)
+        self.assertIn("over 3 run(s)", msg)
+
+    def test_allocates_at_most(self):
+        check(lambda: None).allocates_at_most(bytes=1024)
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(lambda: bytearray(10 ** 6)).allocates_at_most(bytes=10 ** 5)
+        self.assertIn(
+            "to allocate at most 100,000 bytes, peak 1,00", str(ctx.exception)
+        )
+
+    def test_not_callable(self):
+        with self.assertRaises(AssertionError) as ctx:
+            check(5).completes_within(ms=1)
+        self.assertIn("to be callable", str(ctx.exception))
+
+    def test_warn_mode(self):
+        with assertion_mode(warn=True), self.assertLogs(
+            "simple_assertions", logging.WARNING
+        ) as logs:
+            check(lambda: bytearray(10 ** 6)).allocates_at_most(bytes=1)
+        self.assertIn("peak", logs.output[0])
+
+    def test_stats(self):
+        stats = time_calls(lambda: None, repeat=20, number=10, warmup=0, pct=50)
+        self.assertEqual(len(stats.samples), 20)
+        self.assertEqual(stats.at_percentile, stats.median)
+
+        samples = TimingStats([0.004, 0.001, 0.003, 0.002])
+        self.assertEqual(samples.min, 0.001)
+        self.assertEqual(samples.median, 0.002)
+        self.assertEqual(percentile(samples.samples, 99), 0.004)
+        self.assertEqual(percentile(samples.samples, 0), 0.001)
+
+        allocated = trace_allocations(lambda: [0] * 10 ** 5)
+        self.assertGreater(allocated.peak, 10 ** 5 * 8 - 1)
+        self.assertLess(allocated.retained, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import inspect
+import logging
+import pickle
+import unittest
+
+from simple_assertions import (
+    compile_check,
+    assertion_mode,
+    FailureCollector,
+    WarnVals,
+)
+from tests.test_extend import ExtendAssertions
+
+
+class CheckPlanCases(unittest.TestCase):
+    def setUp(self) -> None:
+        self.msg_type = compile_check(desc="msg_type").is_instance_of(
+            str
+        ).is_in(("fix4.1", "fix4.2"))
+
+    def test_passing_values(self):
+        for val in ("fix4.1", "fix4.2"):
+            self.msg_type(val)
+
+        plan = (
+            compile_check()
+            .is_populated()
+            .is_true()
+            .is_not_in([0, 5])
+            .is_not_equal_to(3)
+            .is_equal_or_in_seq(1)
+            .is_numeric()
+            .is_not_instance_of(str)
+        )
+        plan(1)
+        plan(1.0)
+
+    def test_failures_match_fluent_api(self):
+        with self.assertRaises(AssertionError) as ctx:
+            self.msg_type("fix5")
+        self.assertEqual(
+            str(ctx.exception), "[msg_type]: Expected:[fix5] to be in [('fix4.1', 'fix4.2')]"
+        )
+
+        with self.assertRaises(AssertionError) as ctx:
+            self.msg_type(41, "other")
+        self.assertEqual(
+            str(ctx.exception), "[other]: Expected: [int] to be of type [<class 'str'>]"
+        )
+
+    def test_same_semantics_as_methods(self):
+        compile_check().is_in([1, 2])(1.0)
+        compile_check().is_in([1, [2]])([2])
+        compile_check().is_in([[1], [2]])([2])
+        compile_check().is_in("abc")("bc")
+        compile_check().is_numeric()("10")
+        with self.assertRaises(AssertionError):
+            compile_check().is_not_in({1: "a"})(1)
+        with self.assertRaises(AssertionError):
+            compile_check().is_numeric()("a")
+        with self.assertRaises(TypeError):
+            compile_check().is_instance_of([str])("a")
+
+    def test_subclass_assertions(self):
+        plan = compile_check(ExtendAssertions).is_instance_of(int).is_greater_than(
+            5
+        ).is_less_than(15)
+        plan(10)
+        with self.assertRaises(AssertionError):
+            plan(20)
+
+        with self.assertRaises(AttributeError):
+            compile_check().is_greater_than(5)
+
+    def test_warn_mode_and_call_site(self):
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            with assertion_mode(level=WarnVals.OnlyLineNum):
+                line = inspect.currentframe().f_lineno + 1
+                self.msg_type(1)
+
+        # both assertions fail and are logged for the line running the plan
+        self.assertEqual(len(logs.output), 2)
+        for output in logs.output:
+            self.assertIn("[test_plan.py:{}]".format(line), output)
+
+        self.msg_type(1, as_warn=True)
+
+    def test_collector_and_disabled(self):
+        with FailureCollector(raise_on_exit=False) as failures:
+            for val in ("fix4.1", "x", "y", 1):
+                self.msg_type(val)
+        self.assertEqual(failures.total, 4)
+
+        with assertion_mode(disabled=True):
+            self.msg_type(1)
+
+    def test_plans_are_immutable_and_picklable(self):
+        base = compile_check().is_instance_of(int)
+        small = base.is_in(range(10))
+        self.assertEqual(len(base.steps), 1)
+        self.assertEqual(len(small.steps), 2)
+
+        small(5)
+        restored = pickle.loads(pickle.dumps(small))
+        restored(5)
+        with self.assertRaises(AssertionError):
+            restored(50)
+
+        restored = pickle.loads(pickle.dumps(compile_check(ExtendAssertions).is_less_than(3)))
+        with self.assertRaises(AssertionError):
+            restored(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import sys
+import unittest
+
+from simple_assertions import (
+    check,
+    runtime,
+    assertion_mode,
+    SimpleAssertions,
+    NoOpAssertions,
+    ProbabilitySampler,
+    EveryNthSampler,
+    AdaptiveSampler,
+    parse_sampler,
+    PYASSERT_SAMPLING,
+    PYASSERT_SAMPLING_SEED,
+)
+from tests.helper import SetEnvVarContext
+
+
+def failing_checks(count, asserter=None):
+    """ no. of failing checks evaluated out of `count`, all from one call site"""
+    evaluated = 0
+    for _ in range(count):
+        chk = asserter.check if asserter else check
+        try:
+            chk(1).is_equal_to(2)
+        except AssertionError:
+            evaluated += 1
+    return evaluated
+
+
+class SamplerCases(unittest.TestCase):
+    def test_probability_is_deterministic_when_seeded(self):
+        def decisions(sampler):
+            return [sampler.sample(sys._getframe()) for _ in range(200)]
+
+        first = decisions(ProbabilitySampler(0.1, seed=7))
+        self.assertEqual(first, decisions(ProbabilitySampler(0.1, seed=7)))
+        self.assertTrue(5 < sum(first) < 40)
+        self.assertFalse(any(decisions(ProbabilitySampler(0))))
+        self.assertTrue(all(decisions(ProbabilitySampler(1))))
+
+    def test_every_nth_counts_per_call_site(self):
+        with assertion_mode(sampler=EveryNthSampler(10)):
+            self.assertEqual(failing_checks(100), 10)
+            # other call site, own counter
+            with self.assertRaises(AssertionError):
+                check(1).is_equal_to(2)
+
+    def test_adaptive_backs_off_on_hot_sites(self):
+        sampler = AdaptiveSampler(first=10, max_interval=50)
+        with assertion_mode(sampler=sampler):
+            evaluated = failing_checks(10000)
+        # first 10, then ~10 per doubling of calls, then every 50th
+        self.assertTrue(10 < evaluated < 300, evaluated)
+
+        frame = sys._getframe()
+        cold = AdaptiveSampler(first=10)
+        self.assertTrue(all(cold.sample(frame) for _ in range(10)))
+
+    def test_unsampled_check_is_noop(self):
+        with assertion_mode(sampler=0):
+            self.assertIsInstance(check(1), NoOpAssertions)
+            check(1).is_equal_to(2).is_false()
+
+            class Custom(SimpleAssertions):
+                pass
+
+            self.assertIsInstance(Custom().check(1), NoOpAssertions)
+            self.assertEqual(failing_checks(10, Custom()), 0)
+
+        with assertion_mode(sampler=0):
+            with assertion_mode(sampler=False):
+                self.assertEqual(failing_checks(5), 5)
+
+    def test_parse_sampler(self):
+        self.assertEqual(parse_sampler("0.25").rate, 0.25)
+        self.assertEqual(parse_sampler("every:100").n, 100)
+        adaptive = parse_sampler("adaptive:50:10000")
+        self.assertEqual((adaptive.first, adaptive.max_interval), (50, 10000))
+        self.assertIsNone(parse_sampler(""))
+        for spec in ("every", "every:0", "2", "adaptive:x", "sometimes"):
+            with self.assertRaises(ValueError):
+                parse_sampler(spec)
+
+    def test_configure(self):
+        try:
+            runtime.configure(sampler="every:4")
+            self.assertEqual(runtime.mode.sampler.n, 4)
+            self.assertEqual(failing_checks(8), 2)
+            runtime.configure(sampler=0.0)
+            self.assertEqual(runtime.mode.sampler.rate, 0.0)
+            self.assertEqual(failing_checks(5), 0)
+            runtime.configure(sampler=False)
+            self.assertIsNone(runtime.mode.sampler)
+            self.assertEqual(failing_checks(5), 5)
+        finally:
+            runtime.reload()
+
+    def test_env_var(self):
+        with SetEnvVarContext(PYASSERT_SAMPLING, "every:4"):
+            self.assertEqual(runtime.mode.sampler.n, 4)
+            self.assertEqual(failing_checks(8), 2)
+
+        self.assertIsNone(runtime.mode.sampler)
+        with SetEnvVarContext(PYASSERT_SAMPLING, "often"):
+            self.assertIsNone(runtime.mode.sampler)
+
+        def env_decisions():
+            with SetEnvVarContext(PYASSERT_SAMPLING, "0.5"):
+                sampler = runtime.mode.sampler
+                return [sampler.sample(sys._getframe()) for _ in range(50)]
+
+        with SetEnvVarContext(PYASSERT_SAMPLING_SEED, "42"):
+            self.assertEqual(env_decisions(), env_decisions())
@@ -0,0 +1,120 @@
+import unittest
+
+from simple_assertions import (
+    check,
+    assertion_mode,
+    SimpleAssertions,
+    FailureCollector,
+    compile_check,
+    compile_schema,
+    optional,
+)
+from simple_assertions import schema as schema_module
+
+
+class FixAssertions(SimpleAssertions):
+    def is_fix_version(self):
+        if not str(self.val_to_chk.val).startswith("FIX."):
+            self.raise_err(self.value_err_msg("to be a FIX version"))
+        return self
+
+
+ORDER = {
+    "id": int,
+    "side": compile_check().is_in(("buy", "sell")),
+    "header": {"version": compile_check(FixAssertions).is_fix_version()},
+    "legs": [{"qty": compile_check().is_numeric(), optional("note"): str}],
+    "meta": None,
+}
+
+VALID = {
+    "id": 7,
+    "side": "buy",
+    "header": {"version": "FIX.4.4"},
+    "legs": [{"qty": 10}, {"qty": 2.5, "note": "odd lot"}],
+    "meta": {"anything": ["goes"]},
+    "extra": "keys are not checked",
+}
+
+
+class SchemaCases(unittest.TestCase):
+    def test_valid_payload(self):
+        check(VALID, "order").matches_schema(ORDER)
+
+    def test_all_failures_with_paths(self):
+        payload = {
+            "id": "7",
+            "side": "hold",
+            "header": {"version": "4.4"},
+            "legs": [{"qty": "ten", "note": 1}, {}, 5],
+        }
+        with self.assertRaises(AssertionError) as ctx:
+            check(payload, "order").matches_schema(ORDER)
+
+        err = str(ctx.exception)
+        self.assertTrue(err.startswith("[order]: Expected:["), err)
+        self.assertIn("to match schema, 8 failure(s): [id]: ", err)
+        for expected in (
+            "[side]: Expected:[hold] to be in",
+            "[header.version]: Expected:<4.4> to be a FIX version",
+            "[legs[0].qty]: Expected:<ten> to be numeric",
+            "[legs[0].note]: ",
+            "[legs[1].qty]: Expected key to be present",
+            "[legs[2]]: Expected:[5] to be a mapping",
+            "[meta]: Expected key to be present",
+        ):
+            self.assertIn(expected, err)
+
+    def test_bounded_output(self):
+        schema = {"rows": [{"qty": int}]}
+        payload = {"rows": [{"qty": str(idx)} for idx in range(1000)]}
+        failures = compile_schema(schema).failures(payload, limit=3)
+        self.assertEqual(failures.count, 1000)
+        self.assertEqual(len(list(failures)), 3)
+        self.assertTrue(str(failures).endswith(", ... 997 more"))
+
+        with self.assertRaises(AssertionError) as ctx:
+            check(payload).matches_schema(schema)
+        self.assertLess(len(str(ctx.exception)), 2000)
+
+    def test_compiled_once_per_schema(self):
+        validator = compile_schema(ORDER)
+        self.assertIs(compile_schema(ORDER), validator)
+        self.assertIs(compile_schema(validator), validator)
+        self.assertIsNot(compile_schema(dict(ORDER)), validator)
+        check(VALID).matches_schema(validator)
+
+        # nothing is allocated for matching payloads
+        self.assertIsNone(validator.validate(VALID))
+        self.assertEqual(validator.validate({}).count, 5)
+        self.assertFalse(validator.failures(VALID))
+
+    def test_cache_is_bounded(self):
+        cache = schema_module._ValidatorCache(maxsize=3)
+        schemas = [{"id": int} for _ in range(5)]
+        validators = [cache.get(schema, None) for schema in schemas]
+        self.assertIs(cache.get(schemas[4], None), validators[4])
+        self.assertIsNot(cache.get(schemas[0], None), validators[0])
+        self.assertIsNot(cache.get(schemas[0], SimpleAssertions), validators[0])
+        self.assertEqual(cache._size, 3)
+        cache.clear()
+        self.assertEqual((cache._size, cache._entries), (0, {}))
+
+    def test_warn_mode_and_collector(self):
+        with assertion_mode(warn=True):
+            with self.assertLogs("simple_assertions", level="WARNING") as logs:
+                check({"id": None}).matches_schema({"id": int})
+        self.assertIn("[id]: ", logs.output[0])
+
+        with self.assertRaises(AssertionError):
+            with FailureCollector() as failures:
+                check([]).matches_schema({"id": int})
+                check({}).matches_schema({"id": int})
+        self.assertEqual(failures.total, 2)
+        self.assertEqual(failures.groups[0].kind, "matches_schema")
+
+    def test_invalid_schema(self):
+        with self.assertRaises(TypeError):
+            compile_schema({"legs": [int, str]})
+        with self.assertRaises(TypeError):
+            compile_schema({"id": "int"})
@@ -0,0 +1,171 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+from simple_assertions import (
+    check,
+    assertion_mode,
+    FailureSink,
+    JsonlQueueSink,
+    WarnVals,
+)
+from simple_assertions import sink as sink_module
+
+
+class ListSink(FailureSink):
+    def __init__(self):
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class BlockedFile(io.StringIO):
+    """ file whose writes wait until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait()
+        return super().write(text)
+
+
+class FailureSinkCases(unittest.TestCase):
+    def test_sink_replaces_logger(self):
+        sink = ListSink()
+        with assertion_mode(warn=True, sink=sink):
+            line = sys._getframe().f_lineno + 1
+            check("fix5", "msg_type").is_in(("fix4.1", "fix4.2"))
+
+        record = sink.records[0].as_dict()
+        self.assertEqual(record["site"], "[test_sink.py:{}]".format(line))
+        self.assertEqual(record["assertion"], "is_in")
+        self.assertEqual(record["desc"], "msg_type")
+        self.assertEqual(record["value"], "fix5")
+        self.assertIn("Expected:[fix5] to be in", record["message"])
+        self.assertNotIn("stack", record)
+
+    def test_not_used_without_warn_mode(self):
+        sink = ListSink()
+        with assertion_mode(sink=sink), self.assertRaises(AssertionError):
+            check(1).is_equal_to(2)
+        self.assertEqual(sink.records, [])
+
+    def test_traceback_mode_adds_stack(self):
+        sink = ListSink()
+        with assertion_mode(level=WarnVals.TraceBack, sink=sink):
+            check(1).is_equal_to(2)
+        stack = sink.records[0].as_dict()["stack"]
+        self.assertTrue(any("test_sink.py" in frame for frame in stack))
+
+
+class FullDisk(io.StringIO):
+    """ file whose flushes fail"""
+
+    def flush(self):
+        raise OSError(28, "No space left on device")
+
+
+class JsonlQueueSinkCases(unittest.TestCase):
+    def test_writes_jsonl_in_batches(self):
+        path = os.path.join(tempfile.mkdtemp(), "failures.jsonl")
+        sink = JsonlQueueSink(path, batch_size=10, flush_interval=60)
+        with assertion_mode(warn=True, sink=sink):
+            for idx in range(25):
+                check(idx, "seq_num").is_equal_to(-1)
+        sink.flush()
+
+        with open(path) as fp:
+            records = [json.loads(line) for line in fp]
+        self.assertEqual(
+            [rec["value"] for rec in records], [str(i) for i in range(25)]
+        )
+        self.assertEqual(records[0]["desc"], "seq_num")
+        self.assertIn("timestamp", records[0])
+        self.assertEqual(
+            sink.stats(), {"queued": 0, "written": 25, "dropped": 0, "errors": 0}
+        )
+
+        sink.close()
+        with assertion_mode(warn=True, sink=sink):
+            check(1).is_equal_to(2)
+        self.assertEqual(sink.dropped, 1)
+
+    def test_periodic_flush(self):
+        out = io.StringIO()
+        sink = JsonlQueueSink(out, batch_size=1000, flush_interval=0.01)
+        with assertion_mode(warn=True, sink=sink):
+            check(1).is_equal_to(2)
+        for _ in range(100):
+            if sink.written:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(sink.written, 1)
+        sink.close()
+
+    def test_drops_when_full(self):
+        out = BlockedFile()
+        sink = JsonlQueueSink(out, maxsize=5, batch_size=1)
+        with assertion_mode(warn=True, sink=sink):
+            for idx in range(20):
+                check(idx).is_equal_to(-1)
+        self.assertGreater(sink.dropped, 0)
+        out.release.set()
+        sink.close()
+        self.assertEqual(sink.written + sink.dropped, 20)
+
+    def test_blocks_with_backpressure(self):
+        out = BlockedFile()
+        sink = JsonlQueueSink(
+            out, maxsize=2, batch_size=1, block=True, timeout=0.01
+        )
+        with assertion_mode(warn=True, sink=sink):
+            for idx in range(5):
+                check(idx).is_equal_to(-1)
+        out.release.set()
+        sink.close()
+        self.assertEqual(sink.written + sink.dropped, 5)
+        self.assertGreater(sink.dropped, 0)
+
+        out = BlockedFile()
+        out.release.set()
+        sink = JsonlQueueSink(out, maxsize=2, batch_size=1, block=True)
+        with assertion_mode(warn=True, sink=sink):
+            for idx in range(50):
+                check(idx).is_equal_to(-1)
+        sink.close()
+        self.assertEqual((sink.written, sink.dropped), (50, 0))
+
+    def test_flush_errors_keep_the_writer_alive(self):
+        out = FullDisk()
+        sink = JsonlQueueSink(out, maxsize=2, batch_size=1, flush_interval=0.01)
+        with assertion_mode(warn=True, sink=sink):
+            for idx in range(20):
+                check(idx).is_equal_to(-1)
+                sink.flush(timeout=5)
+        self.assertTrue(sink._thread.is_alive())
+        sink.close(timeout=5)
+        self.assertFalse(sink._thread.is_alive())
+        self.assertEqual(sink.written, 20)
+        self.assertGreater(sink.errors, 0)
+
+    def test_flush_and_close_return_without_writer(self):
+        sink = JsonlQueueSink(io.StringIO(), maxsize=1, batch_size=1)
+        # writer thread gone and the queue full, e.g. killed at shutdown
+        sink._queue.put((sink_module._STOP, None))
+        sink._thread.join(5)
+        with assertion_mode(warn=True, sink=sink):
+            check(1).is_equal_to(2)
+        sink.flush()
+        sink.close()
+        self.assertFalse(sink._thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from simple_assertions import (
+    check,
+    assertion_mode,
+    SnapshotStore,
+    snapshot_store,
+)
+from simple_assertions import snapshot
+
+REPORT = "\n".join("row {}: {}".format(idx, idx * idx) for idx in range(200))
+
+
+class SnapshotCases(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.store = SnapshotStore(self.tmp)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def update(self, name, val):
+        with assertion_mode(update_snapshots=True):
+            check(val).matches_snapshot(name, self.tmp)
+
+    def test_missing_snapshot(self):
+        with self.assertRaises(AssertionError) as ctx:
+            check(REPORT, "report").matches_snapshot("report.txt", self.store)
+        err = str(ctx.exception)
+        self.assertIn("to match snapshot [report.txt], no snapshot in", err)
+        self.assertIn("ASSERT_SNAPSHOT_UPDATE=1", err)
+
+    def test_update_and_match_by_digest(self):
+        self.update("reports/daily.txt", REPORT)
+        self.update("order.json", {"id": 1, "legs": [1, 2]})
+        with open(os.path.join(self.tmp, "reports", "daily.txt")) as file:
+            self.assertEqual(file.read(), REPORT)
+
+        # fresh store (like another worker), loads the index
+        store = SnapshotStore(self.tmp)
+        with mock.patch.object(store, "read") as read:
+            check(REPORT).matches_snapshot("reports/daily.txt", store)
+            order = {"legs": [1, 2], "id": 1}
+            check(order).matches_snapshot("order.json", store)
+            read.assert_not_called()
+
+        # unchanged snapshots are not rewritten
+        self.assertTrue(self.store.update("order.json", b'{"x": 1}'))
+        self.assertFalse(self.store.update("order.json", b'{"x": 1}'))
+
+    def test_bounded_diff_on_mismatch(self):
+        self.update("report.txt", REPORT)
+        changed = REPORT.replace("row 100: 10000", "row 100: 10001")
+        with self.assertRaises(AssertionError) as ctx:
+            check(changed, "report").matches_snapshot("report.txt", self.tmp)
+
+        err = str(ctx.exception)
+        self.assertIn("[report]: Expected:[row 0: 0", err)
+        self.assertIn(
+            "to match snapshot [report.txt], differs from line 101", err
+        )
+        self.assertIn(
+            "@@ -99,5 +99,5 @@\n row 98: 9604\n row 99: 9801\n"
+            "-row 100: 10000\n+row 100: 10001\n",
+            err,
+        )
+        self.assertNotIn("row 150", err)
+
+        lines = "".join("{}\n".format(idx) for idx in range(500))
+        self.update("lines.txt", lines)
+        with self.assertRaises(AssertionError) as ctx:
+            check(lines.replace("\n", " \n")).matches_snapshot(
+                "lines.txt", self.tmp
+            )
+        err = str(ctx.exception)
+        self.assertIn("more diff line(s)", err)
+        self.assertLess(len(err), 2000)
+
+    def test_snapshot_changed_outside_of_index(self):
+        self.update("report.txt", REPORT)
+        path = os.path.join(self.tmp, "report.txt")
+        with open(path, "w") as file:
+            file.write("edited by hand")
+        os.utime(path, ns=(1, 1))
+        with self.assertRaises(AssertionError):
+            check(REPORT).matches_snapshot("report.txt", self.tmp)
+
+    def test_stale_and_broken_index(self):
+        self.update("report.txt", REPORT)
+        with open(self.store.index_path, "ab") as index:
+            index.write(b'{"name": "report.txt", "sha')
+        store = SnapshotStore(self.tmp)
+        check(REPORT).matches_snapshot("report.txt", store)
+
+        os.unlink(store.index_path)
+        check(REPORT).matches_snapshot("report.txt", SnapshotStore(self.tmp))
+
+    def test_concurrent_updates(self):
+        def worker(idx):
+            store = SnapshotStore(self.tmp)
+            for round in range(20):
+                store.update("shared.txt", b"same content")
+                store.update("own-{}.txt".format(idx), str(round).encode())
+
+        threads = [
+            threading.Thread(target=worker, args=(idx,)) for idx in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open(self.store.index_path) as index:
+            entries = [json.loads(line) for line in index]
+        self.assertEqual(
+            {entry["name"] for entry in entries} - {"shared.txt"},
+            {"own-{}.txt".format(idx) for idx in range(4)},
+        )
+        store = SnapshotStore(self.tmp)
+        check(b"same content").matches_snapshot("shared.txt", store)
+        check("19").matches_snapshot("own-3.txt", store)
+        self.assertEqual(
+            [name for name in os.listdir(self.tmp) if name.startswith(".")], []
+        )
+
+    def test_index_is_compacted(self):
+        for idx in range(200):
+            self.store.update("a.txt", str(idx).encode())
+            self.store.update("b.txt", str(-idx).encode())
+        with open(self.store.index_path) as index:
+            entries = [json.loads(line) for line in index]
+        self.assertLessEqual(len(entries), snapshot.MIN_COMPACT_LINES + 1)
+
+        # the last entry of every snapshot is kept
+        store = SnapshotStore(self.tmp)
+        with mock.patch.object(store, "read") as read:
+            check("199").matches_snapshot("a.txt", store)
+            check("-199").matches_snapshot("b.txt", store)
+            read.assert_not_called()
+
+    def test_keys_sets_and_objects(self):
+        self.update("keys.json", {(1, 2): "a", 1: "b", "c": {3, 1, 2}})
+        with open(os.path.join(self.tmp, "keys.json")) as file:
+            stored = json.load(file)
+        self.assertEqual(stored, {"(1, 2)": "a", "1": "b", "c": [1, 2, 3]})
+        check({"c": {2, 3, 1}, 1: "b", (1, 2): "a"}).matches_snapshot(
+            "keys.json", self.tmp
+        )
+        self.assertEqual(
+            snapshot.serialize({"x": {"b", 1, "a"}}),
+            snapshot.serialize({"x": {"a", 1, "b"}}),
+        )
+
+        # no stable form, i.e. repr with the address
+        with self.assertRaises(AssertionError) as ctx:
+            self.update("object.json", {"a": [object()]})
+        self.assertIn(
+            "to match snapshot [object.json], object has no snapshot form",
+            str(ctx.exception),
+        )
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, "object.json")))
+        with self.assertRaises(AssertionError) as ctx:
+            check({1: "a", "1": "b"}).matches_snapshot("keys.json", self.tmp)
+        self.assertIn("keys [1] and ['1'] are both stored as [1]", str(ctx.exception))
+
+    def test_default_directory_and_names(self):
+        with mock.patch.object(
+            SnapshotStore, "update", autospec=True
+        ) as update:
+            with assertion_mode(update_snapshots=True):
+                check(REPORT).matches_snapshot("report.txt")
+        self.assertEqual(
+            update.call_args[0][0].directory,
+            os.path.join(os.path.dirname(__file__), snapshot.SNAPSHOT_DIR),
+        )
+        self.assertIs(snapshot_store(self.tmp), snapshot_store(self.tmp))
+        for name in ("../outside.txt", "index.jsonl", "/etc/passwd"):
+            with self.assertRaises(ValueError):
+                self.store.path_of(name)
@@ -0,0 +1,91 @@
+import unittest
+from types import SimpleNamespace
+
+from simple_assertions import (
+    check_stream,
+    compile_check,
+    assertion_mode,
+    FailureCollector,
+)
+
+
+def feed(count, bad_every=0):
+    for idx in range(count):
+        bad = bad_every and idx % bad_every == 0
+        yield {
+            "msg_type": "fix5" if bad else "fix4.2",
+            "header": SimpleNamespace(seq_num=idx),
+        }
+
+
+class CheckStreamCases(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rules = {
+            "msg_type": compile_check().is_in(("fix4.1", "fix4.2")),
+            "header.seq_num": compile_check().is_instance_of(int),
+        }
+
+    def test_yields_only_failed_records(self):
+        stream = check_stream(feed(100, bad_every=10), self.rules)
+        failed = list(stream)
+
+        self.assertEqual([rec.index for rec in failed], list(range(0, 100, 10)))
+        failure = failed[0].failures[0]
+        self.assertEqual(failure.field, "msg_type")
+        self.assertEqual(failure.value, "fix5")
+        self.assertIn("fix5", str(failure.messages[0]))
+        self.assertEqual(stream.records, 100)
+        self.assertEqual(stream.failed_records, 10)
+        self.assertEqual(stream.fields["msg_type"].failed, 10)
+        self.assertEqual(stream.fields["header.seq_num"].failed, 0)
+
+    def test_annotate_yields_every_record(self):
+        records = list(check_stream(feed(5, bad_every=2), self.rules, annotate=True))
+        self.assertEqual(
+            [rec.passed for rec in records], [False, True, False, True, False]
+        )
+        self.assertEqual(records[1].record["header"].seq_num, 1)
+
+    def test_is_lazy_and_stops_early(self):
+        consumed = []
+
+        def records():
+            for rec in feed(10 ** 9, bad_every=3):
+                consumed.append(rec)
+                yield rec
+
+        stream = check_stream(records(), self.rules, max_failures=2)
+        self.assertEqual(len(consumed), 0)
+        self.assertEqual([rec.index for rec in stream], [0, 3])
+        self.assertTrue(stream.stopped)
+        self.assertEqual(len(consumed), 4)
+        self.assertIn("stopped early", stream.summary())
+
+    def test_missing_fields_and_getters(self):
+        rules = {
+            "header.seq_num": compile_check().is_instance_of(int),
+            (lambda rec: rec["msg_type"].upper()): compile_check().is_equal_to(
+                "FIX4.2"
+            ),
+        }
+        failed = list(check_stream([{"msg_type": "fix4.2"}], rules))
+
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].failures[0].field, "header.seq_num")
+        self.assertIn("missing", failed[0].failures[0].messages[0])
+        stats = check_stream([], rules).fields
+        self.assertIn("<lambda>", stats)
+
+    def test_failures_are_not_raised_or_collected(self):
+        with assertion_mode(warn=False), FailureCollector() as collector:
+            failed = list(check_stream(feed(10, bad_every=2), self.rules))
+        self.assertEqual(len(failed), 5)
+        self.assertEqual(collector.total, 0)
+
+    def test_rules_must_be_plans(self):
+        with self.assertRaises(TypeError):
+            check_stream([], {"msg_type": lambda val: True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import logging
+import unittest
+
+from simple_assertions import check, assertion_mode, WarningThrottle
+from simple_assertions import throttle as throttle_module
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class WarningThrottleCases(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+
+    def fail_repeatedly(self, throttle, times, val=1):
+        with assertion_mode(warn=True, throttle=throttle):
+            for _ in range(times):
+                check(val, "seq_num").is_equal_to(2)
+
+    def test_first_n_then_every_mth(self):
+        throttle = WarningThrottle(first=3, every=10, clock=self.clock)
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            self.fail_repeatedly(throttle, 100)
+
+        # 3 first + 97 repeats, of which every 10th: 13, 23, ... 93
+        self.assertEqual(len(logs.output), 3 + 9)
+        (key, counts), = throttle.report().items()
+        self.assertTrue(key[0].startswith("[test_throttle.py:"))
+        self.assertEqual(key[1], "[seq_num]: Expected:[{}] to be equal to [{}]")
+        self.assertEqual(
+            counts, {"seen": 100, "emitted": 12, "suppressed": 88}
+        )
+
+    def test_keys_are_separate(self):
+        throttle = WarningThrottle(first=1, every=0, clock=self.clock)
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            with assertion_mode(warn=True, throttle=throttle):
+                for i in range(10):
+                    check(i, "a").is_equal_to(-1)
+                    check(i, "b").is_equal_to(-1)
+                    check(i, "b").is_in([-1])
+
+        self.assertEqual(len(logs.output), 3)
+        self.assertEqual(
+            sorted(c["suppressed"] for c in throttle.report().values()),
+            [9, 9, 9],
+        )
+
+    def test_token_bucket(self):
+        throttle = WarningThrottle(
+            first=1000, rate=5, per=1.0, clock=self.clock
+        )
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            self.fail_repeatedly(throttle, 20)
+            self.clock.now += 1.0
+            self.fail_repeatedly(throttle, 20)
+        self.assertEqual(len(logs.output), 10)
+
+    def test_summaries(self):
+        throttle = WarningThrottle(
+            first=1, every=0, summary_interval=10, clock=self.clock
+        )
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            self.fail_repeatedly(throttle, 48212)
+            self.clock.now += 10
+            self.fail_repeatedly(throttle, 1)
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertRegex(
+            logs.output[1],
+            r"suppressed 48,212 repeats of \[test_throttle.py:\d+\]: "
+            r"\[seq_num\]: Expected:\[\{\}\] to be equal to \[\{\}\]",
+        )
+        self.assertEqual(throttle.summaries(force=True), [])
+        counts, = throttle.report().values()
+        self.assertEqual(counts["suppressed"], 48212)
+
+    def test_pending_summaries_on_close_and_exit(self):
+        throttle = WarningThrottle(
+            first=1, every=0, summary_interval=60, clock=self.clock
+        )
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            self.fail_repeatedly(throttle, 5)
+            throttle.close()
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("suppressed 4 repeats of [test_throttle.py:", logs.output[1])
+
+        # no later failure, the repeats are summarised at exit
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            self.fail_repeatedly(throttle, 3, val=3)
+            self.assertIn(throttle, throttle_module._PENDING)
+            throttle_module._log_pending_summaries()
+        self.assertIn("suppressed 3 repeats of [test_throttle.py:", logs.output[-1])
+        self.assertNotIn(throttle, throttle_module._PENDING)
+        self.assertEqual(throttle.summaries(force=True), [])
+
+    def test_reset(self):
+        throttle = WarningThrottle(first=1, clock=self.clock)
+        with self.assertLogs("simple_assertions", logging.WARNING):
+            self.fail_repeatedly(throttle, 5)
+        throttle.reset()
+        self.assertEqual(throttle.report(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import logging
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+
+from simple_assertions import check, assertion_mode, capture_stack, WarnVals
+
+
+def recurse(depth):
+    if depth:
+        return recurse(depth - 1)
+    return capture_stack(limit=5)
+
+
+class TracebackModeCases(unittest.TestCase):
+    def fail_in_loop(self, times):
+        with assertion_mode(level=WarnVals.TraceBack):
+            for i in range(times):
+                check(i, "val").is_equal_to(-1)
+
+    def test_stack_attached_not_printed(self):
+        output = StringIO()
+        with redirect_stderr(output):
+            with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+                self.fail_in_loop(1)
+
+        self.assertEqual(output.getvalue(), "")
+        stack = logs.records[0].assert_stack
+        filename, _, name = stack.frames[-1]
+        self.assertEqual(name, "is_equal_to")
+        self.assertTrue(all(isinstance(frame, tuple) for frame in stack))
+
+    def test_identical_stacks_are_shared(self):
+        with self.assertLogs("simple_assertions", logging.WARNING) as logs:
+            self.fail_in_loop(3)
+
+        stacks = [record.assert_stack for record in logs.records]
+        self.assertIs(stacks[0], stacks[1])
+        self.assertIs(stacks[1], stacks[2])
+
+        first, second = logs.records[0].getMessage(), logs.records[1].getMessage()
+        self.assertIn("Stack #{} (most recent call last):".format(stacks[0].stack_id), first)
+        self.assertIn("check(i, \"val\").is_equal_to(-1)", first)
+        self.assertIn("Stack #{} (same as above)".format(stacks[0].stack_id), second)
+        # message is rendered once per record, all handlers see the same text
+        self.assertEqual(second, logs.records[1].getMessage())
+
+    def test_depth_limit(self):
+        stack = recurse(50)
+        self.assertEqual(len(stack), 5)
+        self.assertEqual([name for _, _, name in stack], ["recurse"] * 5)
+        self.assertIs(stack, recurse(60))
+
+
+if __name__ == "__main__":
+    unittest.main()